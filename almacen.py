@@ -0,0 +1,259 @@
+"""Almacenamiento local de las series descargadas (``DATA_DIR``).
+
+Cada serie se guarda en un archivo propio ``<serie_id>.<ext>`` con columnas
+``indice_tiempo`` (datetime64) y el valor de la serie (float64). Hay tres
+formatos intercambiables:
+
+* ``feather``: columnar sin compresión, se lee con memory-map (por defecto).
+* ``parquet``: columnar comprimido, más chico en disco.
+* ``csv``: el formato original, usado si no está instalado ``pyarrow``.
+
+Al abrir un almacén columnar se migran automáticamente los CSV existentes
+(también los que se copien a mano después en la carpeta); el original queda
+como ``<serie_id>.csv.migrado``. Un CSV que no se puede leer (dañado o a
+medio escribir) se deja como está, se avisa por ``logging`` y no impide
+abrir el almacén. La exportación a CSV para los usuarios se
+mantiene con ``a_csv``.
+
+Ejecutar ``python almacen.py`` verifica la migración con varios procesos
+abriendo el almacén a la vez y compara tiempos de carga y memoria por formato.
+"""
+import logging
+import pathlib
+
+import pandas as pd
+
+from persistencia import bloqueo, escribir_atomico, guardar_atomico
+
+try:
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+except ImportError:  # pyarrow es opcional: sin él se sigue usando CSV
+    feather = parquet = None
+
+log = logging.getLogger(__name__)
+
+
+def _tipar(df: pd.DataFrame) -> pd.DataFrame:
+    """Fecha como datetime64 y el resto de las columnas como float64."""
+    df = df.copy()
+    df["indice_tiempo"] = pd.to_datetime(df["indice_tiempo"])
+    for col in df.columns.drop("indice_tiempo"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    return df.reset_index(drop=True)
+
+
+class Almacen:
+    """Interfaz común: un archivo por serie dentro de ``directorio``."""
+
+    extension = ""
+
+    def __init__(self, directorio: pathlib.Path):
+        self.directorio = pathlib.Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+
+    def sub(self, nombre: str) -> "Almacen":
+        """Almacén del mismo formato en la subcarpeta ``nombre`` (datos derivados)."""
+        return type(self)(self.directorio / nombre)
+
+    def ruta(self, serie_id: str) -> pathlib.Path:
+        return self.directorio / f"{serie_id}.{self.extension}"
+
+    def existe(self, serie_id: str) -> bool:
+        return self.ruta(serie_id).exists()
+
+    def leer(self, serie_id: str) -> pd.DataFrame:
+        """Devuelve la serie guardada, o un DataFrame vacío si no existe."""
+        if not self.existe(serie_id):
+            return pd.DataFrame()
+        return self._leer(self.ruta(serie_id))
+
+    def guardar(self, df: pd.DataFrame, serie_id: str) -> None:
+        self._guardar(_tipar(df), self.ruta(serie_id))
+
+    def a_csv(self, serie_id: str) -> str:
+        """Texto CSV de la serie, para ``st.download_button``."""
+        return self.leer(serie_id).to_csv(index=False)
+
+    def _leer(self, ruta: pathlib.Path) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def _guardar(self, df: pd.DataFrame, ruta: pathlib.Path) -> None:
+        raise NotImplementedError
+
+
+class AlmacenCSV(Almacen):
+    extension = "csv"
+
+    def _leer(self, ruta):
+        return pd.read_csv(ruta, parse_dates=["indice_tiempo"])
+
+    def _guardar(self, df, ruta):
+        guardar_atomico(df, ruta)
+
+
+class AlmacenFeather(Almacen):
+    extension = "feather"
+
+    def _leer(self, ruta):
+        return feather.read_table(ruta, memory_map=True).to_pandas()
+
+    def _guardar(self, df, ruta):
+        escribir_atomico(ruta, lambda tmp: df.to_feather(tmp, compression="uncompressed"))
+
+
+class AlmacenParquet(Almacen):
+    extension = "parquet"
+
+    def _leer(self, ruta):
+        return parquet.read_table(ruta, memory_map=True).to_pandas()
+
+    def _guardar(self, df, ruta):
+        escribir_atomico(ruta, lambda tmp: df.to_parquet(tmp, index=False))
+
+
+FORMATOS = {"csv": AlmacenCSV, "feather": AlmacenFeather, "parquet": AlmacenParquet}
+
+
+def _leer_csv_serie(ruta: pathlib.Path) -> pd.DataFrame:
+    """Lee un CSV de serie; ``ValueError`` si está dañado, vacío o sin fechas válidas."""
+    df = pd.read_csv(ruta, parse_dates=["indice_tiempo"])
+    if df.empty or len(df.columns) < 2:
+        raise ValueError("sin filas o sin columna de valores")
+    if not pd.api.types.is_datetime64_any_dtype(df["indice_tiempo"]):
+        raise ValueError("indice_tiempo con fechas ilegibles")
+    return df
+
+
+def migrar_csv(almacen: Almacen) -> tuple[list[str], dict[str, str]]:
+    """Pasa al formato de ``almacen`` los CSV sin copia o más nuevos que la copia guardada.
+
+    Cada CSV se renombra a ``.csv.migrado`` (se haya copiado o no) para no
+    tener dos versiones activas de la misma serie. Todo ocurre bajo el
+    bloqueo de la serie: si varios procesos abren el almacén a la vez, el
+    primero migra y los demás ya no encuentran el CSV. Los CSV que no se
+    pueden leer quedan como ``.csv`` y sin tocar la copia guardada.
+
+    Devuelve ``(migradas, fallidas)``: las series copiadas y, por serie, el
+    error de cada CSV ilegible.
+    """
+    migradas, fallidas = [], {}
+    for ruta in sorted(almacen.directorio.glob("*.csv")):
+        serie_id = ruta.stem
+        with bloqueo(almacen.ruta(serie_id)):
+            if not ruta.exists():  # otro proceso la migró mientras esperábamos
+                continue
+            destino = almacen.ruta(serie_id)
+            if not destino.exists() or ruta.stat().st_mtime > destino.stat().st_mtime:
+                try:
+                    df = _leer_csv_serie(ruta)
+                except ValueError as e:  # ParserError, EmptyDataError y UnicodeDecodeError lo son
+                    log.warning("No se migró %s: %s", ruta, e)
+                    fallidas[serie_id] = str(e)
+                    continue
+                almacen.guardar(df, serie_id)
+                migradas.append(serie_id)
+            ruta.replace(ruta.with_name(ruta.name + ".migrado"))
+    return migradas, fallidas
+
+
+def crear_almacen(directorio: pathlib.Path, formato: str | None = None) -> Almacen:
+    """Crea el almacén para ``directorio``; por defecto Feather si hay ``pyarrow``."""
+    if formato is None:
+        formato = "feather" if feather is not None else "csv"
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato!r}. Opciones: {', '.join(FORMATOS)}")
+    if formato != "csv" and feather is None:
+        raise ImportError(f"El formato {formato!r} requiere 'pyarrow' (pip install pyarrow).")
+    almacen = FORMATOS[formato](directorio)
+    if formato != "csv":
+        migrar_csv(almacen)
+    return almacen
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python almacen.py
+# ---------------------------------------------------------------------------
+def _abrir_en_proceso(directorio: str) -> None:
+    crear_almacen(pathlib.Path(directorio))
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+
+    import numpy as np
+
+    if feather is not None:
+        with tempfile.TemporaryDirectory() as tmp:
+            directorio = pathlib.Path(tmp)
+            fechas = pd.date_range("2000-01-01", periods=120, freq="MS")
+            for i in range(30):
+                pd.DataFrame({"indice_tiempo": fechas, f"s{i}": float(i)}).to_csv(directorio / f"s{i}.csv", index=False)
+            hijos = [multiprocessing.Process(target=_abrir_en_proceso, args=(tmp,)) for _ in range(4)]
+            for p in hijos:
+                p.start()
+            for p in hijos:
+                p.join()
+            assert all(p.exitcode == 0 for p in hijos), "algún proceso falló al migrar"
+            almacen = crear_almacen(directorio)
+            assert all(almacen.leer(f"s{i}")[f"s{i}"].eq(i).all() for i in range(30))
+            assert not list(directorio.glob("*.csv")) and len(list(directorio.glob("*.csv.migrado"))) == 30
+
+            # Un CSV más nuevo que la copia la reemplaza; uno más viejo no.
+            nuevo, viejo = directorio / "s0.csv", directorio / "s1.csv"
+            pd.DataFrame({"indice_tiempo": fechas, "s0": 99.0}).to_csv(nuevo, index=False)
+            pd.DataFrame({"indice_tiempo": fechas, "s1": 99.0}).to_csv(viejo, index=False)
+            antes = almacen.ruta("s1").stat().st_mtime - 60
+            os.utime(viejo, (antes, antes))
+            assert migrar_csv(almacen) == (["s0"], {})
+            assert almacen.leer("s0")["s0"].eq(99).all() and almacen.leer("s1")["s1"].eq(1).all()
+            assert not list(directorio.glob("*.csv"))
+
+            # CSV dañados: no frenan la apertura, quedan como .csv y la copia guardada sigue intacta.
+            danados = {
+                "s2": 'indice_tiempo,s2\n2000-01-01,"1\n',       # comillas sin cerrar
+                "s3": "indice_tiempo,s3\n",                       # sólo el encabezado
+                "s4": "fecha,s4\n2000-01-01,1\n",                 # sin indice_tiempo
+                "s5": "indice_tiempo,s5\n2000-01-01,1\n2000-0",   # cortado a mitad de fila
+                "nueva": "\xff\xfe\x00basura",                    # ni siquiera es UTF-8
+            }
+            for sid, texto in danados.items():
+                (directorio / f"{sid}.csv").write_bytes(texto.encode("latin-1"))
+            crear_almacen(directorio)   # abre igual, sólo avisa
+            migradas, fallidas = migrar_csv(almacen)
+            assert migradas == [] and sorted(fallidas) == sorted(danados)
+            assert sorted(p.stem for p in directorio.glob("*.csv")) == sorted(danados)
+            assert all(almacen.leer(f"s{i}")[f"s{i}"].eq(i).all() for i in (2, 3, 4, 5))
+        print("migración: 4 procesos a la vez sin errores; CSV nuevo reemplaza, viejo se conserva como .migrado; "
+              "los dañados quedan como .csv")
+
+    formatos = ["csv"] + (["feather", "parquet"] if feather is not None else [])
+    # "pico py" es la memoria que asigna Python al leer (tracemalloc no ve los
+    # buffers de Arrow); "frame" es lo que ocupa la serie ya cargada.
+    print(f"{'filas':>9} {'formato':>8} {'carga ms':>9} {'pico py MB':>10} {'frame MB':>9} {'disco KB':>9}")
+    for n in (1_000, 100_000, 1_000_000):
+        serie = pd.DataFrame({
+            "indice_tiempo": pd.date_range("1900-01-01", periods=n, freq="D"),
+            "serie": np.random.default_rng(0).normal(100, 10, n),
+        })
+        with tempfile.TemporaryDirectory() as tmp:
+            for formato in formatos:
+                almacen = FORMATOS[formato](pathlib.Path(tmp) / formato)
+                almacen.guardar(serie, "serie")
+                tiempos = []
+                for _ in range(5):
+                    t0 = time.perf_counter()
+                    almacen.leer("serie")
+                    tiempos.append(time.perf_counter() - t0)
+                tracemalloc.start()
+                cargada = almacen.leer("serie")
+                pico = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                frame = cargada.memory_usage(deep=True).sum()
+                disco = almacen.ruta("serie").stat().st_size
+                print(f"{n:>9} {formato:>8} {min(tiempos) * 1e3:>9.2f} {pico / 2**20:>10.2f} "
+                      f"{frame / 2**20:>9.2f} {disco / 1024:>9.0f}")
@@ -0,0 +1,206 @@
+"""Caché HTTP persistente en disco para la API de series.
+
+A diferencia de ``st.cache_data``, este caché sobrevive a reinicios y lo
+comparten todos los procesos que apunten al mismo directorio:
+
+* los cuerpos de las respuestas se guardan como archivos (escritura atómica);
+* el índice (ETag, Last-Modified, tamaño, último acceso) y los contadores de
+  aciertos viven en una base SQLite en modo WAL.
+
+Mientras una entrada está fresca (``ttl``) se responde sin tocar la red. Al
+vencer se revalida con ``If-None-Match`` / ``If-Modified-Since``: si el
+servidor contesta 304 se reutiliza el cuerpo guardado. Si la red falla o
+el servidor responde con un error 5xx se sirve la última copia. El tamaño total se acota descartando las entradas
+usadas hace más tiempo (LRU).
+
+Uso::
+
+    sesion = descargas.crear_sesion(cache=CacheHTTP(DATA_DIR / "http_cache"))
+"""
+import contextlib
+import hashlib
+import pathlib
+import sqlite3
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from persistencia import escribir_atomico
+
+TTL = 3_600  # segundos en los que una respuesta se usa sin revalidar
+MAX_BYTES = 50 * 2**20
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    url TEXT PRIMARY KEY,
+    archivo TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    bytes INTEGER NOT NULL,
+    guardado REAL NOT NULL,
+    usado REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entradas_usado ON entradas (usado);
+CREATE TABLE IF NOT EXISTS contadores (nombre TEXT PRIMARY KEY, valor INTEGER NOT NULL);
+"""
+
+CONTADORES = ("aciertos", "revalidados", "fallos", "obsoletos")
+
+
+class CacheHTTP:
+    def __init__(self, directorio: pathlib.Path, max_bytes: int = MAX_BYTES, ttl: float = TTL):
+        self.directorio = pathlib.Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        with self._conectar() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(_ESQUEMA)
+
+    @contextlib.contextmanager
+    def _conectar(self):
+        """Conexión al índice en una transacción; se cierra al salir (el proceso de Streamlit vive días)."""
+        con = sqlite3.connect(self.directorio / "indice.sqlite", timeout=30)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def _ruta(self, url: str) -> pathlib.Path:
+        return self.directorio / hashlib.sha256(url.encode()).hexdigest()
+
+    def _contar(self, con: sqlite3.Connection, nombre: str) -> None:
+        con.execute(
+            "INSERT INTO contadores VALUES (?, 1) ON CONFLICT(nombre) DO UPDATE SET valor = valor + 1",
+            (nombre,),
+        )
+
+    # -- consulta -----------------------------------------------------------
+
+    def buscar(self, url: str) -> dict | None:
+        """Metadatos y cuerpo guardados para ``url``, o ``None``."""
+        with self._conectar() as con:
+            con.row_factory = sqlite3.Row
+            fila = con.execute("SELECT * FROM entradas WHERE url = ?", (url,)).fetchone()
+        if fila is None:
+            return None
+        try:
+            cuerpo = (self.directorio / fila["archivo"]).read_bytes()
+        except FileNotFoundError:  # otro proceso la desalojó
+            return None
+        return dict(fila, cuerpo=cuerpo)
+
+    def fresca(self, entrada: dict) -> bool:
+        return time.time() - entrada["guardado"] < self.ttl
+
+    def registrar(self, url: str, evento: str, renovar: bool = False) -> None:
+        """Suma ``evento`` a los contadores y marca la entrada como usada."""
+        ahora = time.time()
+        with self._conectar() as con:
+            self._contar(con, evento)
+            if renovar:
+                con.execute("UPDATE entradas SET usado = ?, guardado = ? WHERE url = ?", (ahora, ahora, url))
+            else:
+                con.execute("UPDATE entradas SET usado = ? WHERE url = ?", (ahora, url))
+
+    # -- escritura ----------------------------------------------------------
+
+    def guardar(self, url: str, respuesta: requests.Response) -> None:
+        cuerpo = respuesta.content
+        ruta = self._ruta(url)
+
+        def escribir(tmp: str) -> None:
+            with open(tmp, "wb") as f:
+                f.write(cuerpo)
+
+        escribir_atomico(ruta, escribir)
+        ahora = time.time()
+        with self._conectar() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO entradas VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, ruta.name, respuesta.headers.get("ETag"), respuesta.headers.get("Last-Modified"),
+                 respuesta.headers.get("Content-Type"), len(cuerpo), ahora, ahora),
+            )
+            self._contar(con, "fallos")
+            self._desalojar(con)
+
+    def _desalojar(self, con: sqlite3.Connection) -> None:
+        """Borra las entradas menos usadas hasta quedar debajo de ``max_bytes``."""
+        total = con.execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, archivo, tam in con.execute("SELECT url, archivo, bytes FROM entradas ORDER BY usado").fetchall():
+            if total <= self.max_bytes:
+                break
+            con.execute("DELETE FROM entradas WHERE url = ?", (url,))
+            (self.directorio / archivo).unlink(missing_ok=True)
+            total -= tam
+
+    def estadisticas(self) -> dict:
+        """Contadores acumulados, entradas y bytes ocupados."""
+        with self._conectar() as con:
+            stats = dict.fromkeys(CONTADORES, 0)
+            stats.update(con.execute("SELECT nombre, valor FROM contadores").fetchall())
+            stats["entradas"], stats["bytes"] = con.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entradas"
+            ).fetchone()
+        return stats
+
+
+def _respuesta_guardada(request: requests.PreparedRequest, entrada: dict, estado: str) -> requests.Response:
+    r = requests.Response()
+    r.status_code = 200
+    r._content = entrada["cuerpo"]
+    r.url = request.url
+    r.request = request
+    r.headers = CaseInsensitiveDict({"X-Cache": estado})
+    if entrada["content_type"]:
+        r.headers["Content-Type"] = entrada["content_type"]
+    r.encoding = requests.utils.get_encoding_from_headers(r.headers) or "utf-8"
+    return r
+
+
+class AdaptadorCache(HTTPAdapter):
+    """``HTTPAdapter`` que consulta ``cache`` antes de ir a la red (sólo GET)."""
+
+    def __init__(self, cache: CacheHTTP, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        url = request.url
+        entrada = self.cache.buscar(url)
+        if entrada is not None:
+            if self.cache.fresca(entrada):
+                self.cache.registrar(url, "aciertos")
+                return _respuesta_guardada(request, entrada, "HIT")
+            if entrada["etag"]:
+                request.headers["If-None-Match"] = entrada["etag"]
+            if entrada["last_modified"]:
+                request.headers["If-Modified-Since"] = entrada["last_modified"]
+
+        try:
+            r = super().send(request, **kwargs)
+        except requests.RequestException:
+            if entrada is None:
+                raise
+            self.cache.registrar(url, "obsoletos")
+            return _respuesta_guardada(request, entrada, "STALE")
+
+        if r.status_code >= 500 and entrada is not None:  # servidor caído: como si fallara la red
+            r.close()
+            self.cache.registrar(url, "obsoletos")
+            return _respuesta_guardada(request, entrada, "STALE")
+        if r.status_code == 304 and entrada is not None:
+            self.cache.registrar(url, "revalidados", renovar=True)
+            return _respuesta_guardada(request, entrada, "REVALIDATED")
+        if r.status_code == 200:
+            self.cache.guardar(url, r)
+        return r
@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import requests, io, os, pathlib
+import pathlib
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
+import descargas
+import frecuencias
+import submuestreo
+from almacen import crear_almacen
+from cache_http import CacheHTTP
+from serie_temporal import SerieTemporal
+
 st.set_page_config(page_title="Tablero Macroeconómico – Unidad 1", layout="wide")
 
 # ---------------------------------------------------------------------------
@@ -20,7 +27,6 @@ DEFINICIONES = {
 # ---------------------------------------------------------------------------
 # 2. SERIES OFICIALES (API datos.gob.ar)
 # ---------------------------------------------------------------------------
-API_BASE = "https://apis.datos.gob.ar/series/api/series"
 SERIES = {
     "Producto interno bruto (PBI)": "10.3_VMATS_1993_M_36",   # EMAE índice (mensual)
     "Inflación": "148.3_I2NG_2016_M_15",                     # IPC variación % mensual
@@ -28,34 +34,76 @@ SERIES = {
     "Tipo de cambio": "32.1_DOLAR_OFICIAL_0_0_16"            # TC oficial fin de mes
 }
 
+# Frecuencia nativa de cada serie: "M" mensual, "T" trimestral, "A" anual.
+# El tablero trabaja en mensual; las demás se alinean una vez al descargarlas.
+FRECUENCIAS = {
+    "10.3_VMATS_1993_M_36": "M",
+    "148.3_I2NG_2016_M_15": "M",
+    "101.1_IUT_T_0_0_30": "T",
+    "32.1_DOLAR_OFICIAL_0_0_16": "M",
+}
+FRECUENCIA_TABLERO = "M"
+
 DATA_DIR = pathlib.Path("data")
-DATA_DIR.mkdir(exist_ok=True)
+
+@st.cache_resource
+def obtener_almacen():
+    """Feather con memory-map si hay pyarrow; si no, CSV. Migra los CSV una sola vez."""
+    return crear_almacen(DATA_DIR)
+
+@st.cache_resource
+def obtener_cache_http():
+    """Caché HTTP en disco, compartido entre sesiones, procesos y reinicios."""
+    return CacheHTTP(DATA_DIR / "http_cache")
+
+@st.cache_resource
+def obtener_sesion():
+    return descargas.crear_sesion(cache=obtener_cache_http())
+
+ALMACEN = obtener_almacen()
 
 # ---------------------------------------------------------------------------
 # 3. DESCARGA Y CARGA DE DATOS REALES
 # ---------------------------------------------------------------------------
 
-def url_csv(serie_id: str) -> str:
-    return f"{API_BASE}?ids={serie_id}&format=csv&collapse=month"
-
 @st.cache_data(show_spinner=False, ttl=86_400)
 def descargar_serie(serie_id: str) -> pd.DataFrame:
     """Descarga la serie desde datos.gob.ar y la devuelve como DataFrame."""
-    r = requests.get(url_csv(serie_id), timeout=30)
-    r.raise_for_status()
-    return pd.read_csv(io.StringIO(r.text), parse_dates=["indice_tiempo"])
+    return descargas.descargar_serie(serie_id, obtener_sesion())
+
+@st.cache_data(show_spinner=False, ttl=86_400)
+def descargar_lote(serie_ids: tuple[str, ...]) -> dict[str, pd.DataFrame]:
+    """Descarga varias series en una sola consulta (compartido entre sesiones)."""
+    return descargas.descargar_lote(serie_ids, obtener_sesion())
 
 @st.cache_data(show_spinner=False, ttl=86_400)
-def cargar_csv_local(serie_id: str) -> pd.DataFrame:
-    ruta = DATA_DIR / f"{serie_id}.csv"
-    if not ruta.exists():
-        return pd.DataFrame()
-    return pd.read_csv(ruta, parse_dates=["indice_tiempo"])
+def cargar_local(serie_id: str) -> pd.DataFrame:
+    """Serie guardada, ya alineada a la frecuencia del tablero."""
+    return frecuencias.obtener_alineada(ALMACEN, serie_id, FRECUENCIAS.get(serie_id, "M"), FRECUENCIA_TABLERO)
+
+@st.cache_resource(show_spinner=False, ttl=86_400)
+def serie_local(serie_id: str) -> SerieTemporal:
+    """``cargar_local`` preparada y ordenada, compartida entre reruns y sesiones (no modificar)."""
+    return SerieTemporal(preparar_serie(cargar_local(serie_id), serie_id), "fecha")
+
+@st.cache_data(show_spinner=False, ttl=86_400)
+def exportar_csv(serie_id: str) -> str:
+    return ALMACEN.a_csv(serie_id)
+
+@st.cache_data(show_spinner=False, ttl=86_400, max_entries=512)
+def serie_para_grafico(serie_id: str, inicio: datetime, fin: datetime, ancho: int) -> tuple[pd.DataFrame, int]:
+    """Rango de la serie reducido por LTTB a lo que entra en ``ancho`` píxeles, y las filas originales."""
+    subset = serie_local(serie_id).rango(inicio, fin)
+    return submuestreo.reducir(subset, "fecha", "valor", submuestreo.puntos_para_ancho(ancho)), len(subset)
 
-@st.cache_data(show_spinner=False, ttl=0)
-def guardar_csv(df: pd.DataFrame, serie_id: str):
-    ruta = DATA_DIR / f"{serie_id}.csv"
-    df.to_csv(ruta, index=False)
+def preparar_serie(df: pd.DataFrame, serie_id: str) -> pd.DataFrame:
+    df = df.rename(columns={"indice_tiempo": "fecha", serie_id: "valor"})
+    df["valor"] = pd.to_numeric(df["valor"], errors="coerce")
+    return df.dropna(subset=["valor"])
+
+def guardar_local(df: pd.DataFrame, serie_id: str):
+    # Sin st.cache_data: es un efecto secundario y no hace falta hashear el DataFrame.
+    ALMACEN.guardar(df, serie_id)
 
 # ---------------------------------------------------------------------------
 # 4. SIDEBAR
@@ -65,33 +113,63 @@ side.title("Indicadores")
 indicador = side.radio("Elegí un indicador", list(DEFINICIONES.keys()))
 side.markdown("### Definición")
 side.info(DEFINICIONES[indicador])
+ancho_grafico = side.select_slider(
+    "Ancho del gráfico (px)", options=[600, 900, 1200, 1600, 2400], value=1200,
+    help="La serie se reduce a lo que se puede ver en este ancho antes de mandarla al navegador.",
+)
 
 side.markdown("---")
+incremental = side.checkbox("Sólo novedades (actualización incremental)", value=True)
 if side.button("⬇️ Descargar / actualizar todas las series"):
     with st.spinner("Descargando series oficiales …"):
-        success = True
-        for sid in SERIES.values():
-            try:
-                df_tmp = descargar_serie(sid)
-                guardar_csv(df_tmp, sid)
-            except Exception as e:
-                success = False
-                st.error(f"No se pudo descargar {sid}: {e}")
-        if success:
+        resultados = descargas.descargar_todas(
+            SERIES.values(), ALMACEN, incremental=incremental, cache=obtener_cache_http()
+        )
+        frecuencias.preparar(ALMACEN, FRECUENCIAS, FRECUENCIA_TABLERO)
+        cargar_local.clear()
+        serie_local.clear()
+        exportar_csv.clear()
+        serie_para_grafico.clear()
+        for res in resultados:
+            if not res.ok:
+                st.error(f"No se pudo descargar {res.serie_id}: {res.error}")
+        if all(res.ok for res in resultados):
             side.success("✅ Series guardadas en ./data.")
+        with side.expander("Detalle de la actualización"):
+            st.dataframe(pd.DataFrame(
+                [{"Serie": r.serie_id, "Segundos": round(r.segundos, 2), "Filas": r.filas,
+                  "Nuevas": r.nuevas, "Revisadas": r.revisadas, "Error": r.error or ""}
+                 for r in resultados]
+            ))
 
 side.caption("La app usa primero los archivos locales en ./data/. Si faltan, intentará descargarlos del API oficial de datos.gob.ar (INDEC/BCRA). Se cachea 24 h.")
+stats_http = obtener_cache_http().estadisticas()
+side.caption(
+    f"Caché HTTP en disco: {stats_http['aciertos']} aciertos · {stats_http['revalidados']} revalidadas · "
+    f"{stats_http['fallos']} descargas · {stats_http['bytes'] / 2**20:.1f} MB"
+)
 
 # ---------------------------------------------------------------------------
 # 5. OBTENER DATOS (PRIORIDAD: LOCAL → ONLINE)
 # ---------------------------------------------------------------------------
 serie_id = SERIES[indicador]
-df = cargar_csv_local(serie_id)
+df = cargar_local(serie_id)
 
 if df.empty:
     try:
-        df = descargar_serie(serie_id)
-        guardar_csv(df, serie_id)
+        # En un arranque en frío se traen de una vez todas las series que faltan.
+        faltantes = tuple(sid for sid in SERIES.values() if not ALMACEN.existe(sid))
+        lote = descargar_lote(faltantes)
+        for sid, df_tmp in lote.items():
+            guardar_local(df_tmp, sid)
+        if serie_id not in lote:
+            guardar_local(descargar_serie(serie_id), serie_id)
+        frecuencias.preparar(ALMACEN, FRECUENCIAS, FRECUENCIA_TABLERO)
+        cargar_local.clear()
+        serie_local.clear()
+        exportar_csv.clear()
+        serie_para_grafico.clear()
+        df = cargar_local(serie_id)
         st.toast("Serie descargada directamente del API oficial.")
     except Exception as err:
         st.error("No se pudo obtener la serie desde el API ni desde archivos locales. Verificá tu conexión o descargá las series con el botón del sidebar.")
@@ -101,16 +179,8 @@ if df.empty:
 # 6. PREPARAR DATOS
 # ---------------------------------------------------------------------------
 
-df.rename(columns={"indice_tiempo": "fecha", serie_id: "valor"}, inplace=True)
-df["valor"] = pd.to_numeric(df["valor"], errors="coerce")
-df.dropna(subset=["valor"], inplace=True)
-
-if indicador == "Desempleo":
-    # Convertir trimestral a mensual para que el slider sea uniforme
-    df.set_index("fecha", inplace=True)
-    df = df.asfreq("M")
-    df["valor"] = df["valor"].interpolate(method="linear")
-    df.reset_index(inplace=True)
+serie = serie_local(serie_id)
+df = serie.datos
 
 # ---------------------------------------------------------------------------
 # 7. SLIDER DE FECHAS
@@ -128,7 +198,7 @@ inicio, fin = st.slider(
     format="YYYY-MM",
 )
 
-subset = df[(df["fecha"] >= pd.to_datetime(inicio)) & (df["fecha"] <= pd.to_datetime(fin))]
+subset, filas_rango = serie_para_grafico(serie_id, inicio, fin, ancho_grafico)
 if subset.empty:
     st.warning("No hay datos para el rango seleccionado.")
     st.stop()
@@ -146,8 +216,12 @@ fig = px.line(
 fig.update_layout(hovermode="x unified", xaxis_title="Fecha", yaxis_title="Valor", height=500)
 
 st.plotly_chart(fig, use_container_width=True)
+if len(subset) < filas_rango:
+    st.caption(f"Se muestran {len(subset):,} de {filas_rango:,} puntos (reducción LTTB para {ancho_grafico} px); "
+               "la tabla tiene todos.")
 
 with st.expander("Ver datos tabulados"):
-    st.dataframe(subset.rename(columns={"fecha": "Fecha", "valor": "Valor"}))
+    st.dataframe(serie.rango(inicio, fin).rename(columns={"fecha": "Fecha", "valor": "Valor"}))
+    st.download_button("Descargar serie completa (.csv)", exportar_csv(serie_id), f"{serie_id}.csv", "text/csv")
 
 st.caption("Fuente: APIs oficiales de datos.gob.ar (INDEC • BCRA). Las series se descargan y almacenan localmente para trabajar sin conexión.")
@@ -0,0 +1,109 @@
+"""Datos compartidos por los tableros de indicadores.
+
+Streamlit vuelve a ejecutar el script completo en cada interacción, así que
+armar los DataFrames a nivel de módulo repetía todo el trabajo en cada clic.
+Estos cargadores se memoizan con ``st.cache_resource``: se construyen una vez
+por proceso y todas las sesiones reciben el mismo objeto. Por eso se devuelven
+de sólo lectura; quien necesite modificarlos debe trabajar sobre ``.copy()``.
+Los ``serie_*`` memoizan además el ``SerieTemporal`` de cada tabla, para no
+rearmar su índice de fechas en cada rerun.
+"""
+import pandas as pd
+import streamlit as st
+
+from codigos_fecha import parsear_mmYYYY
+from serie_temporal import SerieTemporal
+
+# ------------------------------------------------------------
+# Indicadores mensuales 2022‑2024 (EMAE, IPC, ITCRM, TCN)
+# ------------------------------------------------------------
+_raw = [
+    ("112022", 146.50, 1079.28,  90.10, 162.12),
+    ("122022", 144.50, 1134.59,  93.21, 172.90),
+    ("12023",  143.00, 1202.98,  95.14, 182.24),
+    ("22023",  137.60, 1282.71,  94.77, 191.89),
+    ("32023",  155.40, 1381.16,  93.59, 203.11),
+    ("42023",  149.10, 1497.21,  93.81, 216.56),
+    ("52023",  152.70, 1613.59,  93.05, 231.19),
+    ("62023",  151.60, 1709.61,  93.96, 248.76),
+    ("72023",  149.00, 1818.08,  95.85, 266.46),
+    ("82023",  150.70, 2044.28, 104.82, 322.13),
+    ("92023",  147.50, 2304.92, 100.67, 350.00),
+    ("102023", 146.70, 2496.27,  89.63, 350.02),
+    ("112023", 145.50, 2816.06,  83.19, 353.84),
+    # El código 121899 se descarta: año 1899 fuera de rango
+    ("12024",  137.30, 4261.53, 132.78, 818.35),
+    ("22024",  133.80, 4825.79, 115.76, 834.91),
+    ("32024",  142.40, 5357.09, 105.87, 850.34),
+    ("42024",  145.50, 5830.23,  97.02, 868.96),
+    ("52024",  154.80, 6073.72,  93.43, 886.86),
+    ("62024",  145.40, 6351.71,  89.90, 903.78),
+    ("72024",  148.20, 6607.75,  87.88, 923.77),
+    ("82024",  146.00, 6883.44,  87.16, 942.92),
+    ("92024",  143.70, 7122.24,  86.05, 961.83),
+    ("102024", 146.00, 7313.95,  84.05, 981.57),
+    ("112024", 146.10, 7491.43,  81.75, 1001.84),
+    ("122024", 146.00, 7694.01,  79.79, 1020.71),
+]
+
+# ------------------------------------------------------------
+# Indicadores simulados basados en datos reales (ene‑2022 → dic‑2024)
+# ------------------------------------------------------------
+pbi_real = [130, 132, 131, 134, 136, 137, 138, 137, 136, 137, 138, 137,
+            137, 138, 140, 141, 141, 140, 139, 138, 139, 140, 140, 139, 140,
+            141, 142, 143, 144, 145, 145, 146, 147, 148, 149, 150]
+inflacion_mensual = [3.9, 4.7, 6.7, 6.0, 5.1, 5.3, 7.4, 7.0, 6.2, 6.3, 5.1, 5.1,
+                     6.0, 6.6, 7.7, 7.8, 6.3, 6.0, 12.4, 8.3, 12.8, 20.6, 25.5, 20.6, 15.0,
+                     10.0, 9.5, 8.0, 7.5, 7.0, 6.8, 6.5, 6.2, 6.0, 5.8, 5.5]
+desempleo = [7.0, 7.0, 6.9, 6.9, 6.9, 6.8, 6.8, 6.7, 6.7, 6.8, 6.8, 7.1,
+             7.0, 7.0, 6.8, 6.8, 6.7, 6.9, 7.5, 7.8, 8.0, 8.1, 8.5, 8.3, 8.0,
+             7.8, 7.5, 7.3, 7.0, 6.8, 6.5, 6.3, 6.2, 6.1, 6.0, 5.9]
+tipo_cambio = [104, 107, 110, 112, 117, 120, 130, 135, 140, 150, 160, 170,
+               180, 190, 210, 220, 230, 250, 310, 350, 400, 500, 600, 700, 750,
+               760, 770, 780, 790, 800, 810, 820, 830, 840, 850, 860]
+
+
+def _solo_lectura(df: pd.DataFrame) -> pd.DataFrame:
+    """Copia de ``df`` cuyas columnas no se pueden modificar en el lugar."""
+    columnas = {}
+    for col in df.columns:
+        valores = df[col].to_numpy().copy()
+        valores.flags.writeable = False
+        columnas[col] = valores
+    return pd.DataFrame(columnas, index=df.index, copy=False)
+
+
+@st.cache_resource(show_spinner=False)
+def cargar_indicadores_2022_2024() -> pd.DataFrame:
+    """Fecha, PBI (EMAE), IPC, ITCRM y TCN mensuales, ordenados por fecha."""
+    codigos, pbi, ipc, itcrm, tcn = zip(*_raw)
+    fechas, valido = parsear_mmYYYY(codigos)
+    df = pd.DataFrame({"Fecha": fechas, "PBI": pbi, "IPC": ipc, "ITCRM": itcrm, "TCN": tcn})
+    return _solo_lectura(df[valido].sort_values("Fecha").reset_index(drop=True))
+
+
+@st.cache_resource(show_spinner=False)
+def cargar_indicadores_simulados(hasta: str | None = None) -> pd.DataFrame:
+    """Indicadores simulados desde ene‑2022, opcionalmente recortados hasta ``hasta``."""
+    df = pd.DataFrame({
+        'Fecha': pd.date_range(start='2022-01-01', periods=len(pbi_real), freq='MS'),
+        'PBI_Indexado': pbi_real,
+        'Inflacion_Mensual_%': inflacion_mensual,
+        'Desempleo_%': desempleo,
+        'Tipo_Cambio_AR_USD': tipo_cambio
+    })
+    if hasta is not None:
+        df = df[df['Fecha'] <= pd.Timestamp(hasta)]
+    return _solo_lectura(df)
+
+
+@st.cache_resource(show_spinner=False)
+def serie_indicadores_2022_2024() -> SerieTemporal:
+    """``cargar_indicadores_2022_2024`` lista para consultar por rango de fechas."""
+    return SerieTemporal(cargar_indicadores_2022_2024())
+
+
+@st.cache_resource(show_spinner=False)
+def serie_indicadores_simulados(hasta: str | None = None) -> SerieTemporal:
+    """``cargar_indicadores_simulados`` lista para consultar por rango de fechas."""
+    return SerieTemporal(cargar_indicadores_simulados(hasta))
@@ -0,0 +1,341 @@
+"""Descarga de series oficiales desde la API de datos.gob.ar.
+
+Funciones sin dependencia de Streamlit, para poder usarlas desde los tableros,
+desde scripts o contra un servidor HTTP local de prueba (``api_base``).
+
+Ejecutar ``python descargas.py`` levanta ese servidor en un hilo y prueba
+``descargar_lote``: lotes de ``MAX_IDS``, respuesta sin una de las series,
+respuesta malformada y error 5xx (estos tres pasan a la descarga de a una);
+``actualizar_serie`` sobre copias locales con la columna nombrada por
+título; y ``descargar_todas`` con una serie que da 404 entre las buenas.
+"""
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from almacen import Almacen
+from cache_http import AdaptadorCache, CacheHTTP
+from persistencia import bloqueo
+
+API_BASE = "https://apis.datos.gob.ar/series/api/series"
+TIMEOUT = 30
+MAX_WORKERS = 8
+MAX_IDS = 40  # límite de ids por consulta de la API
+MESES_REVISION = 3  # meses que se vuelven a pedir por si el organismo revisó datos
+
+
+def url_csv(serie_id: str, api_base: str = API_BASE, desde: str | None = None) -> str:
+    """URL de descarga en CSV; ``serie_id`` puede ser un id o varios separados por coma.
+
+    ``header=ids`` hace que cada columna se llame como el id de su serie.
+    ``desde`` (AAAA-MM-DD) limita la respuesta a observaciones posteriores.
+    """
+    url = f"{api_base}?ids={serie_id}&format=csv&collapse=month&header=ids"
+    if desde:
+        url += f"&start_date={desde}"
+    return url
+
+
+def crear_sesion(max_workers: int = MAX_WORKERS, cache: CacheHTTP | None = None) -> requests.Session:
+    """Sesión HTTP con un pool de conexiones del tamaño del pool de hilos.
+
+    Con ``cache`` las respuestas pasan por el caché persistente en disco.
+    """
+    sesion = requests.Session()
+    opciones = dict(pool_connections=max_workers, pool_maxsize=max_workers)
+    adaptador = AdaptadorCache(cache, **opciones) if cache is not None else HTTPAdapter(**opciones)
+    sesion.mount("http://", adaptador)
+    sesion.mount("https://", adaptador)
+    return sesion
+
+
+def descargar_serie(serie_id: str, sesion: requests.Session | None = None,
+                    api_base: str = API_BASE, timeout: float = TIMEOUT,
+                    desde: str | None = None) -> pd.DataFrame:
+    """Descarga la serie desde datos.gob.ar y la devuelve como DataFrame."""
+    r = (sesion or requests).get(url_csv(serie_id, api_base, desde), timeout=timeout)
+    r.raise_for_status()
+    return pd.read_csv(io.StringIO(r.text), parse_dates=["indice_tiempo"])
+
+
+# ---------------------------------------------------------------------------
+# DESCARGA EN LOTE (VARIOS IDS POR CONSULTA)
+# ---------------------------------------------------------------------------
+
+def separar_series(ancho: pd.DataFrame, serie_ids) -> dict[str, pd.DataFrame]:
+    """Parte el CSV ancho de la API en un DataFrame por serie.
+
+    Cada serie conserva sólo las fechas en las que tiene dato, igual que si se
+    hubiera descargado sola.
+    """
+    return {
+        sid: ancho[["indice_tiempo", sid]].dropna(subset=[sid]).reset_index(drop=True)
+        for sid in serie_ids
+        if sid in ancho.columns
+    }
+
+
+def descargar_lote(serie_ids, sesion: requests.Session | None = None,
+                   api_base: str = API_BASE, timeout: float = TIMEOUT) -> dict[str, pd.DataFrame]:
+    """Descarga varias series con una consulta por cada ``MAX_IDS`` ids.
+
+    Si una consulta en lote falla, o la respuesta no trae alguna serie, esas
+    series se piden de a una. Las que tampoco se puedan descargar así quedan
+    fuera del diccionario devuelto.
+    """
+    serie_ids = list(dict.fromkeys(serie_ids))
+    series = {}
+    for i in range(0, len(serie_ids), MAX_IDS):
+        grupo = serie_ids[i:i + MAX_IDS]
+        try:
+            ancho = descargar_serie(",".join(grupo), sesion, api_base, timeout)
+        except (requests.RequestException, ValueError):
+            continue
+        series.update(separar_series(ancho, grupo))
+
+    for sid in serie_ids:
+        if sid in series:
+            continue
+        try:
+            series[sid] = descargar_serie(sid, sesion, api_base, timeout)
+        except (requests.RequestException, ValueError):
+            pass
+    return series
+
+
+# ---------------------------------------------------------------------------
+# ACTUALIZACIÓN INCREMENTAL
+# ---------------------------------------------------------------------------
+
+def fusionar(local: pd.DataFrame, nuevo: pd.DataFrame, desde: pd.Timestamp) -> tuple[pd.DataFrame, int, int]:
+    """Reemplaza el tramo de ``local`` desde ``desde`` por ``nuevo``.
+
+    Devuelve la serie fusionada, la cantidad de fechas nuevas y la cantidad de
+    fechas ya existentes cuyo valor fue revisado.
+    """
+    previo = local[local["indice_tiempo"] < desde]
+    ventana = local[local["indice_tiempo"] >= desde].set_index("indice_tiempo")
+    recibido = nuevo.set_index("indice_tiempo")
+
+    comunes = ventana.index.intersection(recibido.index)
+    a, b = ventana.loc[comunes], recibido.loc[comunes, ventana.columns]
+    distintos = (a != b) & ~(a.isna() & b.isna())
+    revisadas = int(distintos.any(axis=1).sum())
+    nuevas = int((recibido.index > local["indice_tiempo"].max()).sum())
+
+    fusion = pd.concat([previo, nuevo], ignore_index=True)
+    return fusion.sort_values("indice_tiempo").reset_index(drop=True), nuevas, revisadas
+
+
+def _alinear_columnas(local: pd.DataFrame, serie_id: str) -> pd.DataFrame | None:
+    """Copia local con la columna de valores llamada ``serie_id``, o None si no se puede saber cuál es.
+
+    Los archivos guardados antes de pedir ``header=ids`` nombran la columna
+    con el título de la serie; si hay una sola columna de valores, es ésa.
+    """
+    valores = [c for c in local.columns if c != "indice_tiempo"]
+    if valores == [serie_id]:
+        return local
+    if len(valores) == 1:
+        return local.rename(columns={valores[0]: serie_id})
+    return None
+
+
+def actualizar_serie(serie_id: str, almacen: Almacen, sesion: requests.Session | None = None,
+                     api_base: str = API_BASE, timeout: float = TIMEOUT,
+                     meses_revision: int = MESES_REVISION) -> tuple[pd.DataFrame, int, int]:
+    """Trae sólo las observaciones recientes de la serie y las fusiona con la copia local.
+
+    Se piden los datos desde la última ``indice_tiempo`` guardada menos
+    ``meses_revision`` meses, para captar también revisiones recientes. Si no
+    hay copia local, o sus columnas no se pueden alinear con las de la API
+    (ver ``_alinear_columnas``), se descarga la serie completa y se reescribe.
+    """
+    with bloqueo(almacen.ruta(serie_id)):  # otra sesión puede estar actualizando la misma serie
+        local = almacen.leer(serie_id)
+        alineada = None if local.empty else _alinear_columnas(local, serie_id)
+        if alineada is None:
+            df = descargar_serie(serie_id, sesion, api_base, timeout)
+            almacen.guardar(df, serie_id)
+            return df, len(df), 0
+        renombrada = alineada is not local
+
+        desde = alineada["indice_tiempo"].max() - pd.DateOffset(months=meses_revision)
+        nuevo = descargar_serie(serie_id, sesion, api_base, timeout, desde=desde.strftime("%Y-%m-%d"))
+        if nuevo.empty:
+            if renombrada:
+                almacen.guardar(alineada, serie_id)
+            return alineada, 0, 0
+        df, nuevas, revisadas = fusionar(alineada, nuevo, desde)
+        if nuevas or revisadas or renombrada:
+            almacen.guardar(df, serie_id)
+        return df, nuevas, revisadas
+
+
+# ---------------------------------------------------------------------------
+# DESCARGA MASIVA CONCURRENTE
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ResultadoDescarga:
+    serie_id: str
+    segundos: float
+    filas: int = 0
+    nuevas: int = 0
+    revisadas: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _descargar_y_guardar(serie_id: str, almacen: Almacen, sesion: requests.Session,
+                         api_base: str, timeout: float, incremental: bool) -> ResultadoDescarga:
+    t0 = time.perf_counter()
+    try:
+        if incremental:
+            df, nuevas, revisadas = actualizar_serie(serie_id, almacen, sesion, api_base, timeout)
+        else:
+            df = descargar_serie(serie_id, sesion, api_base, timeout)
+            almacen.guardar(df, serie_id)
+            nuevas, revisadas = len(df), 0
+    except Exception as e:
+        return ResultadoDescarga(serie_id, time.perf_counter() - t0, error=str(e))
+    return ResultadoDescarga(serie_id, time.perf_counter() - t0, filas=len(df),
+                             nuevas=nuevas, revisadas=revisadas)
+
+
+def descargar_todas(serie_ids, almacen: Almacen, max_workers: int = MAX_WORKERS,
+                    api_base: str = API_BASE, timeout: float = TIMEOUT,
+                    incremental: bool = False, cache: CacheHTTP | None = None) -> list[ResultadoDescarga]:
+    """Descarga en paralelo todas las series y las guarda en ``almacen``.
+
+    Usa un pool de hilos acotado que comparte una única sesión HTTP, así el
+    tiempo total es aproximadamente el de la serie más lenta. Un fallo en una
+    serie no interrumpe al resto: queda registrado en su ``ResultadoDescarga``.
+    Con ``incremental=True`` sólo se piden las observaciones recientes de cada
+    serie (ver ``actualizar_serie``).
+    """
+    serie_ids = list(serie_ids)
+    workers = max(1, min(max_workers, len(serie_ids)))
+    with crear_sesion(workers, cache) as sesion, ThreadPoolExecutor(max_workers=workers) as pool:
+        futuros = [
+            pool.submit(_descargar_y_guardar, sid, almacen, sesion, api_base, timeout, incremental)
+            for sid in serie_ids
+        ]
+        return [f.result() for f in futuros]
+
+
+# ---------------------------------------------------------------------------
+# PRUEBA CONTRA UN SERVIDOR LOCAL: python descargas.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    from almacen import crear_almacen
+
+    FECHAS = pd.date_range("2020-01-01", periods=24, freq="MS")
+    PARCIAL, MALFORMADA, CAIDA = "serie_parcial", "serie_malformada", "serie_caida"
+    INEXISTENTE = "serie_inexistente"
+    pedidos: list[list[str]] = []
+
+    def valores(sid: str) -> list[float]:
+        base = sum(map(ord, sid))
+        return [base + i / 10 for i in range(len(FECHAS))]
+
+    class ApiDePrueba(BaseHTTPRequestHandler):
+        """Imita la API: CSV ancho con una columna por id, salvo los casos de falla."""
+
+        def do_GET(self):
+            consulta = parse_qs(urlparse(self.path).query)
+            ids = consulta["ids"][0].split(",")
+            pedidos.append(ids)
+            if CAIDA in ids:
+                return self._responder(503, "Service Unavailable")
+            if INEXISTENTE in ids:
+                return self._responder(404, "Not Found")
+            if MALFORMADA in ids and len(ids) > 1:
+                return self._responder(200, "<html>error interno</html>")
+            columnas = [sid for sid in ids if not (sid == PARCIAL and len(ids) > 1)]  # el lote la omite
+            ancho = pd.DataFrame({"indice_tiempo": FECHAS, **{sid: valores(sid) for sid in columnas}})
+            if "start_date" in consulta:
+                ancho = ancho[ancho["indice_tiempo"] >= consulta["start_date"][0]]
+            ancho["indice_tiempo"] = ancho["indice_tiempo"].dt.strftime("%Y-%m-%d")
+            self._responder(200, ancho.to_csv(index=False))
+
+        def _responder(self, estado: int, cuerpo: str):
+            datos = cuerpo.encode()
+            self.send_response(estado)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(datos)))
+            self.end_headers()
+            self.wfile.write(datos)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), ApiDePrueba)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    api_local = f"http://127.0.0.1:{servidor.server_port}/series"
+
+    def probar(nombre: str, ids: list[str], esperadas: set[str], consultas: int):
+        pedidos.clear()
+        with crear_sesion() as sesion:
+            series = descargar_lote(ids, sesion, api_base=api_local, timeout=5)
+        assert set(series) == esperadas, f"{nombre}: {sorted(set(series) ^ esperadas)}"
+        for sid, df in series.items():
+            assert df[sid].tolist() == valores(sid) and len(df) == len(FECHAS), f"{nombre}: {sid} mal leída"
+        assert len(pedidos) == consultas, f"{nombre}: {len(pedidos)} consultas, se esperaban {consultas}"
+        print(f"{nombre:34s} {len(series):>3} de {len(ids):>3} series en {len(pedidos):>2} consultas")
+
+    buenas = [f"serie_{i:03d}" for i in range(85)]
+    probar("lote correcto (85 ids → 3 lotes)", buenas, set(buenas), 3)
+    probar("lote sin una columna", buenas[:3] + [PARCIAL], set(buenas[:3]) | {PARCIAL}, 2)
+    probar("lote malformado", buenas[:3] + [MALFORMADA], set(buenas[:3]) | {MALFORMADA}, 1 + 4)
+    probar("lote con 5xx", buenas[:3] + [CAIDA], set(buenas[:3]), 1 + 4)
+
+    # Copias locales de antes de header=ids: la columna lleva el título de la serie.
+    with tempfile.TemporaryDirectory() as tmp, crear_sesion() as sesion:
+        almacen = crear_almacen(pathlib.Path(tmp))
+        sid = "serie_vieja"
+        vieja = pd.DataFrame({"indice_tiempo": FECHAS[:18], "tipo_cambio_oficial": valores(sid)[:18]})
+        almacen.guardar(vieja, sid)
+        pedidos.clear()
+        df, nuevas, revisadas = actualizar_serie(sid, almacen, sesion, api_base=api_local, timeout=5)
+        assert list(almacen.leer(sid).columns) == ["indice_tiempo", sid]
+        assert almacen.leer(sid)[sid].tolist() == valores(sid) and (nuevas, revisadas) == (6, 0)
+
+        ambigua = vieja.assign(otra_columna=1.0)  # no se sabe cuál es la serie: descarga completa
+        almacen.guardar(ambigua, sid)
+        df, nuevas, _ = actualizar_serie(sid, almacen, sesion, api_base=api_local, timeout=5)
+        assert list(almacen.leer(sid).columns) == ["indice_tiempo", sid] and nuevas == len(FECHAS)
+        print("copia local con columna por título:  renombrada y actualizada; ambigua → descarga completa")
+
+    # Descarga masiva: la serie que da 404 queda con su error y no frena a las demás.
+    with tempfile.TemporaryDirectory() as tmp:
+        almacen = crear_almacen(pathlib.Path(tmp))
+        ids = buenas[:6] + [INEXISTENTE]
+        for incremental in (False, True):
+            resultados = descargar_todas(ids, almacen, max_workers=4, api_base=api_local, timeout=5,
+                                         incremental=incremental)
+            assert [r.serie_id for r in resultados] == ids
+            fallida = resultados[-1]
+            assert not fallida.ok and "404" in fallida.error and not almacen.existe(INEXISTENTE)
+            for r in resultados[:-1]:
+                assert r.ok and r.filas == len(FECHAS), f"{r.serie_id}: {r.error}"
+                assert almacen.leer(r.serie_id)[r.serie_id].tolist() == valores(r.serie_id)
+            # la segunda pasada (incremental) sólo revisa los últimos meses: nada nuevo
+            assert all(r.nuevas == (0 if incremental else len(FECHAS)) for r in resultados[:-1])
+        print(f"descargar_todas con un 404:          {len(ids) - 1} de {len(ids)} guardadas, "
+              "completa e incremental")
+    servidor.shutdown()
@@ -0,0 +1,144 @@
+"""Economía abierta con traspaso del tipo de cambio a precios.
+
+Precios y tipo de cambio real (tasas mensuales en %, logarítmicas):
+
+    π_t      = a + β d_t + ρ π_{t-1}             inflación: traspaso β de la devaluación d_t e inercia ρ
+    Δq_t     = d_t - π_t + π*                    variación del tipo de cambio real (ITCRM)
+
+Mercado de bienes con comercio exterior (en puntos del índice EMAE):
+
+    Y = C0 + c (1 - t) Y + I + G + X - M,   X - M = NX0 + n q - m Y
+    Y_t = k (A0 + ΔG + n q_t),   k = 1 / (1 - c (1 - t) + m)
+
+donde q_t es el desvío acumulado (%) del ITCRM respecto del último dato y
+``m`` la propensión marginal a importar. ``calibrar`` estima a, β, ρ y π*
+por mínimos cuadrados sobre las series guardadas (TCN, IPC, ITCRM) y fija
+A0 para que el modelo reproduzca el último EMAE.
+
+``simular`` recibe una matriz de devaluaciones ``(escenarios, meses)`` y
+resuelve todos los escenarios juntos: el único bucle es sobre los meses, por
+la inercia de la inflación.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Calibracion:
+    a: float            # inflación autónoma mensual (%)
+    beta: float         # traspaso de corto plazo
+    rho: float          # inercia inflacionaria
+    pi_externa: float   # inflación internacional implícita en el ITCRM (%)
+    pi_0: float         # última inflación observada (%)
+    ipc_0: float
+    tcn_0: float
+    itcrm_0: float
+    pbi_0: float
+    observaciones: int
+
+    @property
+    def traspaso_largo_plazo(self) -> float:
+        return self.beta / (1 - self.rho)
+
+
+@dataclass(frozen=True)
+class Parametros:
+    c: float = 0.8      # propensión marginal a consumir
+    t: float = 0.15     # tasa impositiva
+    m: float = 0.2      # propensión marginal a importar
+    n: float = 0.3      # exportaciones netas por cada 1 % de suba del ITCRM (puntos de EMAE / k)
+    dG: float = 0.0     # variación del gasto autónomo
+
+    @property
+    def multiplicador(self) -> float:
+        return 1 / (1 - self.c * (1 - self.t) + self.m)
+
+
+def _tasas_mensuales(df: pd.DataFrame, columnas) -> pd.DataFrame:
+    """Variaciones logarítmicas (%) por mes; los huecos en las fechas se reparten entre los meses."""
+    meses = (df["Fecha"].dt.year * 12 + df["Fecha"].dt.month).diff()
+    return (np.log(df[list(columnas)]).diff().div(meses, axis=0) * 100).iloc[1:]
+
+
+def calibrar(df: pd.DataFrame) -> Calibracion:
+    """Estima traspaso, inercia e inflación externa con Fecha, PBI, IPC, ITCRM y TCN mensuales."""
+    df = df.sort_values("Fecha")
+    tasas = _tasas_mensuales(df, ["IPC", "TCN", "ITCRM"])
+    pi, d, dq = (tasas[c].to_numpy() for c in ("IPC", "TCN", "ITCRM"))
+
+    X = np.column_stack([np.ones(len(pi) - 1), d[1:], pi[:-1]])
+    (a, beta, rho), *_ = np.linalg.lstsq(X, pi[1:], rcond=None)
+    ultimo = df.iloc[-1]
+    return Calibracion(
+        a=float(a), beta=float(beta), rho=float(rho), pi_externa=float(np.mean(dq - d + pi)),
+        pi_0=float(pi[-1]), ipc_0=float(ultimo["IPC"]), tcn_0=float(ultimo["TCN"]),
+        itcrm_0=float(ultimo["ITCRM"]), pbi_0=float(ultimo["PBI"]), observaciones=len(pi) - 1,
+    )
+
+
+def simular(cal: Calibracion, par: Parametros, devaluaciones) -> dict:
+    """Trayectorias de todos los escenarios, cada una de forma ``(escenarios, meses)``.
+
+    Devuelve inflación (%), IPC, TCN, ITCRM y PBI (índices, partiendo del
+    último dato observado).
+    """
+    d = np.atleast_2d(np.asarray(devaluaciones, dtype=float))
+    inflacion = np.empty_like(d)
+    previa = np.full(d.shape[0], cal.pi_0)
+    for mes in range(d.shape[1]):
+        previa = cal.a + cal.beta * d[:, mes] + cal.rho * previa
+        inflacion[:, mes] = previa
+
+    ln_tcn = np.cumsum(d, axis=1) / 100
+    ln_ipc = np.cumsum(inflacion, axis=1) / 100
+    q = np.cumsum(d - inflacion + cal.pi_externa, axis=1)   # % acumulado de ITCRM
+
+    k = par.multiplicador
+    A0 = cal.pbi_0 / k
+    return {
+        "Inflación %": inflacion,
+        "IPC": cal.ipc_0 * np.exp(ln_ipc),
+        "TCN": cal.tcn_0 * np.exp(ln_tcn),
+        "ITCRM": cal.itcrm_0 * np.exp(q / 100),
+        "PBI": k * (A0 + par.dG + par.n * q),
+    }
+
+
+def a_tabla(trayectorias: dict, nombres, desde: pd.Timestamp) -> pd.DataFrame:
+    """Formato largo (Fecha, Escenario, variable…) para graficar."""
+    escenarios, meses = next(iter(trayectorias.values())).shape
+    fechas = pd.date_range(desde, periods=meses + 1, freq="MS")[1:]
+    return pd.DataFrame({
+        "Fecha": np.tile(fechas, escenarios),
+        "Escenario": np.repeat(list(nombres), meses),
+        **{var: valores.ravel() for var, valores in trayectorias.items()},
+    })
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python economia_abierta.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+
+    from datos_tableros import cargar_indicadores_2022_2024
+
+    cal = calibrar(cargar_indicadores_2022_2024())
+    print(f"traspaso β = {cal.beta:.2f} (largo plazo {cal.traspaso_largo_plazo:.2f}), "
+          f"inercia ρ = {cal.rho:.2f}, a = {cal.a:.2f} %, π* = {cal.pi_externa:.2f} % "
+          f"({cal.observaciones} meses)")
+
+    rng = np.random.default_rng(0)
+    devaluaciones = rng.uniform(0, 10, (10_000, 60))
+    t0 = time.perf_counter()
+    simular(cal, Parametros(), devaluaciones)
+    t_vector = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for fila in devaluaciones[:200]:
+        simular(cal, Parametros(), fila)
+    t_uno = (time.perf_counter() - t0) * len(devaluaciones) / 200
+    print(f"{devaluaciones.shape[0]:,} escenarios × {devaluaciones.shape[1]} meses: "
+          f"juntos {t_vector * 1e3:.0f} ms · uno por uno ≈ {t_uno * 1e3:.0f} ms")
@@ -0,0 +1,115 @@
+"""Comparación de un escenario contra el escenario base (capa de cálculo).
+
+Los simuladores del cuaderno (cruce keynesiano con Z base y Z nueva,
+filtraciones vs. gastos compensatorios, impuestos proporcionales) hacían las
+cuentas dentro del callback del widget, mezcladas con el gráfico. Acá queda
+sólo el cálculo: ``comparar`` devuelve una ``Comparacion`` con ambos
+equilibrios, la grilla de Y y las curvas de cada modelo; el dibujo está en
+``graficos_keynes`` y lo usan tanto el cuaderno como los tableros.
+
+    Z(Y) = C0 + c ((1 - t) Y - T0) + I + G            demanda global
+    F(Y) = S + T = -C0 + (1 - c) ((1 - t) Y - T0) + T0 + t Y   filtraciones
+    I + G                                             gastos compensatorios
+
+Ejecutar ``python escenarios.py`` mide el tiempo de cálculo y de dibujo por
+llamada.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from modelo_keynesiano import Equilibrio, demanda_agregada, equilibrio
+
+# Ejercicio base del cuaderno
+BASE = dict(C0=400, I=200, G=500, T0=200, c=0.5, t=0.0)
+MARGEN_Y = 300
+PUNTOS = 300
+
+
+def filtraciones(Y, C0, c, T0=0.0, t=0.0):
+    """Ahorro más impuestos para cada nivel de ingreso."""
+    Y = np.asarray(Y, dtype=float)
+    disponible = (1 - t) * Y - T0
+    return -C0 + (1 - c) * disponible + T0 + t * Y
+
+
+@dataclass
+class Comparacion:
+    base: dict
+    nuevo: dict
+    eq_base: Equilibrio
+    eq: Equilibrio
+    Y: np.ndarray
+
+    @property
+    def delta_Y(self) -> float:
+        return float(self.eq.Y - self.eq_base.Y)
+
+    def demanda(self) -> tuple[np.ndarray, np.ndarray]:
+        """Z base y Z nueva sobre la grilla."""
+        return demanda_agregada(self.Y, **self.base), demanda_agregada(self.Y, **self.nuevo)
+
+    def filtraciones(self) -> tuple[np.ndarray, np.ndarray]:
+        """Filtraciones base y nuevas sobre la grilla."""
+        return tuple(filtraciones(self.Y, p["C0"], p["c"], p["T0"], p["t"]) for p in (self.base, self.nuevo))
+
+    def gastos(self) -> tuple[float, float]:
+        """Gastos compensatorios I + G, base y nuevos."""
+        return self.base["I"] + self.base["G"], self.nuevo["I"] + self.nuevo["G"]
+
+    def ordenada_filtraciones(self) -> float:
+        """F(0) de las filtraciones nuevas."""
+        return float(filtraciones(0.0, self.nuevo["C0"], self.nuevo["c"], self.nuevo["T0"], self.nuevo["t"]))
+
+    def tabla_variacion(self, multiplicadores: bool = False) -> pd.DataFrame:
+        """Y₀*, Y*, ΔY y, opcionalmente, los multiplicadores del escenario nuevo."""
+        resultados = {
+            "Ingreso base (Y₀*)": float(self.eq_base.Y),
+            "Ingreso nuevo (Y*)": float(self.eq.Y),
+            "ΔY": self.delta_Y,
+        }
+        if multiplicadores:
+            resultados["Multiplicador del Gasto (k)"] = float(self.eq.k)
+            resultados["Multiplicador de los Impuestos (kT)"] = float(self.eq.kT)
+        return pd.DataFrame.from_dict(resultados, orient='index', columns=['Valor'])
+
+
+def comparar(nuevo: dict, base: dict = BASE, puntos: int = PUNTOS) -> Comparacion:
+    """Equilibrios base y nuevo; la grilla de Y llega hasta el mayor Y* más un margen."""
+    base = {**BASE, **base}
+    nuevo = {**base, **nuevo}
+    eq_base, eq = equilibrio(**base), equilibrio(**nuevo)
+    Y = np.linspace(0, np.nanmax([eq_base.Y, eq.Y]) + MARGEN_Y, puntos)
+    return Comparacion(base, nuevo, eq_base, eq, Y)
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python escenarios.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import io
+    import time
+
+    from graficos_keynes import GraficoComparado, GraficoFiltraciones
+
+    rng = np.random.default_rng(0)
+    escenarios = [dict(C0=rng.integers(0, 21) * 50, I=rng.integers(0, 21) * 50, G=rng.integers(0, 21) * 50,
+                       T0=rng.integers(0, 21) * 50, c=rng.choice(np.arange(0.1, 0.95, 0.05)),
+                       t=rng.choice(np.arange(0, 0.55, 0.05))) for _ in range(200)]
+
+    def medir(funcion, repeticiones=len(escenarios)):
+        t0 = time.perf_counter()
+        for i in range(repeticiones):
+            funcion(escenarios[i % len(escenarios)])
+        return (time.perf_counter() - t0) / repeticiones * 1e3
+
+    def png(fig):
+        fig.savefig(io.BytesIO(), format="png")
+
+    cruz, filt = GraficoComparado(), GraficoFiltraciones()
+    comparaciones = {id(e): comparar(e) for e in escenarios}
+    print(f"cálculo (comparar + tabla):    {medir(lambda e: comparar(e).tabla_variacion(True)):.3f} ms/llamada")
+    print(f"dibujo cruce, figura reusada:  {medir(lambda e: png(cruz.actualizar(comparaciones[id(e)])), 50):.1f} ms/llamada")
+    print(f"dibujo cruce, figura nueva:    {medir(lambda e: png(GraficoComparado().actualizar(comparaciones[id(e)])), 50):.1f} ms/llamada")
+    print(f"dibujo filtraciones, reusada:  {medir(lambda e: png(filt.actualizar(comparaciones[id(e)])), 50):.1f} ms/llamada")
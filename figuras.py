@@ -0,0 +1,115 @@
+"""Figuras de series de tiempo livianas para ``st.plotly_chart``.
+
+``st.plotly_chart`` manda la figura entera como JSON en cada rerun. Con
+``go.Scatter`` y la plantilla ``plotly_white`` ese JSON lleva:
+
+* la plantilla completa (~7 KB): escalas de color y valores por defecto de
+  todos los tipos de traza (mapas, 3D, tablas…), aunque sólo haya líneas;
+* las fechas del eje x como texto ISO (``"2024-01-01T00:00:00"``, ~22 bytes
+  cada una), porque sólo los arreglos numéricos viajan en binario.
+
+En modo liviano ``figura`` usa una versión recortada de la plantilla
+(armada una sola vez por proceso) y ``traza`` arma ``go.Scattergl`` (WebGL)
+con las fechas como milisegundos desde 1970 en ``float64``: Plotly las
+serializa como arreglo tipado en base64 y el eje se declara ``type="date"``,
+así el navegador las muestra igual. Si el paso entre puntos es constante
+(series diarias, horarias…) ni siquiera se manda ``x``: alcanza con ``x0`` y
+``dx``. Sin modo liviano, ambas devuelven exactamente lo de siempre.
+
+Ejecutar ``python figuras.py`` compara bytes enviados y tiempo de armado
+y serialización para series de distintos largos.
+"""
+import functools
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+PLANTILLA = "plotly_white"
+# Lo que sólo usan trazas que estos tableros no dibujan
+_SOBRANTE_LAYOUT = ("colorscale", "coloraxis", "scene", "ternary", "polar", "geo", "mapbox")
+_TRAZAS_USADAS = ("scatter", "scattergl")
+
+
+@functools.cache
+def plantilla_compacta(nombre: str = PLANTILLA) -> go.layout.Template:
+    """``pio.templates[nombre]`` sin lo que no afecta a líneas y puntos."""
+    completa = pio.templates[nombre].to_plotly_json()
+    layout = {k: v for k, v in completa["layout"].items() if k not in _SOBRANTE_LAYOUT}
+    datos = {k: v for k, v in completa["data"].items() if k in _TRAZAS_USADAS}
+    return go.layout.Template(layout=layout, data=datos)
+
+
+def figura(liviana: bool = False, plantilla: str = PLANTILLA, fechas: bool = True, **layout) -> go.Figure:
+    """Figura vacía con ``plantilla``; en modo liviano, la compacta y el eje x de fechas declarado."""
+    if not liviana:
+        return go.Figure(layout=dict(template=plantilla, **layout))
+    fig = go.Figure(layout=dict(template=plantilla_compacta(plantilla), **layout))
+    if fechas:
+        fig.update_xaxes(type="date")
+    return fig
+
+
+def _binario(valores) -> np.ndarray:
+    """Fechas a milisegundos (``float64``, NaT → NaN) y el resto a ``float64``: ambos viajan como arreglo tipado."""
+    valores = np.asarray(valores)
+    if valores.dtype.kind == "M":
+        ms = valores.astype("datetime64[ms]").astype(np.int64).astype(np.float64)
+        ms[np.isnat(valores)] = np.nan   # si no, NaT es int64 mínimo y el eje se estira hasta 1677
+        return ms
+    return valores.astype(np.float64)
+
+
+def traza(x, y, liviana: bool = False, **kwargs):
+    """``go.Scatter`` de siempre, o ``go.Scattergl`` con ``x`` e ``y`` en binario."""
+    if not liviana:
+        return go.Scatter(x=x, y=y, **kwargs)
+    x, y = _binario(x), _binario(y)
+    if len(x) > 2:
+        paso = np.diff(x)
+        if (paso == paso[0]).all():
+            return go.Scattergl(x0=float(x[0]), dx=float(paso[0]), y=y, **kwargs)
+    return go.Scattergl(x=x, y=y, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python figuras.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+
+    import pandas as pd
+
+    def armar(df: pd.DataFrame, liviana: bool) -> str:
+        fig = figura(liviana, yaxis2=dict(overlaying="y", side="right"))
+        fig.add_trace(traza(df["Fecha"], df["PBI"], liviana, name="PBI", yaxis="y1"))
+        fig.add_trace(traza(df["Fecha"], df["IPC"], liviana, name="IPC", yaxis="y2"))
+        return pio.to_json(fig, validate=False)   # lo mismo que hace st.plotly_chart
+
+    def medir(funcion, veces: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(veces):
+            funcion()
+        return (time.perf_counter() - t0) / veces * 1e3
+
+    # Una fecha faltante no puede mover el eje: queda como hueco (NaN), no como 1677.
+    fechas = pd.Series(pd.to_datetime(["2024-01-01", None, "2024-03-01"]))
+    x = traza(fechas, [1.0, 2.0, 3.0], liviana=True).x
+    assert np.isnan(x[1]) and x[0] == pd.Timestamp("2024-01-01").value / 1e6
+
+    rng = np.random.default_rng(0)
+    # Primera llamada fuera de la medición (validadores de plotly, plantilla compacta)
+    armar(pd.DataFrame({"Fecha": pd.date_range("2022-01-01", periods=2), "PBI": [1.0, 2.0], "IPC": [1.0, 2.0]}), True)
+    print(f"{'puntos':>9} {'modo':>9} {'KiB':>9} {'armar+JSON ms':>14}")
+    # Mensual (paso irregular: x viaja como arreglo) y por minuto (paso fijo: x0 + dx)
+    for n, frecuencia in ((36, "MS"), (1_200, "MS"), (10_000, "min"), (100_000, "min"), (1_000_000, "min")):
+        df = pd.DataFrame({
+            "Fecha": pd.date_range("1920-01-01" if frecuencia == "MS" else "2022-01-01", periods=n, freq=frecuencia),
+            "PBI": 100 + np.cumsum(rng.normal(size=n)),
+            "IPC": 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n))),
+        })
+        veces = 20 if n <= 10_000 else 3
+        for liviana in (False, True):
+            carga = armar(df, liviana)
+            print(f"{n:>9,} {'liviana' if liviana else 'completa':>9} {len(carga) / 1024:>9,.1f} "
+                  f"{medir(lambda: armar(df, liviana), veces):>14.1f}")
@@ -0,0 +1,75 @@
+"""Alineación de series con distinta frecuencia (mensual, trimestral, anual).
+
+Cada serie declara su frecuencia nativa (``"M"``, ``"T"`` o ``"A"``). Pasar a
+una frecuencia más alta interpola; pasar a una más baja agrega. El resultado
+se guarda en un sub-almacén ``alineadas/`` por serie, frecuencia destino y
+método, y sólo se recalcula cuando la serie original cambia en disco. Así
+los tableros no vuelven a remuestrear en cada rerun de Streamlit.
+"""
+import pandas as pd
+
+from almacen import Almacen
+
+REGLAS = {"M": "MS", "T": "QS", "A": "YS"}  # períodos fechados al primer día
+_ORDEN = {"M": 0, "T": 1, "A": 2}
+
+INTERPOLACIONES = ("lineal", "tiempo", "escalonado", "ninguna")
+AGREGACIONES = {"promedio": "mean", "suma": "sum", "ultimo": "last"}
+
+
+def _metodo_por_defecto(origen: str, destino: str) -> str:
+    return "lineal" if _ORDEN[destino] < _ORDEN[origen] else "promedio"
+
+
+def alinear(df: pd.DataFrame, origen: str, destino: str, metodo: str | None = None) -> pd.DataFrame:
+    """Lleva ``df`` (``indice_tiempo`` + valores) de la frecuencia ``origen`` a ``destino``.
+
+    * A una frecuencia más alta (p. ej. trimestral → mensual) ``metodo`` es
+      uno de ``INTERPOLACIONES``: ``lineal`` entre observaciones, ``tiempo``
+      (ponderado por días), ``escalonado`` (repite el último dato) o
+      ``ninguna`` (deja los huecos como NaN).
+    * A una frecuencia más baja (p. ej. mensual → anual) ``metodo`` es una de
+      las claves de ``AGREGACIONES``.
+    """
+    for f in (origen, destino):
+        if f not in REGLAS:
+            raise ValueError(f"Frecuencia desconocida: {f!r}. Opciones: {', '.join(REGLAS)}")
+    metodo = metodo or _metodo_por_defecto(origen, destino)
+    serie = df.set_index("indice_tiempo").sort_index()
+
+    if _ORDEN[destino] < _ORDEN[origen]:
+        if metodo not in INTERPOLACIONES:
+            raise ValueError(f"Interpolación desconocida: {metodo!r}. Opciones: {', '.join(INTERPOLACIONES)}")
+        serie = serie.asfreq(REGLAS[destino])
+        if metodo == "escalonado":
+            serie = serie.ffill()
+        elif metodo != "ninguna":
+            serie = serie.interpolate(method="linear" if metodo == "lineal" else "time")
+    elif _ORDEN[destino] > _ORDEN[origen]:
+        if metodo not in AGREGACIONES:
+            raise ValueError(f"Agregación desconocida: {metodo!r}. Opciones: {', '.join(AGREGACIONES)}")
+        serie = serie.resample(REGLAS[destino]).agg(AGREGACIONES[metodo])
+
+    return serie.reset_index()
+
+
+def obtener_alineada(almacen: Almacen, serie_id: str, origen: str, destino: str,
+                     metodo: str | None = None) -> pd.DataFrame:
+    """Serie ``serie_id`` en frecuencia ``destino``, usando la copia precalculada si está al día."""
+    if origen == destino or not almacen.existe(serie_id):
+        return almacen.leer(serie_id)
+    metodo = metodo or _metodo_por_defecto(origen, destino)
+    alineadas = almacen.sub("alineadas")
+    clave = f"{serie_id}.{destino}.{metodo}"
+    if alineadas.existe(clave) and alineadas.ruta(clave).stat().st_mtime >= almacen.ruta(serie_id).stat().st_mtime:
+        return alineadas.leer(clave)
+    df = alinear(almacen.leer(serie_id), origen, destino, metodo)
+    alineadas.guardar(df, clave)
+    return df
+
+
+def preparar(almacen: Almacen, frecuencias: dict[str, str], destino: str,
+             metodo: str | None = None) -> None:
+    """Precalcula ``destino`` para todas las series de ``frecuencias`` (id → frecuencia nativa)."""
+    for serie_id, origen in frecuencias.items():
+        obtener_alineada(almacen, serie_id, origen, destino, metodo)
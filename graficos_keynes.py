@@ -0,0 +1,196 @@
+"""Gráficos del cruce keynesiano (recta de 45° y demanda agregada).
+
+En Streamlit cada movimiento de un slider volvía a calcular la grilla de Y y a
+crear una figura nueva con ``plt.subplots()`` que nunca se cerraba, así que la
+memoria crecía durante toda la clase. Acá la grilla se calcula una sola vez y
+cada ``GraficoCruz`` guarda su figura: en cada rerun sólo se reemplazan los
+datos de la línea DA y del punto de equilibrio.
+
+Las figuras se crean con ``matplotlib.figure.Figure`` y no con pyplot, por lo
+que no quedan registradas en el estado global y se liberan con el objeto.
+"""
+import numpy as np
+from matplotlib.figure import Figure
+
+from modelo_islm import curva_is, curva_lm, resolver, resolver_no_lineal
+
+Y_GRILLA = np.linspace(0, 1500, 300)
+Y_GRILLA.flags.writeable = False
+
+
+class GraficoCruz:
+    """Figura persistente: 45°, DA(Y) y el equilibrio, con datos actualizables."""
+
+    def __init__(self, etiqueta_da: str = "DA", color: str = "blue", Y: np.ndarray = Y_GRILLA):
+        self.Y = Y
+        self.fig = Figure()
+        self.ax = self.fig.subplots()
+        self.ax.plot(Y, Y, "--", color="gray", label="45°")
+        (self.linea_da,) = self.ax.plot(Y, np.zeros_like(Y), label=etiqueta_da, color=color)
+        (self.punto,) = self.ax.plot([], [], "ro")
+        self.ax.set_xlabel("Ingreso (Y)")
+        self.ax.set_ylabel("Demanda Agregada (DA)")
+        self.ax.grid(True)
+
+    def actualizar(self, da: np.ndarray, Y_eq: float, DA_eq: float) -> Figure:
+        """Reemplaza la curva DA y el equilibrio; devuelve la figura lista para ``st.pyplot``."""
+        self.linea_da.set_ydata(da)
+        self.punto.set_data([Y_eq], [DA_eq])
+        self.punto.set_label(f"Equilibrio Y* = {Y_eq:.2f}")
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.legend()
+        return self.fig
+
+
+class GraficoComparado:
+    """Cruce keynesiano del escenario base contra el nuevo (simuladores del cuaderno).
+
+    Muestra Z base y Z nueva, ambos equilibrios, la flecha ΔY y la ordenada A
+    de la Z nueva. Como ``GraficoCruz``, la figura se arma una vez y
+    ``actualizar`` sólo mueve los datos de cada elemento.
+    """
+
+    def __init__(self, titulo: str = "Modelo keynesiano: equilibrio y desplazamientos",
+                 etiquetas=("Línea 45°", "Z Base", "Z Nueva"), rotulos=("Y* Base", "Y* Nueva"),
+                 ylabel: str = "Demanda Agregada (Z)"):
+        self.rotulos = rotulos
+        self.fig = Figure(figsize=(9, 6))
+        self.ax = self.fig.subplots()
+        self.linea_45, = self.ax.plot([], [], "--", color="gray", label=etiquetas[0])
+        self.z_base, = self.ax.plot([], [], color="blue", label=etiquetas[1])
+        self.z, = self.ax.plot([], [], color="green", label=etiquetas[2])
+        self.punto_base, = self.ax.plot([], [], "o", color="blue")
+        self.punto, = self.ax.plot([], [], "o", color="green")
+        self.texto_base = self.ax.text(0, 0, "", color="blue")
+        self.texto = self.ax.text(0, 0, "", color="green")
+        self.flecha, self.texto_dy = _flecha_dy(self.ax)
+        self.punto_A, = self.ax.plot([], [], "o", color="purple")
+        self.texto_A = self.ax.text(0, 0, "", color="purple")
+        self.ax.set_xlabel("Ingreso (Y)")
+        self.ax.set_ylabel(ylabel)
+        self.ax.set_title(titulo)
+        self.ax.grid(True)
+        self.ax.legend()
+        self.fig.tight_layout()
+
+    def actualizar(self, comp) -> Figure:
+        """Dibuja una ``escenarios.Comparacion``; devuelve la figura."""
+        Y_base, Y_eq = float(comp.eq_base.Y), float(comp.eq.Y)
+        A = float(comp.eq.A)
+        Z_base, Z = comp.demanda()
+        self.linea_45.set_data(comp.Y, comp.Y)
+        self.z_base.set_data(comp.Y, Z_base)
+        self.z.set_data(comp.Y, Z)
+        self.punto_base.set_data([Y_base], [Y_base])
+        self.punto.set_data([Y_eq], [Y_eq])
+        self.texto_base.set_position((Y_base + 10, Y_base - 30))
+        self.texto_base.set_text(f"{self.rotulos[0]} = {Y_base:.1f}")
+        self.texto.set_position((Y_eq + 10, Y_eq - 30))
+        self.texto.set_text(f"{self.rotulos[1]} = {Y_eq:.1f}")
+        _mover_flecha(self.flecha, self.texto_dy, Y_base, Y_eq)
+        self.punto_A.set_data([0], [A])
+        self.texto_A.set_position((10, A + 10))
+        self.texto_A.set_text(f"A = {A:.1f}")
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return self.fig
+
+
+class GraficoFiltraciones:
+    """Filtraciones (S + T) contra gastos compensatorios (I + G), base y nuevos."""
+
+    def __init__(self):
+        self.fig = Figure(figsize=(9, 6))
+        self.ax = self.fig.subplots()
+        self.f_base, = self.ax.plot([], [], "--", color="blue", label="Filtraciones Base")
+        self.f, = self.ax.plot([], [], "-", color="orange", label="Filtraciones Nueva")
+        self.g_base = self.ax.axhline(0, linestyle="--", color="gray", label="Gastos Comp. Base")
+        self.g = self.ax.axhline(0, linestyle="-", color="purple", label="Gastos Comp. Nuevo")
+        self.v_base = self.ax.axvline(0, linestyle="--", color="black")
+        self.v = self.ax.axvline(0, linestyle=":", color="red")
+        self.texto_base = self.ax.text(0, 0, "", color="black")
+        self.texto = self.ax.text(0, 0, "", color="red")
+        self.flecha, self.texto_dy = _flecha_dy(self.ax)
+        self.punto_F0, = self.ax.plot([], [], "o", color="brown")
+        self.texto_F0 = self.ax.text(0, 0, "", color="brown")
+        self.ax.set_xlabel("Ingreso (Y)")
+        self.ax.set_ylabel("Filtraciones y Gastos Compensatorios")
+        self.ax.set_title("Modelo de equilibrio: Filtraciones vs. Gastos Compensatorios")
+        self.ax.grid(True)
+        self.ax.legend()
+        self.fig.tight_layout()
+
+    def actualizar(self, comp) -> Figure:
+        """Dibuja una ``escenarios.Comparacion``; devuelve la figura."""
+        Y_base, Y_eq = float(comp.eq_base.Y), float(comp.eq.Y)
+        F_base, F = comp.filtraciones()
+        G_base, G_new = comp.gastos()
+        F0 = comp.ordenada_filtraciones()
+        self.f_base.set_data(comp.Y, F_base)
+        self.f.set_data(comp.Y, F)
+        self.g_base.set_ydata([G_base, G_base])
+        self.g.set_ydata([G_new, G_new])
+        self.v_base.set_xdata([Y_base, Y_base])
+        self.v.set_xdata([Y_eq, Y_eq])
+        self.texto_base.set_position((Y_base + 10, G_base + 10))
+        self.texto_base.set_text(f"Y₀* = {Y_base:.1f}")
+        self.texto.set_position((Y_eq + 10, G_new + 10))
+        self.texto.set_text(f"Y* = {Y_eq:.1f}")
+        _mover_flecha(self.flecha, self.texto_dy, Y_base, Y_eq)
+        self.punto_F0.set_data([0], [F0])
+        self.texto_F0.set_position((10, F0 + 20))
+        self.texto_F0.set_text(f"F(0) = {F0:.1f}")
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return self.fig
+
+
+def _flecha_dy(ax):
+    flecha = ax.annotate("", xy=(0, 0), xytext=(0, 0),
+                         arrowprops=dict(arrowstyle="<|-|>", color="crimson", lw=2))
+    texto = ax.text(0, 20, "", ha="center", va="bottom", fontsize=10, color="crimson")
+    return flecha, texto
+
+
+def _mover_flecha(flecha, texto, Y_base: float, Y_eq: float):
+    flecha.xy = (Y_eq, 0)
+    flecha.set_position((Y_base, 0))
+    texto.set_position(((Y_base + Y_eq) / 2, 20))
+    texto.set_text(f"ΔY = {Y_eq - Y_base:.1f}")
+
+
+class GraficoISLM:
+    """Curvas IS y LM de la base y del escenario con shocks, con ambos equilibrios."""
+
+    def __init__(self, puntos: int = 200):
+        self.puntos = puntos
+        self.fig = Figure(figsize=(8, 5))
+        self.ax = self.fig.subplots()
+        self.is_base, = self.ax.plot([], [], "--", color="blue", label="IS base")
+        self.lm_base, = self.ax.plot([], [], "--", color="darkorange", label="LM base")
+        self.is_nueva, = self.ax.plot([], [], color="blue", label="IS")
+        self.lm_nueva, = self.ax.plot([], [], color="darkorange", label="LM")
+        self.punto_base, = self.ax.plot([], [], "o", color="gray")
+        self.punto, = self.ax.plot([], [], "ro")
+        self.ax.set_xlabel("Ingreso (Y)")
+        self.ax.set_ylabel("Tasa de interés (r)")
+        self.ax.grid(True)
+
+    def actualizar(self, base: dict, nuevo: dict, no_lineal: bool = False) -> Figure:
+        """Resuelve base y nuevo juntos y mueve curvas y puntos; devuelve la figura."""
+        apilados = {p: np.array([base[p], nuevo[p]], dtype=float) for p in base}
+        eq = (resolver_no_lineal if no_lineal else resolver)(**apilados)
+        Y = np.linspace(1, 1.6 * np.nanmax(eq.Y), self.puntos)
+        self.is_base.set_data(Y, curva_is(Y, **base))
+        self.lm_base.set_data(Y, curva_lm(Y, no_lineal, **base))
+        self.is_nueva.set_data(Y, curva_is(Y, **nuevo))
+        self.lm_nueva.set_data(Y, curva_lm(Y, no_lineal, **nuevo))
+        self.punto_base.set_data([eq.Y[0]], [eq.r[0]])
+        self.punto.set_data([eq.Y[1]], [eq.r[1]])
+        self.punto.set_label(f"Equilibrio Y* = {eq.Y[1]:.1f}, r* = {eq.r[1]:.2f}")
+        r_max = 2.5 * np.nanmax(np.abs(eq.r)) + 1
+        self.ax.set_xlim(0, Y[-1])
+        self.ax.set_ylim(min(-1.0, np.nanmin(eq.r) - 2), r_max)
+        self.ax.legend(loc="best")
+        return self.fig
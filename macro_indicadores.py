@@ -8,6 +8,8 @@ try:
 except ModuleNotFoundError:
     raise ModuleNotFoundError("Streamlit no está instalado en el entorno. Ejecuta 'pip install streamlit' en tu consola para instalarlo.")
 
+from datos_tableros import cargar_indicadores_simulados
+
 # Título del Tablero
 st.title('🌎 Tablero Interactivo de Indicadores Macroeconómicos')
 # 1.5 Guía de uso del Tablero
@@ -48,23 +50,7 @@ st.markdown("""
 
 
 # Datos
-fechas = pd.date_range(start='2022-01-01', end='2024-01-01', freq='MS')
-pbi_real = [130, 132, 131, 134, 136, 137, 138, 137, 136, 137, 138, 137,
-             137, 138, 140, 141, 141, 140, 139, 138, 139, 140, 140, 139, 140]
-inflacion_mensual = [3.9, 4.7, 6.7, 6.0, 5.1, 5.3, 7.4, 7.0, 6.2, 6.3, 5.1, 5.1,
-                     6.0, 6.6, 7.7, 7.8, 6.3, 6.0, 12.4, 8.3, 12.8, 20.6, 25.5, 20.6, 15.0]
-desempleo = [7.0, 7.0, 6.9, 6.9, 6.9, 6.8, 6.8, 6.7, 6.7, 6.8, 6.8, 7.1,
-             7.0, 7.0, 6.8, 6.8, 6.7, 6.9, 7.5, 7.8, 8.0, 8.1, 8.5, 8.3, 8.0]
-tipo_cambio = [104, 107, 110, 112, 117, 120, 130, 135, 140, 150, 160, 170,
-               180, 190, 210, 220, 230, 250, 310, 350, 400, 500, 600, 700, 750]
-
-df_indicadores = pd.DataFrame({
-    'Fecha': fechas,
-    'PBI_Indexado': pbi_real,
-    'Inflacion_Mensual_%': inflacion_mensual,
-    'Desempleo_%': desempleo,
-    'Tipo_Cambio_AR_USD': tipo_cambio
-})
+df_indicadores = cargar_indicadores_simulados(hasta='2024-01-01')
 
 # Consignas
 st.markdown("""
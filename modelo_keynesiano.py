@@ -0,0 +1,130 @@
+"""Modelo keynesiano simple con gobierno, vectorizado con NumPy.
+
+    C = C0 + c (Y - T),   T = T0 + t Y,   DA = C + I + G,   Y = DA
+
+    A   = C0 - c T0 + I + G              gasto autónomo
+    k   = 1 / (1 - c (1 - t))            multiplicador del gasto autónomo
+    kT  = -c / (1 - c (1 - t))           multiplicador de los impuestos autónomos
+    Y*  = k A                            ingreso de equilibrio
+
+Todos los parámetros aceptan escalares o arreglos que se combinan por
+broadcasting, así que una sola llamada resuelve millones de combinaciones.
+Con ``T0 = t = 0`` se obtiene el modelo sin impuestos de los simuladores.
+
+``barrido`` evalúa Y* sobre una grilla 2-D de dos parámetros (p. ej. c × t)
+por bloques de filas, para acotar la memoria en grillas grandes.
+
+Ejecutar ``python modelo_keynesiano.py`` compara contra el cálculo escalar.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class Equilibrio:
+    A: np.ndarray
+    k: np.ndarray
+    kT: np.ndarray
+    Y: np.ndarray
+
+    @property
+    def k_presupuesto(self) -> np.ndarray:
+        """Multiplicador del presupuesto equilibrado (ΔG = ΔT0): k + kT."""
+        return self.k + self.kT
+
+    def tabla(self) -> pd.DataFrame:
+        """Resultados de un único equilibrio, como en el cuaderno."""
+        resultados = {
+            "Gasto autónomo (A)": float(self.A),
+            "Multiplicador (k)": float(self.k),
+            "Ingreso de equilibrio (Y*)": float(self.Y),
+            "Multiplicador de T": float(self.kT),
+        }
+        return pd.DataFrame.from_dict(resultados, orient='index', columns=['Valor'])
+
+
+def equilibrio(C0, c, I, G, T0=0.0, t=0.0) -> Equilibrio:
+    """Equilibrio del modelo para escalares o arreglos de parámetros.
+
+    Donde ``c (1 - t) >= 1`` el modelo no tiene equilibrio y se devuelve NaN.
+    """
+    C0, c, I, G, T0, t = (np.asarray(x, dtype=float) for x in (C0, c, I, G, T0, t))
+    pmc_neta = c * (1 - t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(pmc_neta < 1, 1 / (1 - pmc_neta), np.nan)
+    A = C0 - c * T0 + I + G
+    return Equilibrio(A=A, k=k, kT=-c * k, Y=k * A)
+
+
+def demanda_agregada(Y, C0, c, I, G, T0=0.0, t=0.0):
+    """DA(Y) = C0 + c ((1 - t) Y - T0) + I + G."""
+    return C0 + c * ((1 - t) * np.asarray(Y, dtype=float) - T0) + I + G
+
+
+# ---------------------------------------------------------------------------
+# BARRIDOS DE PARÁMETROS
+# ---------------------------------------------------------------------------
+PARAMETROS = ("C0", "c", "I", "G", "T0", "t")
+RANGOS = {"C0": (0, 300), "c": (0.1, 0.99), "I": (0, 300), "G": (0, 300), "T0": (0, 300), "t": (0.0, 0.5)}
+
+
+def barrido(base: dict, eje_x: str, valores_x, eje_y: str, valores_y,
+            bloque: int = 250_000) -> np.ndarray:
+    """Y* para cada combinación de ``valores_x`` × ``valores_y``; forma ``(len(y), len(x))``.
+
+    ``base`` fija el resto de los parámetros (faltantes: 0). Se resuelve por
+    bloques de a lo sumo ``bloque`` celdas.
+    """
+    if eje_x == eje_y or not {eje_x, eje_y} <= set(PARAMETROS):
+        raise ValueError(f"Los ejes deben ser dos parámetros distintos de {PARAMETROS}")
+    x = np.asarray(valores_x, dtype=float)
+    y = np.asarray(valores_y, dtype=float)
+    params = {p: base.get(p, 0.0) for p in PARAMETROS}
+    params[eje_x] = x[np.newaxis, :]
+
+    superficie = np.empty((len(y), len(x)))
+    filas = max(1, bloque // len(x))
+    for i in range(0, len(y), filas):
+        params[eje_y] = y[i:i + filas, np.newaxis]
+        superficie[i:i + filas] = equilibrio(**params).Y
+    return superficie
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python modelo_keynesiano.py
+# ---------------------------------------------------------------------------
+
+def _equilibrio_escalar(C0, c, I, G, T0, t):
+    k = 1 / (1 - c * (1 - t))
+    return k * (C0 - c * T0 + I + G)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    params = dict(
+        C0=rng.uniform(0, 300, n), c=rng.uniform(0.1, 0.95, n), I=rng.uniform(0, 300, n),
+        G=rng.uniform(0, 300, n), T0=rng.uniform(0, 300, n), t=rng.uniform(0, 0.5, n),
+    )
+
+    t0 = time.perf_counter()
+    eq = equilibrio(**params)
+    t_vector = time.perf_counter() - t0
+
+    m = 200_000
+    t0 = time.perf_counter()
+    escalar = [_equilibrio_escalar(*fila) for fila in zip(*(v[:m].tolist() for v in params.values()))]
+    t_escalar = (time.perf_counter() - t0) * n / m
+
+    assert np.allclose(eq.Y[:m], escalar)
+    print(f"{n:,} combinaciones: vectorizado {t_vector * 1e3:.0f} ms · "
+          f"escalar ≈ {t_escalar * 1e3:.0f} ms (extrapolado) · {t_escalar / t_vector:.0f}x")
+
+    base = dict(C0=100, c=0.8, I=50, G=100, T0=0, t=0.15)
+    t0 = time.perf_counter()
+    barrido(base, "c", np.linspace(*RANGOS["c"], 1000), "t", np.linspace(*RANGOS["t"], 1000))
+    print(f"barrido 1000×1000 (c × t): {(time.perf_counter() - t0) * 1e3:.0f} ms")
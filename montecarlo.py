@@ -0,0 +1,201 @@
+"""Incertidumbre del ingreso de equilibrio por Monte Carlo.
+
+En lugar de un único Y*, cada parámetro del modelo keynesiano se sortea de
+una distribución y se resuelve el equilibrio para cada sorteo. Con 10^7
+sorteos guardar todos los Y* no tiene sentido, así que la simulación se hace
+por bloques: cada bloque se resuelve vectorizado (``modelo_keynesiano``) y se
+reduce enseguida a un histograma de bordes fijos más algunas sumas. Los
+bloques se reparten en un pool de procesos y sus resultados se van
+combinando a medida que llegan, de modo que la memoria queda acotada por el
+tamaño del bloque y se puede informar el avance.
+
+Los cuantiles se interpolan sobre el histograma acumulado; con los 2000
+intervalos por defecto el error es menor que un ancho de intervalo.
+
+La especificación es un dict parámetro → distribución::
+
+    {"C0": 100, "c": ("uniforme", 0.7, 0.9), "t": ("normal", 0.15, 0.02),
+     "I": ("triangular", 30, 50, 80), "G": ("lognormal", 4.6, 0.1)}
+
+Los parámetros que faltan valen 0 y un número es un valor fijo.
+
+Ejecutar ``python montecarlo.py`` corre 10^7 sorteos y mide el tiempo.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import os
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from modelo_keynesiano import PARAMETROS, equilibrio
+
+BLOQUE = 1_000_000
+INTERVALOS = 2000
+MUESTRA_PILOTO = 100_000
+
+# nombre → (método de numpy.random.Generator, cantidad de argumentos)
+DISTRIBUCIONES = {
+    "normal": ("normal", 2),        # media, desvío
+    "uniforme": ("uniform", 2),     # mínimo, máximo
+    "triangular": ("triangular", 3),  # mínimo, moda, máximo
+    "lognormal": ("lognormal", 2),  # media y desvío del logaritmo
+}
+
+
+def _validar(especificacion: dict) -> dict:
+    desconocidos = set(especificacion) - set(PARAMETROS)
+    if desconocidos:
+        raise ValueError(f"Parámetros desconocidos: {sorted(desconocidos)}; se esperaban {PARAMETROS}")
+    for nombre, dist in especificacion.items():
+        if isinstance(dist, tuple):
+            if dist[0] not in DISTRIBUCIONES:
+                raise ValueError(f"{nombre}: distribución '{dist[0]}' no soportada ({list(DISTRIBUCIONES)})")
+            if len(dist) - 1 != DISTRIBUCIONES[dist[0]][1]:
+                raise ValueError(f"{nombre}: '{dist[0]}' lleva {DISTRIBUCIONES[dist[0]][1]} argumentos")
+    return {p: especificacion.get(p, 0.0) for p in PARAMETROS}
+
+
+def sortear(especificacion: dict, n: int, rng: np.random.Generator) -> dict:
+    """Un arreglo de ``n`` sorteos por parámetro (los fijos quedan escalares)."""
+    sorteos = {}
+    for nombre, dist in _validar(especificacion).items():
+        if isinstance(dist, tuple):
+            metodo, _ = DISTRIBUCIONES[dist[0]]
+            sorteos[nombre] = getattr(rng, metodo)(*dist[1:], size=n)
+        else:
+            sorteos[nombre] = float(dist)
+    return sorteos
+
+
+@dataclass
+class ResultadoMC:
+    """Resumen combinable de un conjunto de sorteos."""
+    bordes: np.ndarray
+    conteos: np.ndarray      # incluye desbordes: [< bordes[0], intervalos…, >= bordes[-1]]
+    sorteos: int = 0
+    validos: int = 0         # sin equilibrio (c (1 - t) >= 1) no cuentan
+    suma: float = 0.0
+    suma2: float = 0.0
+    minimo: float = np.inf
+    maximo: float = -np.inf
+
+    @classmethod
+    def vacio(cls, bordes: np.ndarray) -> "ResultadoMC":
+        return cls(bordes, np.zeros(len(bordes) + 1, dtype=np.int64))
+
+    @classmethod
+    def de_valores(cls, Y: np.ndarray, bordes: np.ndarray) -> "ResultadoMC":
+        Y_ok = Y[np.isfinite(Y)]
+        conteos = np.bincount(np.searchsorted(bordes, Y_ok, side="right"), minlength=len(bordes) + 1)
+        return cls(bordes, conteos, len(Y), len(Y_ok), float(Y_ok.sum()), float(np.dot(Y_ok, Y_ok)),
+                   float(Y_ok.min(initial=np.inf)), float(Y_ok.max(initial=-np.inf)))
+
+    def combinar(self, otro: "ResultadoMC") -> "ResultadoMC":
+        return ResultadoMC(self.bordes, self.conteos + otro.conteos, self.sorteos + otro.sorteos,
+                           self.validos + otro.validos, self.suma + otro.suma, self.suma2 + otro.suma2,
+                           min(self.minimo, otro.minimo), max(self.maximo, otro.maximo))
+
+    @property
+    def media(self) -> float:
+        return self.suma / self.validos if self.validos else np.nan
+
+    @property
+    def desvio(self) -> float:
+        if self.validos < 2:
+            return np.nan
+        return float(np.sqrt(max(self.suma2 - self.suma * self.media, 0.0) / (self.validos - 1)))
+
+    def cuantiles(self, qs=(0.05, 0.25, 0.5, 0.75, 0.95)) -> pd.Series:
+        """Cuantiles interpolados linealmente dentro de cada intervalo del histograma."""
+        # Los desbordes se asignan a [mínimo, borde inicial] y [borde final, máximo].
+        puntos = np.concatenate([[min(self.minimo, self.bordes[0])], self.bordes,
+                                 [max(self.maximo, self.bordes[-1])]])
+        acumulado = np.concatenate([[0], np.cumsum(self.conteos)]) / max(self.validos, 1)
+        valores = np.clip(np.interp(qs, acumulado, puntos), self.minimo, self.maximo)
+        return pd.Series(valores, index=pd.Index(qs, name="Cuantil"), name="Y*")
+
+    def histograma(self) -> pd.DataFrame:
+        """Frecuencia relativa de cada intervalo (sin los desbordes)."""
+        centros = (self.bordes[:-1] + self.bordes[1:]) / 2
+        return pd.DataFrame({"Y*": centros, "Frecuencia": self.conteos[1:-1] / max(self.validos, 1)})
+
+    def tabla(self) -> pd.DataFrame:
+        filas = {"Sorteos": self.sorteos, "Con equilibrio": self.validos,
+                 "Media": self.media, "Desvío": self.desvio, "Mínimo": self.minimo, "Máximo": self.maximo}
+        filas.update({f"Cuantil {q:.0%}": v for q, v in self.cuantiles().items()})
+        return pd.DataFrame.from_dict(filas, orient='index', columns=['Valor'])
+
+
+def bordes_piloto(especificacion: dict, intervalos: int = INTERVALOS, semilla: int = 0) -> np.ndarray:
+    """Bordes del histograma a partir de una muestra chica, con margen para las colas."""
+    Y = equilibrio(**sortear(especificacion, MUESTRA_PILOTO, np.random.default_rng(semilla))).Y
+    bajo, alto = np.nanquantile(Y, [0.0005, 0.9995])
+    margen = 0.25 * (alto - bajo) or 1.0
+    return np.linspace(bajo - margen, alto + margen, intervalos + 1)
+
+
+def _simular_bloque(especificacion: dict, n: int, semilla: np.random.SeedSequence,
+                    bordes: np.ndarray) -> ResultadoMC:
+    sorteos = sortear(especificacion, n, np.random.default_rng(semilla))
+    return ResultadoMC.de_valores(np.broadcast_to(equilibrio(**sorteos).Y, (n,)), bordes)
+
+
+def simular_por_bloques(especificacion: dict, n: int, bloque: int = BLOQUE, procesos: int | None = None,
+                        semilla: int = 0, bordes: np.ndarray | None = None) -> Iterator[ResultadoMC]:
+    """Entrega el resultado acumulado cada vez que termina un bloque.
+
+    ``procesos=1`` resuelve todo en el proceso actual. Con la misma semilla el
+    resultado final no depende de ``procesos`` ni del orden de llegada.
+    """
+    _validar(especificacion)
+    if bordes is None:
+        bordes = bordes_piloto(especificacion, semilla=semilla)
+    tamanios = [min(bloque, n - i) for i in range(0, n, bloque)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanios))
+    total = ResultadoMC.vacio(bordes)
+
+    procesos = procesos or min(os.cpu_count() or 1, len(tamanios))
+    if procesos <= 1:
+        for tamanio, s in zip(tamanios, semillas):
+            total = total.combinar(_simular_bloque(especificacion, tamanio, s, bordes))
+            yield total
+        return
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(_simular_bloque, especificacion, tamanio, s, bordes)
+                   for tamanio, s in zip(tamanios, semillas)]
+        for futuro in as_completed(futuros):
+            total = total.combinar(futuro.result())
+            yield total
+
+
+def simular(especificacion: dict, n: int, **kwargs) -> ResultadoMC:
+    """Resultado final de ``simular_por_bloques``."""
+    for total in simular_por_bloques(especificacion, n, **kwargs):
+        pass
+    return total
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python montecarlo.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import resource
+    import time
+
+    espec = {"C0": ("normal", 100, 10), "c": ("uniforme", 0.7, 0.9), "I": ("triangular", 30, 50, 80),
+             "G": 100, "T0": ("normal", 50, 5), "t": ("normal", 0.15, 0.02)}
+    n = 10_000_000
+
+    for procesos in (1, None):
+        t0 = time.perf_counter()
+        for total in simular_por_bloques(espec, n, procesos=procesos):
+            print(f"\r  {total.sorteos / n:4.0%}", end="", flush=True)
+        print(f"\r{n:,} sorteos, procesos={procesos or os.cpu_count()}: {time.perf_counter() - t0:.2f} s")
+    print(total.tabla().round(2).to_string())
+
+    exacto = np.quantile(equilibrio(**sortear(espec, 2_000_000, np.random.default_rng(1))).Y, [0.05, 0.5, 0.95])
+    print("cuantiles 5/50/95 % (histograma vs. muestra exacta de 2M):",
+          total.cuantiles([0.05, 0.5, 0.95]).round(2).tolist(), exacto.round(2).tolist())
+    print(f"memoria máxima: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
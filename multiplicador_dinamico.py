@@ -0,0 +1,103 @@
+"""Mecanismo multiplicador ronda por ronda.
+
+Un cambio en el gasto autónomo ΔA (ΔC0 + ΔI + ΔG - c ΔT0) se propaga en
+rondas sucesivas de gasto: cada ronda genera ingreso, de ese ingreso se paga
+una proporción t de impuestos y de lo que queda se consume una fracción c.
+
+    ΔY_0 = ΔA,   ΔY_n = r ΔY_{n-1} = r^n ΔA,   r = c (1 - t)
+
+La suma de las rondas converge a k ΔA, el resultado cerrado de
+``modelo_keynesiano.equilibrio``. ``rondas`` es un generador que entrega una
+ronda por vez (para ir dibujándolas) y se detiene cuando el incremento de la
+ronda cae por debajo de ``tol``. Los parámetros aceptan arreglos: con
+varios shocks a la vez cada ronda es un vector y el proceso termina cuando
+convergieron todos.
+
+Ejecutar ``python multiplicador_dinamico.py`` mide el caso vectorizado.
+"""
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from modelo_keynesiano import equilibrio
+
+TOLERANCIA = 0.01
+MAX_RONDAS = 500
+
+
+@dataclass
+class Ronda:
+    n: int
+    incremento: np.ndarray   # ΔY_n
+    acumulado: np.ndarray    # ΔY_0 + … + ΔY_n
+    impuestos: np.ndarray    # t ΔY_n recaudado en la ronda
+    consumo: np.ndarray      # c (1 - t) ΔY_n, que origina la ronda siguiente
+
+
+def shock_autonomo(c, dC0=0.0, dI=0.0, dG=0.0, dT0=0.0):
+    """ΔA: variación del gasto autónomo que inicia el proceso."""
+    return equilibrio(dC0, c, dI, dG, T0=dT0).A
+
+
+def rondas(dA, c, t=0.0, tol: float = TOLERANCIA, max_rondas: int = MAX_RONDAS) -> Iterator[Ronda]:
+    """Genera las rondas del multiplicador hasta que ``|ΔY_n| < tol`` en todos los shocks.
+
+    Si ``c (1 - t) >= 1`` el proceso no converge y se corta en ``max_rondas``.
+    """
+    dA, c, t = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (dA, c, t)))
+    r = c * (1 - t)
+    incremento = dA.copy()
+    acumulado = np.zeros_like(incremento)
+    for n in range(max_rondas):
+        acumulado += incremento
+        siguiente = r * incremento
+        yield Ronda(n, incremento, acumulado.copy(), t * incremento, siguiente)
+        if np.all(np.abs(incremento) < tol):
+            return
+        incremento = siguiente
+
+
+def proceso(dA, c, t=0.0, tol: float = TOLERANCIA, max_rondas: int = MAX_RONDAS) -> pd.DataFrame:
+    """Todas las rondas de un único shock como tabla."""
+    filas = [
+        (r.n, float(r.incremento), float(r.acumulado), float(r.impuestos), float(r.consumo))
+        for r in rondas(dA, c, t, tol, max_rondas)
+    ]
+    return pd.DataFrame(filas, columns=["Ronda", "ΔY", "ΔY acumulado", "Impuestos", "Consumo inducido"]
+                        ).set_index("Ronda")
+
+
+def trayectorias(dA, c, t=0.0, tol: float = TOLERANCIA, max_rondas: int = MAX_RONDAS) -> np.ndarray:
+    """ΔY acumulado de cada shock, forma ``(rondas, shocks)``."""
+    return np.stack([r.acumulado for r in rondas(dA, c, t, tol, max_rondas)])
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python multiplicador_dinamico.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    c = rng.uniform(0.1, 0.9, n)
+    t = rng.uniform(0, 0.5, n)
+    dA = shock_autonomo(c, dG=rng.uniform(-200, 200, n), dT0=rng.uniform(-100, 100, n))
+
+    t0 = time.perf_counter()
+    camino = trayectorias(dA, c, t)
+    t_vector = time.perf_counter() - t0
+
+    m = 2_000
+    t0 = time.perf_counter()
+    for i in range(m):
+        proceso(dA[i], c[i], t[i])
+    t_escalar = (time.perf_counter() - t0) * n / m
+
+    cerrado = equilibrio(0, c, 0, dA, t=t).Y
+    assert np.allclose(camino[-1], cerrado, atol=TOLERANCIA * 10)
+    print(f"{n:,} shocks, {len(camino)} rondas: vectorizado {t_vector * 1e3:.0f} ms · "
+          f"uno por uno ≈ {t_escalar:.1f} s (extrapolado) · "
+          f"máx. desvío vs. k ΔA {np.abs(camino[-1] - cerrado).max():.4f}")
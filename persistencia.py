@@ -0,0 +1,134 @@
+"""Escritura segura de las series en disco.
+
+Los archivos se escriben primero en un temporal dentro de la misma carpeta y
+luego se renombran sobre el destino, de modo que quien lea nunca vea un
+archivo a medio escribir. Además cada escritura toma un bloqueo de archivo
+(``.<nombre>.lock``) que excluye a otros procesos, por ejemplo varias sesiones
+de Streamlit actualizando la misma serie. Para operaciones de leer-modificar-
+escribir se puede envolver todo en ``with bloqueo(ruta):``; el bloqueo es
+reentrante dentro del mismo hilo.
+
+Ejecutar ``python persistencia.py`` martilla un mismo archivo desde varios
+procesos y verifica que no se pierdan escrituras.
+"""
+import os
+import pathlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Callable
+
+import pandas as pd
+
+if os.name == "nt":
+    import msvcrt
+
+    def _tomar(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:  # LK_LOCK se rinde tras ~10 s; se reintenta
+                continue
+
+    def _soltar(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _tomar(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _soltar(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _Bloqueo:
+    def __init__(self):
+        self.hilos = threading.RLock()
+        self.nivel = 0
+        self.fd = -1
+
+
+_bloqueos: dict[str, _Bloqueo] = {}
+_bloqueos_mutex = threading.Lock()
+
+
+@contextmanager
+def bloqueo(ruta: pathlib.Path):
+    """Bloqueo exclusivo entre hilos y procesos asociado a ``ruta``."""
+    ruta = pathlib.Path(ruta).resolve()
+    with _bloqueos_mutex:
+        b = _bloqueos.setdefault(str(ruta), _Bloqueo())
+    with b.hilos:
+        if b.nivel == 0:
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            b.fd = os.open(ruta.with_name(f".{ruta.name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+            _tomar(b.fd)
+        b.nivel += 1
+        try:
+            yield
+        finally:
+            b.nivel -= 1
+            if b.nivel == 0:
+                _soltar(b.fd)
+                os.close(b.fd)
+
+
+def escribir_atomico(ruta: pathlib.Path, escribir: Callable[[str], None]) -> None:
+    """Llama a ``escribir(tmp)`` sobre un temporal y lo renombra a ``ruta``."""
+    ruta = pathlib.Path(ruta)
+    with bloqueo(ruta):
+        fd, tmp = tempfile.mkstemp(dir=ruta.parent, prefix=f".{ruta.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            escribir(tmp)
+            os.replace(tmp, ruta)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def guardar_atomico(df: pd.DataFrame, ruta: pathlib.Path) -> None:
+    """Guarda ``df`` como CSV en ``ruta`` mediante archivo temporal + rename."""
+    escribir_atomico(ruta, lambda tmp: df.to_csv(tmp, index=False, encoding="utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# PRUEBA DE CARGA: python persistencia.py
+# ---------------------------------------------------------------------------
+
+def _martillar(ruta: str, proceso: int, escrituras: int) -> None:
+    """Agrega ``escrituras`` filas a ``ruta`` con leer-modificar-escribir."""
+    for i in range(escrituras):
+        with bloqueo(ruta):
+            df = pd.read_csv(ruta)
+            fila = pd.DataFrame({"proceso": [proceso], "escritura": [i]})
+            guardar_atomico(pd.concat([df, fila], ignore_index=True), ruta)
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    import time
+
+    procesos, escrituras = 8, 50
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = pathlib.Path(tmp) / "serie.csv"
+        guardar_atomico(pd.DataFrame(columns=["proceso", "escritura"]), ruta)
+        t0 = time.perf_counter()
+        trabajos = [
+            multiprocessing.Process(target=_martillar, args=(str(ruta), p, escrituras))
+            for p in range(procesos)
+        ]
+        for t in trabajos:
+            t.start()
+        for t in trabajos:
+            t.join()
+        final = pd.read_csv(ruta)
+        esperadas = procesos * escrituras
+        print(f"{len(final)} filas de {esperadas} esperadas en {time.perf_counter() - t0:.2f} s")
+        assert len(final) == esperadas, "se perdieron escrituras"
+        assert not final.duplicated().any(), "hay filas duplicadas"
+        assert not list(pathlib.Path(tmp).glob("*.tmp")), "quedaron temporales"
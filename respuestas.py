@@ -0,0 +1,635 @@
+"""Almacenamiento de las respuestas de los estudiantes.
+
+``save_response`` agregaba filas a ``respuestas.csv`` con ``to_csv(mode="a")``
+y decidía si escribir el encabezado con ``os.path.exists``: con varios envíos
+simultáneos las filas se podían intercalar y el encabezado repetirse. Acá el
+almacén es intercambiable:
+
+* ``RespuestasSQLite`` (por defecto): base SQLite en modo WAL; los lectores no
+  bloquean a quien escribe y cada lote entra en una sola transacción.
+* ``RespuestasCSV``: el CSV de siempre, pero cada lote se agrega bajo el
+  bloqueo de ``persistencia`` y el encabezado se decide dentro del bloqueo.
+
+``ColaEscritura`` se pone delante de cualquiera de los dos: ``guardar``
+encola y vuelve enseguida, y un hilo escritor junta lo pendiente en lotes de
+hasta ``max_lote`` filas. Así un curso entero enviando a la vez se resuelve
+en pocas transacciones en lugar de cientos. ``guardar`` devuelve un
+``Future`` que se completa recién cuando la fila quedó escrita: si un lote
+falla se reintenta y, si sigue fallando, el error llega a quien guardó en
+lugar de perderse la respuesta.
+
+``exportar`` escribe el archivo de descarga por bloques (filtrado por
+nombre y sección, en CSV, CSV comprimido o ZIP) sin cargar toda la tabla;
+el tablero lo llama recién cuando se pide la descarga.
+
+Para la vista del docente, ``resumen``, ``actividad`` y ``buscar`` agregan
+por estudiante o sección, cuentan envíos por hora o día y buscan texto. En
+SQLite se resuelven con índices ``(nombre, seccion, fecha)``,
+``(seccion, nombre, fecha)`` y ``(fecha)`` y con un índice de texto completo
+FTS5 que mantienen los triggers, así no se relee la tabla entera; el CSV
+hace lo mismo con pandas sobre el archivo completo.
+
+Ejecutar ``python respuestas.py`` simula un curso completo enviando a la vez
+(hilos de varias sesiones y varios procesos de Streamlit) y verifica que no
+se pierda ninguna respuesta.
+"""
+import atexit
+import contextlib
+from concurrent.futures import Future
+import gzip
+import os
+import pathlib
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+import zipfile
+
+import pandas as pd
+
+from persistencia import bloqueo
+
+COLUMNAS = ["Fecha", "Nombre", "Seccion", "Respuesta"]
+_COLUMNAS_ANTERIORES = ["Nombre", "Seccion", "Respuesta"]  # respuestas.csv antes de este módulo
+MAX_LOTE = 500
+REINTENTOS = 3
+ESPERA_REINTENTO = 0.05  # segundos; se duplica en cada reintento
+BLOQUE_EXPORTACION = 5_000
+# formato -> (nombre del archivo, tipo MIME)
+FORMATOS_EXPORTACION = {
+    "csv": ("respuestas.csv", "text/csv"),
+    "csv.gz": ("respuestas.csv.gz", "application/gzip"),
+    "zip": ("respuestas.zip", "application/zip"),
+}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS respuestas (
+    id INTEGER PRIMARY KEY,
+    fecha REAL NOT NULL,
+    nombre TEXT NOT NULL,
+    seccion TEXT NOT NULL,
+    respuesta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS respuestas_nombre ON respuestas (nombre, seccion, fecha);
+CREATE INDEX IF NOT EXISTS respuestas_seccion ON respuestas (seccion, nombre, fecha);
+CREATE INDEX IF NOT EXISTS respuestas_fecha ON respuestas (fecha);
+CREATE VIRTUAL TABLE IF NOT EXISTS respuestas_fts USING fts5(
+    respuesta, content='respuestas', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS respuestas_fts_alta AFTER INSERT ON respuestas BEGIN
+    INSERT INTO respuestas_fts (rowid, respuesta) VALUES (new.id, new.respuesta);
+END;
+CREATE TRIGGER IF NOT EXISTS respuestas_fts_baja AFTER DELETE ON respuestas BEGIN
+    INSERT INTO respuestas_fts (respuestas_fts, rowid, respuesta) VALUES ('delete', old.id, old.respuesta);
+END;
+"""
+# alias de pandas -> segundos, para agrupar la actividad
+FRECUENCIAS = {"h": 3600, "D": 86400}
+LIMITE_BUSQUEDA = 100
+_OTRA = {"Nombre": "Seccion", "Seccion": "Nombre"}
+_CONTEO = {"Nombre": "Secciones", "Seccion": "Estudiantes"}
+
+
+def _resuelto(valor=None, error: Exception | None = None) -> Future:
+    futuro = Future()
+    if error is not None:
+        futuro.set_exception(error)
+    else:
+        futuro.set_result(valor)
+    return futuro
+
+
+class AlmacenRespuestas:
+    """Interfaz común: ``guardar_lote`` escribe filas ``(fecha, nombre, seccion, respuesta)``."""
+
+    def guardar(self, nombre: str, seccion: str, texto: str) -> Future:
+        """``result()`` es True con la fila escrita, False si el texto estaba vacío; si falló, lanza el error."""
+        if not texto.strip():
+            return _resuelto(False)
+        try:
+            self.guardar_lote([(time.time(), nombre, seccion, texto)])
+        except Exception as exc:
+            return _resuelto(error=exc)
+        return _resuelto(True)
+
+    def guardar_lote(self, filas: list[tuple]) -> None:
+        raise NotImplementedError
+
+    def leer(self) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def leer_bloques(self, nombres=None, secciones=None, bloque: int = BLOQUE_EXPORTACION):
+        """Respuestas de ``nombres``/``secciones`` (None = todas) en DataFrames de hasta ``bloque`` filas."""
+        df = _filtrar(self.leer(), nombres, secciones)
+        for inicio in range(0, len(df), bloque):
+            yield df.iloc[inicio:inicio + bloque]
+
+    def valores(self, columna: str) -> list[str]:
+        """Valores distintos de ``Nombre`` o ``Seccion``, ordenados (para los filtros)."""
+        return sorted(self.leer()[columna].unique())
+
+    def cantidad(self) -> int:
+        return len(self.leer())
+
+    def resumen(self, por: str = "Nombre") -> pd.DataFrame:
+        """Respuestas, secciones (o estudiantes) distintos, primera y última por ``Nombre`` o ``Seccion``."""
+        tabla = self.leer().groupby(por).agg(
+            Respuestas=("Respuesta", "size"), **{_CONTEO[por]: (_OTRA[por], "nunique")},
+            Primera=("Fecha", "min"), Última=("Fecha", "max"),
+        )
+        return tabla.sort_values("Respuestas", ascending=False)
+
+    def actividad(self, frecuencia: str = "D") -> pd.DataFrame:
+        """Envíos por período (``FRECUENCIAS``) y sección; una columna por sección."""
+        df = self.leer()
+        tabla = df.groupby([df["Fecha"].dt.floor(frecuencia), "Seccion"]).size().unstack(fill_value=0)
+        tabla.columns.name = None
+        return tabla
+
+    def buscar(self, texto: str, limite: int = LIMITE_BUSQUEDA) -> pd.DataFrame:
+        """Respuestas que contienen todas las palabras de ``texto`` (las más recientes primero)."""
+        df = self.leer().iloc[::-1]
+        for palabra in texto.split():
+            df = df[df["Respuesta"].str.contains(palabra, case=False, regex=False)]
+        return df.head(limite).rename(columns={"Respuesta": "Fragmento"}).reset_index(drop=True)
+
+    def vaciar(self) -> None:
+        """Espera a que lo encolado esté escrito (sin cola no hay nada pendiente)."""
+
+    def importar_csv(self, ruta_csv: pathlib.Path) -> int:
+        """Pasa al almacén un ``respuestas.csv`` del formato anterior; sólo lo hace SQLite (acá, 0)."""
+        return 0
+
+
+def _filtrar(df: pd.DataFrame, nombres, secciones) -> pd.DataFrame:
+    if nombres is not None:
+        df = df[df["Nombre"].isin(nombres)]
+    if secciones is not None:
+        df = df[df["Seccion"].isin(secciones)]
+    return df
+
+
+class RespuestasSQLite(AlmacenRespuestas):
+    def __init__(self, ruta: pathlib.Path):
+        self.ruta = pathlib.Path(ruta)
+        self.ruta.parent.mkdir(parents=True, exist_ok=True)
+        with self._conectar() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            sin_fts = con.execute("SELECT 1 FROM sqlite_master WHERE name = 'respuestas_fts'").fetchone() is None
+            con.executescript(_ESQUEMA)
+            if sin_fts:  # base creada antes del índice de texto: indexar lo que ya había
+                con.execute("INSERT INTO respuestas_fts (respuestas_fts) VALUES ('rebuild')")
+
+    def _conectar(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.ruta, timeout=30)
+        con.execute("PRAGMA synchronous=NORMAL")  # en WAL sigue siendo seguro ante caídas del proceso
+        return con
+
+    def guardar_lote(self, filas: list[tuple]) -> None:
+        with self._conectar() as con:
+            con.executemany(
+                "INSERT INTO respuestas (fecha, nombre, seccion, respuesta) VALUES (?, ?, ?, ?)", filas
+            )
+
+    def leer(self) -> pd.DataFrame:
+        with self._conectar() as con:
+            df = pd.read_sql_query("SELECT fecha, nombre, seccion, respuesta FROM respuestas ORDER BY id", con)
+        df.columns = COLUMNAS
+        df["Fecha"] = pd.to_datetime(df["Fecha"], unit="s")
+        return df
+
+    def leer_bloques(self, nombres=None, secciones=None, bloque: int = BLOQUE_EXPORTACION):
+        condiciones, argumentos = [], []
+        for columna, permitidos in (("nombre", nombres), ("seccion", secciones)):
+            if permitidos is not None:
+                permitidos = list(permitidos)
+                condiciones.append(f"{columna} IN ({', '.join('?' * len(permitidos))})")
+                argumentos += permitidos
+        donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        consulta = f"SELECT fecha, nombre, seccion, respuesta FROM respuestas {donde} ORDER BY id"
+        with contextlib.closing(self._conectar()) as con:
+            for df in pd.read_sql_query(consulta, con, params=argumentos, chunksize=bloque):
+                df.columns = COLUMNAS
+                df["Fecha"] = pd.to_datetime(df["Fecha"], unit="s")
+                yield df
+
+    def valores(self, columna: str) -> list[str]:
+        columna = {"Nombre": "nombre", "Seccion": "seccion"}[columna]
+        with self._conectar() as con:
+            return [v for (v,) in con.execute(f"SELECT DISTINCT {columna} FROM respuestas ORDER BY {columna}")]
+
+    def cantidad(self) -> int:
+        with self._conectar() as con:
+            return con.execute("SELECT COUNT(*) FROM respuestas").fetchone()[0]
+
+    def _consultar(self, consulta: str, argumentos=()) -> pd.DataFrame:
+        with contextlib.closing(self._conectar()) as con:
+            return pd.read_sql_query(consulta, con, params=list(argumentos))
+
+    def resumen(self, por: str = "Nombre") -> pd.DataFrame:
+        columna, otra = {"Nombre": ("nombre", "seccion"), "Seccion": ("seccion", "nombre")}[por]
+        tabla = self._consultar(
+            f"SELECT {columna} AS {por}, COUNT(*) AS Respuestas, COUNT(DISTINCT {otra}) AS {_CONTEO[por]}, "
+            f"MIN(fecha) AS Primera, MAX(fecha) AS Última FROM respuestas GROUP BY {columna} "
+            f"ORDER BY Respuestas DESC"
+        ).set_index(por)
+        for col in ("Primera", "Última"):
+            tabla[col] = pd.to_datetime(tabla[col], unit="s")
+        return tabla
+
+    def actividad(self, frecuencia: str = "D") -> pd.DataFrame:
+        paso = FRECUENCIAS[frecuencia]
+        largo = self._consultar(
+            "SELECT CAST(fecha / ? AS INTEGER) * ? AS Fecha, seccion AS Seccion, COUNT(*) AS n "
+            "FROM respuestas GROUP BY 1, 2", (paso, paso)
+        )
+        largo["Fecha"] = pd.to_datetime(largo["Fecha"], unit="s")
+        tabla = largo.pivot(index="Fecha", columns="Seccion", values="n").fillna(0).astype(int)
+        tabla.columns.name = None
+        return tabla
+
+    def buscar(self, texto: str, limite: int = LIMITE_BUSQUEDA) -> pd.DataFrame:
+        """Búsqueda FTS5 ordenada por relevancia; cada palabra vale también como prefijo."""
+        palabras = texto.split()
+        if not palabras:
+            return pd.DataFrame(columns=["Fecha", "Nombre", "Seccion", "Fragmento"])
+        consulta = " ".join('"' + p.replace('"', '""') + '"*' for p in palabras)
+        df = self._consultar(
+            "SELECT r.fecha AS Fecha, r.nombre AS Nombre, r.seccion AS Seccion, "
+            "snippet(respuestas_fts, 0, '**', '**', '…', 16) AS Fragmento "
+            "FROM respuestas_fts JOIN respuestas r ON r.id = respuestas_fts.rowid "
+            "WHERE respuestas_fts MATCH ? ORDER BY rank LIMIT ?", (consulta, limite)
+        )
+        df["Fecha"] = pd.to_datetime(df["Fecha"], unit="s")
+        return df
+
+    def importar_csv(self, ruta_csv: pathlib.Path) -> int:
+        """Pasa un ``respuestas.csv`` anterior a la base y lo renombra a ``.importado``.
+
+        Las filas viejas no tienen fecha: se les pone la de modificación del
+        archivo. Como el formato anterior podía intercalar filas y repetir el
+        encabezado, se descartan las líneas con otra cantidad de campos, las
+        incompletas y las que repiten el encabezado. Si el archivo no se
+        puede leer se lanza el error y el CSV queda donde estaba. Devuelve
+        las filas importadas (0 si no había archivo).
+        """
+        ruta_csv = pathlib.Path(ruta_csv)
+        with bloqueo(self.ruta):
+            if not ruta_csv.exists():
+                return 0
+            # Con ``names`` el encabezado entra como una fila más (se descarta abajo) y una fila
+            # con campos de más nunca se toma como índice: siempre es una línea dañada.
+            previo = pd.read_csv(ruta_csv, encoding="utf-8", encoding_errors="replace", dtype=str,
+                                 header=None, names=_COLUMNAS_ANTERIORES, on_bad_lines="skip")
+            previo = previo.dropna()
+            previo = previo[~(previo == _COLUMNAS_ANTERIORES).all(axis=1)]
+            fecha = ruta_csv.stat().st_mtime
+            filas = [(fecha, n, s, r) for n, s, r in previo.itertuples(index=False)]
+            self.guardar_lote(filas)
+            ruta_csv.rename(ruta_csv.with_name(ruta_csv.name + ".importado"))
+        return len(filas)
+
+
+class RespuestasCSV(AlmacenRespuestas):
+    def __init__(self, ruta: pathlib.Path):
+        self.ruta = pathlib.Path(ruta)
+
+    def guardar_lote(self, filas: list[tuple]) -> None:
+        lote = pd.DataFrame(filas, columns=COLUMNAS)
+        lote["Fecha"] = pd.to_datetime(lote["Fecha"], unit="s")
+        with bloqueo(self.ruta):
+            encabezado = not self.ruta.exists() or self.ruta.stat().st_size == 0
+            lote.to_csv(self.ruta, mode="a", header=encabezado, index=False, encoding="utf-8")
+
+    def leer(self) -> pd.DataFrame:
+        if not self.ruta.exists():
+            return pd.DataFrame(columns=COLUMNAS)
+        with bloqueo(self.ruta):
+            return pd.read_csv(self.ruta, encoding="utf-8", parse_dates=["Fecha"])
+
+    def leer_bloques(self, nombres=None, secciones=None, bloque: int = BLOQUE_EXPORTACION):
+        if not self.ruta.exists():
+            return
+        with bloqueo(self.ruta):
+            for df in pd.read_csv(self.ruta, encoding="utf-8", parse_dates=["Fecha"], chunksize=bloque):
+                df = _filtrar(df, nombres, secciones)
+                if len(df):
+                    yield df
+
+
+BACKENDS = {"sqlite": RespuestasSQLite, "csv": RespuestasCSV}
+
+
+class ColaEscritura(AlmacenRespuestas):
+    """Envoltorio con escritura asincrónica por lotes sobre otro almacén.
+
+    Cada llamada a ``guardar_lote`` es un envío con su ``Future``; un envío
+    nunca se parte entre dos lotes. Si escribir un lote falla, se reintenta
+    ``reintentos`` veces con espera creciente; si no hay caso, cada envío
+    del lote termina con la excepción y ésta queda también en ``errores``.
+    """
+
+    def __init__(self, almacen: AlmacenRespuestas, max_lote: int = MAX_LOTE, reintentos: int = REINTENTOS,
+                 espera_reintento: float = ESPERA_REINTENTO):
+        self.almacen = almacen
+        self.max_lote = max_lote
+        self.reintentos = reintentos
+        self.espera_reintento = espera_reintento
+        self.errores: list[Exception] = []
+        self._cola: queue.Queue = queue.Queue()
+        self._hilo = threading.Thread(target=self._escribir, name="escritor-respuestas", daemon=True)
+        self._hilo.start()
+        atexit.register(self.vaciar)
+
+    def guardar(self, nombre: str, seccion: str, texto: str) -> Future:
+        if not texto.strip():
+            return _resuelto(False)
+        return self.guardar_lote([(time.time(), nombre, seccion, texto)])
+
+    def guardar_lote(self, filas: list[tuple]) -> Future:
+        futuro = Future()
+        self._cola.put((list(filas), futuro))
+        return futuro
+
+    def _escribir(self) -> None:
+        while True:
+            envios = [self._cola.get()]
+            filas = list(envios[0][0])
+            while len(filas) < self.max_lote:
+                try:
+                    envio = self._cola.get_nowait()
+                except queue.Empty:
+                    break
+                envios.append(envio)
+                filas += envio[0]
+            try:
+                self._escribir_lote(filas)
+            except Exception as exc:  # el error va a cada envío: nadie ve "guardada" sin estarlo
+                self.errores.append(exc)
+                for _, futuro in envios:
+                    futuro.set_exception(exc)
+            else:
+                for _, futuro in envios:
+                    futuro.set_result(True)
+            finally:
+                for _ in envios:
+                    self._cola.task_done()
+
+    def _escribir_lote(self, filas: list[tuple]) -> None:
+        for intento in range(self.reintentos + 1):
+            try:
+                self.almacen.guardar_lote(filas)
+                return
+            except Exception:
+                if intento == self.reintentos:
+                    raise
+                time.sleep(self.espera_reintento * 2 ** intento)
+
+    def vaciar(self) -> None:
+        self._cola.join()
+
+    def importar_csv(self, ruta_csv: pathlib.Path) -> int:
+        self.vaciar()
+        return self.almacen.importar_csv(ruta_csv)
+
+    def leer(self) -> pd.DataFrame:
+        self.vaciar()
+        return self.almacen.leer()
+
+    def leer_bloques(self, nombres=None, secciones=None, bloque: int = BLOQUE_EXPORTACION):
+        self.vaciar()
+        return self.almacen.leer_bloques(nombres, secciones, bloque)
+
+    def valores(self, columna: str) -> list[str]:
+        self.vaciar()
+        return self.almacen.valores(columna)
+
+    def cantidad(self) -> int:
+        self.vaciar()
+        return self.almacen.cantidad()
+
+    def resumen(self, por: str = "Nombre") -> pd.DataFrame:
+        self.vaciar()
+        return self.almacen.resumen(por)
+
+    def actividad(self, frecuencia: str = "D") -> pd.DataFrame:
+        self.vaciar()
+        return self.almacen.actividad(frecuencia)
+
+    def buscar(self, texto: str, limite: int = LIMITE_BUSQUEDA) -> pd.DataFrame:
+        self.vaciar()
+        return self.almacen.buscar(texto, limite)
+
+
+def crear_almacen_respuestas(ruta: pathlib.Path, formato: str = "sqlite", cola: bool = True) -> AlmacenRespuestas:
+    """Almacén ``formato`` en ``ruta``, detrás de una ``ColaEscritura`` salvo ``cola=False``."""
+    if formato not in BACKENDS:
+        raise ValueError(f"Formato desconocido: {formato!r} (opciones: {', '.join(BACKENDS)})")
+    almacen = BACKENDS[formato](ruta)
+    return ColaEscritura(almacen) if cola else almacen
+
+
+def exportar(almacen: AlmacenRespuestas, destino, formato: str = "csv", nombres=None, secciones=None,
+             bloque: int = BLOQUE_EXPORTACION) -> int:
+    """Escribe las respuestas filtradas en el archivo binario ``destino``, bloque por bloque.
+
+    ``formato`` es una clave de ``FORMATOS_EXPORTACION``; en ``zip`` el CSV va
+    adentro como ``respuestas.csv``. Devuelve la cantidad de filas escritas.
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f"Formato desconocido: {formato!r} (opciones: {', '.join(FORMATOS_EXPORTACION)})")
+    filas = 0
+    with contextlib.ExitStack() as pila:
+        if formato == "csv.gz":
+            salida = pila.enter_context(gzip.GzipFile(fileobj=destino, mode="wb"))
+        elif formato == "zip":
+            archivo = pila.enter_context(zipfile.ZipFile(destino, "w", compression=zipfile.ZIP_DEFLATED))
+            salida = pila.enter_context(archivo.open(FORMATOS_EXPORTACION["csv"][0], "w"))
+        else:
+            salida = destino
+        for df in almacen.leer_bloques(nombres, secciones, bloque):
+            if df.empty:  # sin filas, read_sql_query igual devuelve un bloque vacío
+                continue
+            salida.write(df.to_csv(index=False, header=filas == 0).encode("utf-8"))
+            filas += len(df)
+        if filas == 0:
+            salida.write((",".join(COLUMNAS) + "\n").encode("utf-8"))
+    return filas
+
+
+def archivo_exportado(almacen: AlmacenRespuestas, formato: str = "csv", nombres=None, secciones=None):
+    """``exportar`` a un archivo temporal (en memoria mientras es chico) listo para leer desde el principio."""
+    destino = tempfile.SpooledTemporaryFile(max_size=8 * 2**20)
+    exportar(almacen, destino, formato, nombres, secciones)
+    destino.seek(0)
+    return destino
+
+
+# ---------------------------------------------------------------------------
+# PRUEBA DE CARGA: python respuestas.py
+# ---------------------------------------------------------------------------
+
+class _AlmacenQueFalla(AlmacenRespuestas):
+    """Para la prueba: las primeras ``fallas`` escrituras lanzan ``OSError``, después escribe en ``almacen``."""
+
+    def __init__(self, almacen: AlmacenRespuestas, fallas: int):
+        self.almacen = almacen
+        self.fallas = fallas
+
+    def guardar_lote(self, filas: list[tuple]) -> None:
+        if self.fallas > 0:
+            self.fallas -= 1
+            raise OSError("disco lleno (simulado)")
+        self.almacen.guardar_lote(filas)
+
+    def leer(self) -> pd.DataFrame:
+        return self.almacen.leer()
+
+
+def _probar_fallas(tmp: pathlib.Path) -> None:
+    """Una falla pasajera se reintenta sin perder nada; una persistente llega a cada ``Future``."""
+    n = 200
+    destino = RespuestasSQLite(tmp / "fallas.sqlite")
+    pasajera = ColaEscritura(_AlmacenQueFalla(destino, fallas=2), espera_reintento=0.001)
+    futuros = [pasajera.guardar(f"alumno{i}", "Gráficos", f"respuesta {i}") for i in range(n)]
+    assert all(f.result(timeout=10) for f in futuros)
+    assert destino.cantidad() == n and len(pasajera.errores) == 0
+
+    persistente = ColaEscritura(_AlmacenQueFalla(destino, fallas=10**9), espera_reintento=0.001)
+    futuros = [persistente.guardar(f"alumno{i}", "Variaciones", f"respuesta {i}") for i in range(n)]
+    persistente.vaciar()
+    assert all(isinstance(f.exception(timeout=10), OSError) for f in futuros)   # todas avisadas
+    assert destino.cantidad() == n and persistente.errores
+    print(f"fallas: pasajera → {n} de {n} escritas tras reintentar; persistente → {n} de {n} envíos avisados")
+
+
+def _probar_importacion(tmp: pathlib.Path) -> None:
+    """Un ``respuestas.csv`` viejo con filas intercaladas se importa sin las dañadas; uno ilegible no se toca."""
+    viejo = tmp / "respuestas.csv"
+    viejo.write_text(
+        "Nombre,Seccion,Respuesta\n"
+        "ana,Gráficos,la inflación,Variaciones,sube\n"               # campos de más en la primera fila
+        "ana,Gráficos,\"sube, y después baja\"\n"
+        "beto,Variaciones,el ITCRM caeNombre,Seccion,Respuesta\n"  # dos envíos mezclados en una línea
+        "Nombre,Seccion,Respuesta\n"                                # encabezado repetido
+        "carla,Gráficos,la inflación,beto,Variaciones,se acelera\n"  # campos de más
+        "dani,Gráficos\n"                                           # fila cortada
+        "eva,Variaciones,depende del traspaso\n",
+        encoding="utf-8",
+    )
+    for almacen in (crear_almacen_respuestas(tmp / "importada.sqlite"),
+                    crear_almacen_respuestas(tmp / "importada.csv", "csv")):
+        importadas = almacen.importar_csv(viejo)
+        if isinstance(almacen.almacen, RespuestasCSV):
+            assert importadas == 0 and not viejo.exists()   # ya importado por SQLite: nada que hacer
+            continue
+        assert importadas == 2 and almacen.leer()["Nombre"].tolist() == ["ana", "eva"]
+        assert not viejo.exists() and viejo.with_name("respuestas.csv.importado").exists()
+
+    roto = tmp / "roto.csv"
+    roto.write_text('Nombre,Seccion,Respuesta\nana,Gráficos,"sin cerrar\n', encoding="utf-8")
+    try:
+        RespuestasSQLite(tmp / "roto.sqlite").importar_csv(roto)
+    except pd.errors.ParserError:
+        assert roto.exists()
+    else:
+        raise AssertionError("un CSV ilegible debería avisar el error")
+    print("importación: 2 de 7 filas válidas del CSV dañado; el ilegible avisa el error y queda en su lugar")
+
+
+def _proceso_streamlit(ruta: str, formato: str, estudiantes: int, envios: int, inicio: float) -> None:
+    """Un proceso del servidor: cada estudiante es una sesión (un hilo) que envía a la vez."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    almacen = crear_almacen_respuestas(pathlib.Path(ruta), formato)
+    nombre_proceso = os.getpid()
+
+    def estudiante(i: int) -> None:
+        for j in range(envios):  # como save_response: espera la confirmación antes del siguiente envío
+            assert almacen.guardar(f"alumno{nombre_proceso}-{i}@uni.edu", ("Gráficos", "Variaciones")[j % 2],
+                                   f"Respuesta {j}: el ITCRM cae cuando la inflación supera a la devaluación.").result()
+
+    while time.time() < inicio:  # todos los procesos arrancan juntos
+        time.sleep(0.001)
+    with ThreadPoolExecutor(max_workers=estudiantes) as pool:
+        list(pool.map(estudiante, range(estudiantes)))
+    almacen.vaciar()
+    if almacen.errores:
+        raise almacen.errores[0]
+
+
+if __name__ == "__main__":
+    import io
+    import multiprocessing
+    import tempfile
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _probar_fallas(pathlib.Path(tmp))
+        _probar_importacion(pathlib.Path(tmp))
+
+    procesos, estudiantes, envios = 4, 60, 10
+    esperadas = procesos * estudiantes * envios
+    for formato in BACKENDS:
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = pathlib.Path(tmp) / f"respuestas.{formato}"
+            inicio = time.time() + 1.0
+            hijos = [multiprocessing.Process(target=_proceso_streamlit,
+                                             args=(str(ruta), formato, estudiantes, envios, inicio))
+                     for _ in range(procesos)]
+            for p in hijos:
+                p.start()
+            for p in hijos:
+                p.join()
+            segundos = time.time() - inicio
+            leidas = crear_almacen_respuestas(ruta, formato, cola=False).leer()
+            assert all(p.exitcode == 0 for p in hijos), "algún proceso falló"
+            assert len(leidas) == esperadas, f"{formato}: {len(leidas)} de {esperadas} respuestas"
+            assert leidas["Nombre"].nunique() == procesos * estudiantes
+            print(f"{formato:6s}: {esperadas:,} respuestas de {procesos * estudiantes} estudiantes en "
+                  f"{procesos} procesos · {segundos:.2f} s · {esperadas / segundos:,.0f} respuestas/s")
+
+            almacen = crear_almacen_respuestas(ruta, formato, cola=False)
+            uno = leidas["Nombre"].iloc[0]
+            for formato_salida in FORMATOS_EXPORTACION:
+                t0 = time.perf_counter()
+                archivo = archivo_exportado(almacen, formato_salida)
+                t_todo = time.perf_counter() - t0
+                tamano = archivo.seek(0, os.SEEK_END)
+                t0 = time.perf_counter()
+                filtradas = exportar(almacen, io.BytesIO(), formato_salida, nombres=[uno])
+                t_uno = time.perf_counter() - t0
+                assert filtradas == envios
+                print(f"        exportar {formato_salida:6s}: {tamano / 1024:7.0f} KiB en {t_todo * 1e3:4.0f} ms · "
+                      f"un estudiante {t_uno * 1e3:4.0f} ms")
+
+    # Vista docente con varias cohortes: 50.000 respuestas de 2.000 estudiantes.
+    rng = np.random.default_rng(0)
+    vocabulario = np.array("inflación devaluación traspaso ITCRM PBI consumo inversión gasto multiplicador "
+                           "tasa interés demanda oferta exportaciones importaciones salario precios".split())
+    n = 50_000
+    filas = [(1.64e9 + f, f"alumno{e}@uni.edu", ("Gráficos", "Variaciones")[e % 2], " ".join(rng.choice(vocabulario, 12)))
+             for f, e in zip(np.sort(rng.uniform(0, 3 * 365 * 86400, n)), rng.integers(0, 2_000, n))]
+    consultas = {
+        "resumen por estudiante": lambda a: a.resumen("Nombre"),
+        "resumen por sección": lambda a: a.resumen("Seccion"),
+        "actividad diaria": lambda a: a.actividad("D"),
+        "búsqueda de texto": lambda a: a.buscar("traspaso multiplicador"),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        almacenes = {formato: crear_almacen_respuestas(pathlib.Path(tmp) / f"cohortes.{formato}", formato, cola=False)
+                     for formato in BACKENDS}
+        for almacen in almacenes.values():
+            almacen.guardar_lote(filas)
+        print(f"vista docente, {n:,} respuestas:")
+        for nombre, consulta in consultas.items():
+            tiempos = {}
+            for formato, almacen in almacenes.items():
+                t0 = time.perf_counter()
+                consulta(almacen)
+                tiempos[formato] = (time.perf_counter() - t0) * 1e3
+            print(f"        {nombre:24s}" + " · ".join(f"{f} {t:5.0f} ms" for f, t in tiempos.items()))
+        assert almacenes["sqlite"].resumen()["Respuestas"].sum() == n
+        assert almacenes["sqlite"].actividad().to_numpy().sum() == n
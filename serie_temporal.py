@@ -0,0 +1,67 @@
+"""Contenedor de series de tiempo con consultas por rango de fechas.
+
+Los tableros filtraban con ``df[(df["Fecha"] >= a) & (df["Fecha"] <= b)]``,
+que arma dos máscaras booleanas del largo de la serie en cada movimiento del
+slider. ``SerieTemporal`` ordena los datos una sola vez y responde cada rango
+con dos búsquedas binarias (``searchsorted``) y un corte por posición, sin
+copiar filas.
+
+Ejecutar ``python serie_temporal.py`` compara ambos métodos.
+"""
+import pandas as pd
+
+
+class SerieTemporal:
+    """DataFrame ordenado por ``columna_fecha`` con búsquedas por rango."""
+
+    def __init__(self, df: pd.DataFrame, columna_fecha: str = "Fecha"):
+        if not df[columna_fecha].is_monotonic_increasing:
+            df = df.sort_values(columna_fecha, kind="stable").reset_index(drop=True)
+        self.datos = df
+        self.columna_fecha = columna_fecha
+        self.indice = pd.DatetimeIndex(df[columna_fecha])
+
+    def __len__(self) -> int:
+        return len(self.datos)
+
+    @property
+    def inicio(self) -> pd.Timestamp:
+        return self.indice[0]
+
+    @property
+    def fin(self) -> pd.Timestamp:
+        return self.indice[-1]
+
+    def posiciones(self, inicio, fin) -> slice:
+        """Posiciones de las filas con ``inicio <= fecha <= fin``."""
+        i = self.indice.searchsorted(pd.Timestamp(inicio), side="left")
+        j = self.indice.searchsorted(pd.Timestamp(fin), side="right")
+        return slice(i, j)
+
+    def rango(self, inicio, fin) -> pd.DataFrame:
+        """Filas entre ``inicio`` y ``fin`` (ambos incluidos), como vista de ``datos``."""
+        return self.datos.iloc[self.posiciones(inicio, fin)]
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python serie_temporal.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import timeit
+
+    import numpy as np
+
+    print(f"{'puntos':>9} {'máscara µs':>11} {'rango µs':>9} {'mejora':>7}")
+    for n in (10_000, 100_000, 1_000_000):
+        df = pd.DataFrame({
+            "Fecha": pd.date_range("1900-01-01", periods=n, freq="h"),
+            "valor": np.random.default_rng(0).normal(size=n),
+        })
+        serie = SerieTemporal(df)
+        a, b = df["Fecha"].iloc[n // 4], df["Fecha"].iloc[3 * n // 4]
+        assert serie.rango(a, b).equals(df[(df["Fecha"] >= a) & (df["Fecha"] <= b)])
+
+        veces = 200
+        t_mascara = timeit.timeit(lambda: df[(df["Fecha"] >= a) & (df["Fecha"] <= b)], number=veces) / veces
+        t_rango = timeit.timeit(lambda: serie.rango(a, b), number=veces) / veces
+        print(f"{n:>9} {t_mascara * 1e6:>11.1f} {t_rango * 1e6:>9.1f} {t_mascara / t_rango:>6.0f}x")
@@ -0,0 +1,91 @@
+"""Simulador keynesiano que corre completo en el navegador.
+
+Como el modelo tiene solución cerrada, no hace falta volver al servidor en
+cada movimiento de un slider: ``html_simulador`` arma una página con
+controles HTML y un gráfico de Plotly.js que recalcula Y* y redibuja la curva
+DA con ``Plotly.react`` del lado del cliente. Se muestra con
+``streamlit.components.v1.html``; mientras los estudiantes mueven los sliders
+del componente, Streamlit no ejecuta ningún rerun.
+"""
+import json
+from string import Template
+
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+
+# nombre, etiqueta, mínimo, máximo, paso
+CONTROLES = [
+    ("C0", "C₀ (consumo autónomo)", 0, 300, 10),
+    ("c", "c (PMC)", 0.1, 0.99, 0.01),
+    ("I", "I (inversión)", 0, 300, 10),
+    ("G", "G (gasto público)", 0, 300, 10),
+    ("t", "t (tasa impositiva)", 0.0, 0.5, 0.01),
+]
+
+_PLANTILLA = Template("""
+<div style="font-family: sans-serif; font-size: 14px;">
+  <div id="controles" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 6px 18px;"></div>
+  <div id="grafico" style="height: 380px;"></div>
+  <div id="resultado" style="margin-top: 4px;"></div>
+</div>
+<script src="$plotly"></script>
+<script>
+const CONTROLES = $controles;
+const valores = $valores;
+const Y = Array.from({length: 300}, (_, i) => i * 1500 / 299);
+
+function modelo(p) {
+  const k = 1 / (1 - p.c * (1 - p.t));
+  const A = p.C0 + p.I + p.G;
+  return {k: k, Y: k * A, DA: Y.map(y => A + p.c * (1 - p.t) * y)};
+}
+
+function dibujar() {
+  const m = modelo(valores);
+  const trazas = [
+    {x: Y, y: Y, name: "45°", line: {dash: "dash", color: "gray"}},
+    {x: Y, y: m.DA, name: "$etiqueta", line: {color: "$color"}},
+    {x: [m.Y], y: [m.Y], name: "Equilibrio Y* = " + m.Y.toFixed(2), mode: "markers", marker: {color: "red", size: 9}},
+  ];
+  const diseno = {margin: {t: 20, r: 10}, xaxis: {title: "Ingreso (Y)"}, yaxis: {title: "Demanda Agregada (DA)"},
+                  legend: {x: 0.01, y: 0.99}};
+  Plotly.react("grafico", trazas, diseno, {displayModeBar: false, responsive: true});
+  document.getElementById("resultado").innerHTML =
+    "<b>Ingreso de equilibrio:</b> " + m.Y.toFixed(2) + " &nbsp; <b>Multiplicador:</b> " + m.k.toFixed(2);
+}
+
+const caja = document.getElementById("controles");
+for (const [nombre, etiqueta, min, max, paso] of CONTROLES) {
+  const fila = document.createElement("label");
+  fila.innerHTML = etiqueta + ": <b>" + valores[nombre] + "</b><br>";
+  const slider = document.createElement("input");
+  Object.assign(slider, {type: "range", min: min, max: max, step: paso, value: valores[nombre]});
+  slider.style.width = "100%";
+  slider.addEventListener("input", () => {
+    valores[nombre] = parseFloat(slider.value);
+    fila.querySelector("b").textContent = slider.value;
+    dibujar();
+  });
+  fila.appendChild(slider);
+  caja.appendChild(fila);
+}
+dibujar();
+</script>
+""")
+
+
+def html_simulador(C0=100, c=0.8, I=50, G=100, t=0.0, con_impuestos: bool = True,
+                   etiqueta_da: str = "DA", color: str = "blue") -> str:
+    """Página del simulador con los valores iniciales dados.
+
+    Con ``con_impuestos=False`` se oculta el control de ``t`` y se usa t = 0,
+    como en el simulador 1.
+    """
+    controles = [ctrl for ctrl in CONTROLES if con_impuestos or ctrl[0] != "t"]
+    valores = dict(C0=C0, c=c, I=I, G=G, t=t if con_impuestos else 0.0)
+    return _PLANTILLA.substitute(
+        plotly=PLOTLY_CDN,
+        controles=json.dumps(controles, ensure_ascii=False),
+        valores=json.dumps(valores),
+        etiqueta=etiqueta_da,
+        color=color,
+    )
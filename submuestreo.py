@@ -0,0 +1,129 @@
+"""Reducción de series largas antes de mandarlas a Plotly.
+
+Un gráfico de ``ancho`` píxeles no puede mostrar más de un punto por píxel,
+pero ``px.line`` serializa todos los del rango: con series largas cada
+movimiento del slider manda al navegador un JSON enorme. Acá la serie se
+reduce del lado del servidor a ``puntos_para_ancho(ancho)`` puntos con uno de
+dos métodos, ambos conservando el primer y el último punto:
+
+* ``lttb`` (Largest-Triangle-Three-Buckets): parte la serie en cubetas y de
+  cada una elige el punto que forma el triángulo más grande con el elegido
+  en la cubeta anterior y el promedio de la siguiente. Conserva la forma
+  visual (picos, quiebres) con muy pocos puntos.
+* ``min_max``: el mínimo y el máximo de cada cubeta; garantiza que ningún
+  extremo desaparezca, a costa de usar dos puntos por cubeta.
+
+Las funciones devuelven posiciones (para usar con ``iloc``) y esperan datos
+sin NaN, ordenados por ``x``.
+
+Ejecutar ``python submuestreo.py`` compara tamaño del JSON y tiempo de armado
+de la figura con y sin reducción.
+"""
+import numpy as np
+import pandas as pd
+
+PIXELES_POR_PUNTO = 3   # con marcadores, más densidad no se distingue
+MINIMO_PUNTOS = 50
+
+
+def puntos_para_ancho(ancho: int, pixeles_por_punto: int = PIXELES_POR_PUNTO) -> int:
+    """Máximo de puntos que vale la pena dibujar en ``ancho`` píxeles."""
+    return max(MINIMO_PUNTOS, int(ancho) // pixeles_por_punto)
+
+
+def _numerico(x) -> np.ndarray:
+    x = np.asarray(x)
+    if x.dtype.kind == "M":
+        x = x.astype("datetime64[ns]").view("int64")
+    x = x.astype(float)
+    return x - x[0]   # centrado: las sumas acumuladas no pierden precisión con fechas en ns
+
+
+def lttb(x, y, puntos: int) -> np.ndarray:
+    """Posiciones de los ``puntos`` elegidos por Largest-Triangle-Three-Buckets."""
+    n = len(y)
+    if puntos >= n or puntos < 3:
+        return np.arange(n)
+    x, y = _numerico(x), np.asarray(y, dtype=float)
+    # puntos - 2 cubetas entre el primero y el último; la "siguiente" de la
+    # última cubeta es el último punto.
+    bordes = np.append(np.linspace(1, n - 1, puntos - 1).astype(np.int64), n)
+    suma_x = np.concatenate([[0.0], np.cumsum(x)])
+    suma_y = np.concatenate([[0.0], np.cumsum(y)])
+
+    elegidos = np.empty(puntos, dtype=np.int64)
+    elegidos[0], elegidos[-1] = 0, n - 1
+    a = 0
+    for i in range(puntos - 2):
+        ini, fin, sig = bordes[i], bordes[i + 1], bordes[i + 2]
+        medio_x = (suma_x[sig] - suma_x[fin]) / (sig - fin)
+        medio_y = (suma_y[sig] - suma_y[fin]) / (sig - fin)
+        area = np.abs((x[a] - medio_x) * (y[ini:fin] - y[a]) - (x[a] - x[ini:fin]) * (medio_y - y[a]))
+        a = ini + int(np.argmax(area))
+        elegidos[i + 1] = a
+    return elegidos
+
+
+def min_max(x, y, puntos: int) -> np.ndarray:
+    """Posiciones del mínimo y el máximo de cada cubeta (a lo sumo ``puntos``)."""
+    n = len(y)
+    if puntos >= n or puntos < 4:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    cubetas = (puntos - 2) // 2
+    cubeta = np.arange(n) * cubetas // n          # ya ordenada: cada cubeta es un tramo contiguo
+    orden = np.lexsort((y, cubeta))               # dentro de cada cubeta, de menor a mayor y
+    inicios = np.searchsorted(cubeta, np.arange(cubetas))
+    finales = np.append(inicios[1:], n) - 1
+    return np.unique(np.concatenate([[0, n - 1], orden[inicios], orden[finales]]))
+
+
+METODOS = {"lttb": lttb, "min_max": min_max}
+
+
+def reducir(df: pd.DataFrame, x: str, y: str, puntos: int, metodo: str = "lttb") -> pd.DataFrame:
+    """Filas de ``df`` elegidas por ``metodo``; si ya tiene pocas, ``df`` tal cual."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido: {metodo!r} (opciones: {', '.join(METODOS)})")
+    if len(df) <= puntos:
+        return df
+    return df.iloc[METODOS[metodo](df[x].to_numpy(), df[y].to_numpy(), puntos)]
+
+
+# ---------------------------------------------------------------------------
+# BENCHMARK: python submuestreo.py
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import time
+
+    import plotly.express as px
+
+    ancho = 1200
+    puntos = puntos_para_ancho(ancho)
+    rng = np.random.default_rng(0)
+
+    def figura(datos: pd.DataFrame) -> str:
+        fig = px.line(datos, x="fecha", y="valor", markers=True)
+        return fig.to_json()
+
+    # El primer px.line importa y arma las plantillas: que no cuente en la medición.
+    figura(pd.DataFrame({"fecha": pd.date_range("2000-01-01", periods=3), "valor": [1.0, 2.0, 3.0]}))
+    print(f"ancho {ancho} px → {puntos} puntos por traza")
+    print(f"{'serie':>22} {'método':>8} {'puntos':>8} {'JSON KiB':>9} {'reducir ms':>11} {'figura ms':>10}")
+    for nombre, fechas in (("diaria, 25 años", pd.date_range("2000-01-01", periods=9_000, freq="D")),
+                           ("horaria, 10 años", pd.date_range("2015-01-01", periods=87_600, freq="h"))):
+        valores = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.01, len(fechas))))
+        df = pd.DataFrame({"fecha": fechas, "valor": valores})
+        for metodo in (None, *METODOS):
+            t0 = time.perf_counter()
+            reducido = df if metodo is None else reducir(df, "fecha", "valor", puntos, metodo)
+            t_reducir = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            carga = figura(reducido)
+            t_figura = time.perf_counter() - t0
+            if metodo is not None:
+                assert len(reducido) <= puntos and reducido.index[0] == 0 and reducido.index[-1] == len(df) - 1
+                if metodo == "min_max":
+                    assert reducido["valor"].max() == df["valor"].max()
+            print(f"{nombre:>22} {metodo or 'completa':>8} {len(reducido):>8,} {len(carga) / 1024:>9.0f} "
+                  f"{t_reducir * 1e3:>11.1f} {t_figura * 1e3:>10.1f}")
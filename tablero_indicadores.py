@@ -1,13 +1,13 @@
 # tablero_macroeconomia.py
 
-import pandas as pd
-import plotly.graph_objects as go
-
 try:
     import streamlit as st
 except ModuleNotFoundError:
     raise ModuleNotFoundError("Streamlit no está instalado en el entorno. Ejecuta 'pip install streamlit' en tu consola para instalarlo.")
 
+from datos_tableros import serie_indicadores_simulados
+from figuras import figura, traza
+
 # 1. Título del Tablero
 st.title('🌎 Tablero Interactivo de Indicadores Macroeconómicos')
 
@@ -46,27 +46,8 @@ st.markdown("""
 """)
 
 # 3. Cargar datos simulados basados en datos reales
-fechas = pd.date_range(start='2022-01-01', end='2025-01-01', freq='MS')
-pbi_real = [130, 132, 131, 134, 136, 137, 138, 137, 136, 137, 138, 137,
-             137, 138, 140, 141, 141, 140, 139, 138, 139, 140, 140, 139, 140,
-             141, 142, 143, 144, 145, 145, 146, 147, 148, 149, 150]
-inflacion_mensual = [3.9, 4.7, 6.7, 6.0, 5.1, 5.3, 7.4, 7.0, 6.2, 6.3, 5.1, 5.1,
-                     6.0, 6.6, 7.7, 7.8, 6.3, 6.0, 12.4, 8.3, 12.8, 20.6, 25.5, 20.6, 15.0,
-                     10.0, 9.5, 8.0, 7.5, 7.0, 6.8, 6.5, 6.2, 6.0, 5.8, 5.5]
-desempleo = [7.0, 7.0, 6.9, 6.9, 6.9, 6.8, 6.8, 6.7, 6.7, 6.8, 6.8, 7.1,
-             7.0, 7.0, 6.8, 6.8, 6.7, 6.9, 7.5, 7.8, 8.0, 8.1, 8.5, 8.3, 8.0,
-             7.8, 7.5, 7.3, 7.0, 6.8, 6.5, 6.3, 6.2, 6.1, 6.0, 5.9]
-tipo_cambio = [104, 107, 110, 112, 117, 120, 130, 135, 140, 150, 160, 170,
-               180, 190, 210, 220, 230, 250, 310, 350, 400, 500, 600, 700, 750,
-               760, 770, 780, 790, 800, 810, 820, 830, 840, 850, 860]
-
-df_indicadores = pd.DataFrame({
-    'Fecha': fechas,
-    'PBI_Indexado': pbi_real,
-    'Inflacion_Mensual_%': inflacion_mensual,
-    'Desempleo_%': desempleo,
-    'Tipo_Cambio_AR_USD': tipo_cambio
-})
+serie_indicadores = serie_indicadores_simulados()
+df_indicadores = serie_indicadores.datos
 
 # 4. Consignas
 st.markdown("""
@@ -91,19 +72,18 @@ rango_fechas = st.slider(
 )
 
 # 7. Filtrado
-df_filtrado = df_indicadores[
-    (df_indicadores['Fecha'] >= pd.to_datetime(rango_fechas[0])) &
-    (df_indicadores['Fecha'] <= pd.to_datetime(rango_fechas[1]))
-]
+df_filtrado = serie_indicadores.rango(*rango_fechas)
 
 # 8. Gráfico interactivo
-fig = go.Figure()
-fig.add_trace(go.Scatter(x=df_filtrado['Fecha'], y=df_filtrado[indicador1],
-                         name=indicador1, yaxis='y1'))
+liviano = st.sidebar.toggle('Gráficos livianos (WebGL)',
+                            help='Trazas WebGL con datos binarios y plantilla compacta: menos bytes por rerun y sin demoras con series largas.')
+fig = figura(liviano)
+fig.add_trace(traza(df_filtrado['Fecha'], df_filtrado[indicador1], liviano,
+                    name=indicador1, yaxis='y1'))
 
 if indicador2 != 'Ninguno':
-    fig.add_trace(go.Scatter(x=df_filtrado['Fecha'], y=df_filtrado[indicador2],
-                             name=indicador2, yaxis='y2'))
+    fig.add_trace(traza(df_filtrado['Fecha'], df_filtrado[indicador2], liviano,
+                        name=indicador2, yaxis='y2'))
 
 fig.update_layout(
     title=f'Evolución de {indicador1}' + (f' y {indicador2}' if indicador2 != 'Ninguno' else ''),
@@ -111,7 +91,6 @@ fig.update_layout(
     yaxis=dict(title=indicador1),
     yaxis2=dict(title=indicador2, overlaying='y', side='right') if indicador2 != 'Ninguno' else None,
     legend=dict(x=0.01, y=0.99),
-    template='plotly_white'
 )
 
 st.plotly_chart(fig)
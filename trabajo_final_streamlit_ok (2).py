@@ -1,7 +1,26 @@
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
+import io
+import time
+import streamlit.components.v1 as components
+from matplotlib.figure import Figure
+
+from escenarios import comparar
+from graficos_keynes import Y_GRILLA, GraficoCruz, GraficoFiltraciones, GraficoISLM
+from modelo_islm import BASE as BASE_ISLM, comparar_shocks
+from modelo_keynesiano import RANGOS, barrido, demanda_agregada, equilibrio
+from montecarlo import simular_por_bloques
+from multiplicador_dinamico import rondas
+from simulador_cliente import html_simulador
+
+# Una figura por gráfico y por sesión: los reruns sólo actualizan sus datos.
+if "cruz_1" not in st.session_state:
+    st.session_state.cruz_1 = GraficoCruz("DA", "blue")
+    st.session_state.cruz_2 = GraficoCruz("DA con impuestos", "green")
+    st.session_state.filtraciones = GraficoFiltraciones()
+    st.session_state.islm = GraficoISLM()
 
 # === Objetivos ===
 st.header("🎯 Objetivos de la actividad")
@@ -49,6 +68,13 @@ st.latex(r'''
 \end{array}
 ''')
 
+# En modo navegador los simuladores se calculan y dibujan en el cliente: mover
+# sus sliders no genera reruns; la barra lateral sólo fija los valores iniciales.
+en_navegador = st.sidebar.toggle("⚡ Simular en el navegador", value=False,
+                                 help="Los gráficos responden al instante sin volver al servidor.")
+ALTO_COMPONENTE = 560
+mostrar_html = getattr(st, "iframe", None) or components.html  # st.iframe en Streamlit reciente
+
 # === Primer simulador ===
 st.header("🔧 Simulador 1: Modelo Keynesiano Simple")
 
@@ -58,21 +84,17 @@ c = st.sidebar.slider("c (PMC)", 0.1, 0.99, 0.8, 0.01)
 I = st.sidebar.slider("I (inversión)", 0, 300, 50, 10)
 G = st.sidebar.slider("G (gasto público)", 0, 300, 100, 10)
 
-Y_eq_1 = 1 / (1 - c) * (C0 + I + G)
-DA_1 = lambda Y: C0 + c * Y + I + G
-Y_vals = np.linspace(0, 1500, 300)
+eq_1 = equilibrio(C0, c, I, G)
+Y_eq_1 = eq_1.Y
+DA_1 = lambda Y: demanda_agregada(Y, C0, c, I, G)
+Y_vals = Y_GRILLA
 
-fig1, ax1 = plt.subplots()
-ax1.plot(Y_vals, Y_vals, "--", color="gray", label="45°")
-ax1.plot(Y_vals, DA_1(Y_vals), label="DA", color="blue")
-ax1.plot(Y_eq_1, DA_1(Y_eq_1), "ro", label=f"Equilibrio Y* = {Y_eq_1:.2f}")
-ax1.set_xlabel("Ingreso (Y)")
-ax1.set_ylabel("Demanda Agregada (DA)")
-ax1.legend()
-ax1.grid(True)
-st.pyplot(fig1)
+if en_navegador:
+    mostrar_html(html_simulador(C0, c, I, G, con_impuestos=False), height=ALTO_COMPONENTE)
+else:
+    st.pyplot(st.session_state.cruz_1.actualizar(DA_1(Y_vals), Y_eq_1, DA_1(Y_eq_1)))
 
-st.markdown(f"**Ingreso de equilibrio:** {Y_eq_1:.2f}<br>**Multiplicador:** {1 / (1 - c):.2f}", unsafe_allow_html=True)
+    st.markdown(f"**Ingreso de equilibrio:** {Y_eq_1:.2f}<br>**Multiplicador:** {eq_1.k:.2f}", unsafe_allow_html=True)
 
 # === Segundo simulador ===
 st.header("🔧 Simulador 2: Modelo Keynesiano con impuestos proporcionales")
@@ -80,21 +102,130 @@ st.header("🔧 Simulador 2: Modelo Keynesiano con impuestos proporcionales")
 st.sidebar.subheader("Parámetros – Simulador 2")
 t = st.sidebar.slider("t (tasa impositiva)", 0.0, 0.5, 0.15, 0.01)
 
-mult_2 = 1 / (1 - c * (1 - t))
-Y_eq_2 = mult_2 * (C0 + I + G)
-DA_2 = lambda Y: C0 + c * (1 - t) * Y + I + G
-
-fig2, ax2 = plt.subplots()
-ax2.plot(Y_vals, Y_vals, "--", color="gray", label="45°")
-ax2.plot(Y_vals, DA_2(Y_vals), label="DA con impuestos", color="green")
-ax2.plot(Y_eq_2, DA_2(Y_eq_2), "ro", label=f"Equilibrio Y* = {Y_eq_2:.2f}")
-ax2.set_xlabel("Ingreso (Y)")
-ax2.set_ylabel("Demanda Agregada (DA)")
-ax2.legend()
-ax2.grid(True)
-st.pyplot(fig2)
-
-st.markdown(f"**Ingreso de equilibrio con impuestos:** {Y_eq_2:.2f}<br>**Multiplicador ajustado:** {mult_2:.2f}", unsafe_allow_html=True)
+eq_2 = equilibrio(C0, c, I, G, t=t)
+mult_2 = eq_2.k
+Y_eq_2 = eq_2.Y
+DA_2 = lambda Y: demanda_agregada(Y, C0, c, I, G, t=t)
+
+if en_navegador:
+    mostrar_html(html_simulador(C0, c, I, G, t, etiqueta_da="DA con impuestos", color="green"),
+                 height=ALTO_COMPONENTE)
+else:
+    st.pyplot(st.session_state.cruz_2.actualizar(DA_2(Y_vals), Y_eq_2, DA_2(Y_eq_2)))
+
+    st.markdown(f"**Ingreso de equilibrio con impuestos:** {Y_eq_2:.2f}<br>**Multiplicador ajustado:** {mult_2:.2f}", unsafe_allow_html=True)
+
+# === Filtraciones y gastos compensatorios ===
+st.header("⚖️ Filtraciones y gastos compensatorios")
+st.markdown("El mismo equilibrio visto como **ahorro + impuestos = inversión + gasto público**, "
+            "comparado con los valores iniciales de la barra lateral.")
+
+BASE_SIMULADOR = dict(C0=100, c=0.8, I=50, G=100, T0=0, t=0.15)
+comp = comparar(dict(C0=C0, c=c, I=I, G=G, T0=0, t=t), base=BASE_SIMULADOR)
+st.pyplot(st.session_state.filtraciones.actualizar(comp))
+st.dataframe(comp.tabla_variacion(multiplicadores=True).style.format("{:,.2f}"))
+
+# === Mecanismo multiplicador ===
+st.header("🔁 Mecanismo multiplicador: ronda por ronda")
+st.markdown("Un aumento del gasto público genera ingreso; de ese ingreso se paga una parte en impuestos y "
+            "se consume una fracción, que vuelve a generar ingreso. Cada barra es una ronda "
+            "(\\( \\Delta Y_n = [c(1-t)]^n \\Delta G \\)), con la **c** y la **t** de la barra lateral.")
+
+col_dg, col_tol, col_vel = st.columns(3)
+delta_G = col_dg.number_input("ΔG", -300, 300, 100, 10)
+tolerancia = col_tol.select_slider("Detener cuando ΔYₙ <", [1.0, 0.1, 0.01, 0.001], value=0.01)
+pausa = col_vel.select_slider("Velocidad", ["lenta", "normal", "instantánea"], value="normal")
+
+if st.button("▶️ Reproducir las rondas"):
+    espera = {"lenta": 0.3, "normal": 0.08, "instantánea": 0}[pausa]
+    grafico_rondas, resumen_rondas = st.empty(), st.empty()
+    historia = []
+    for ronda in rondas(delta_G, c, t, tol=tolerancia):
+        historia.append((float(ronda.incremento), float(ronda.acumulado)))
+        tabla = pd.DataFrame(historia, columns=["ΔY de la ronda", "ΔY acumulado"]).rename_axis("Ronda")
+        grafico_rondas.bar_chart(tabla["ΔY de la ronda"])
+        resumen_rondas.markdown(f"Ronda **{ronda.n}** · ΔY acumulado **{float(ronda.acumulado):.2f}** "
+                                f"de **{eq_2.k * delta_G:.2f}** (k · ΔG)")
+        time.sleep(espera)
+
+# === IS-LM ===
+st.header("🏦 Extensión: el modelo IS-LM")
+st.markdown("Con mercado de dinero la tasa de interés deja de ser fija: un aumento del gasto sube **r**, "
+            "reduce la inversión (**I = I₀ − b r**) y el ingreso crece menos que en el cruce keynesiano "
+            "(*efecto desplazamiento*). C₀, c, I₀, G y t salen de la barra lateral.")
+
+col_m, col_b, col_h = st.columns(3)
+M = col_m.slider("M (oferta monetaria)", 100, 800, 300, 10)
+b_islm = col_b.slider("b (sensibilidad de la inversión a r)", 1, 40, 10, 1)
+h_islm = col_h.slider("h (sensibilidad de la demanda de dinero a r)", 1, 80, 20, 1)
+col_sg, col_sm, col_nl = st.columns(3)
+shock_G = col_sg.slider("Shock fiscal ΔG", -100, 100, 50, 10)
+shock_M = col_sm.slider("Shock monetario ΔM", -200, 200, 0, 10)
+no_lineal = col_nl.checkbox("LM no lineal (M/P = kY·e^(−ηr))", value=False)
+
+base_islm = {**BASE_ISLM, "C0": C0, "c": c, "I0": I, "G": G, "t": t, "M": M, "b": b_islm, "h": h_islm}
+nuevo_islm = {**base_islm, "G": G + shock_G, "M": M + shock_M}
+st.pyplot(st.session_state.islm.actualizar(base_islm, nuevo_islm, no_lineal))
+st.dataframe(comparar_shocks({"Fiscal (ΔG)": {"G": shock_G}, "Monetario (ΔM)": {"M": shock_M},
+                              "Combinado": {"G": shock_G, "M": shock_M}},
+                             base=base_islm, no_lineal=no_lineal).style.format("{:,.2f}"))
+
+# === Monte Carlo ===
+st.header("🎲 Incertidumbre: distribución del ingreso de equilibrio")
+st.markdown("Los parámetros rara vez se conocen con exactitud. Acá **c**, **t** y **G** se sortean alrededor "
+            "de los valores de la barra lateral y se resuelve el equilibrio para cada sorteo.")
+
+col_c, col_t, col_g, col_n = st.columns(4)
+ancho_c = col_c.slider("c ± (uniforme)", 0.0, 0.1, 0.05, 0.01)
+desvio_t = col_t.slider("Desvío de t (normal)", 0.0, 0.1, 0.02, 0.01)
+desvio_g = col_g.slider("Desvío de G (normal)", 0, 50, 10, 5)
+n_sorteos = col_n.select_slider("Sorteos", [100_000, 1_000_000, 10_000_000], value=1_000_000,
+                                format_func=lambda n: f"{n:,}")
+
+if st.button("🎲 Simular"):
+    espec = {"C0": C0, "I": I, "c": ("uniforme", c - ancho_c, min(c + ancho_c, 0.999)),
+             "t": ("normal", t, desvio_t), "G": ("normal", G, desvio_g)}
+    avance = st.progress(0.0, text="Sorteando…")
+    for resultado_mc in simular_por_bloques(espec, n_sorteos):
+        avance.progress(resultado_mc.sorteos / n_sorteos, text=f"{resultado_mc.sorteos:,} sorteos")
+    avance.empty()
+    col_hist, col_tabla = st.columns([2, 1])
+    col_hist.area_chart(resultado_mc.histograma().set_index("Y*"))
+    col_tabla.dataframe(resultado_mc.tabla().style.format("{:,.2f}"))
+
+# === Barrido de parámetros ===
+st.header("🗺️ Barrido de parámetros: superficie del ingreso de equilibrio")
+st.markdown("Cada punto del mapa es el **Y\\*** que resulta de combinar los dos parámetros elegidos, "
+            "dejando el resto en los valores de la barra lateral. El punto rojo marca la combinación actual.")
+
+PARES = {"c × t": ("c", "t"), "G × T₀": ("G", "T0"), "c × G": ("c", "G"), "I × G": ("I", "G")}
+col_par, col_res = st.columns(2)
+par = col_par.selectbox("Parámetros a barrer", list(PARES))
+resolucion = col_res.select_slider("Resolución de la grilla", [100, 250, 500, 1000], value=500)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def superficie_png(base: dict, eje_x: str, eje_y: str, n: int) -> bytes:
+    """Mapa de calor + curvas de nivel de Y*; se cachea por parámetros y resolución."""
+    xs = np.linspace(*RANGOS[eje_x], n)
+    ys = np.linspace(*RANGOS[eje_y], n)
+    Y = barrido(base, eje_x, xs, eje_y, ys)
+
+    fig = Figure(figsize=(7, 5))
+    ax = fig.subplots()
+    im = ax.imshow(Y, origin="lower", aspect="auto", cmap="viridis",
+                   extent=(xs[0], xs[-1], ys[0], ys[-1]))
+    curvas = ax.contour(xs, ys, Y, levels=10, colors="white", linewidths=0.8)
+    ax.clabel(curvas, fmt="%.0f", fontsize=8)
+    ax.plot(base[eje_x], base[eje_y], "ro")
+    ax.set_xlabel(eje_x)
+    ax.set_ylabel(eje_y)
+    fig.colorbar(im, ax=ax, label="Y*")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=110, bbox_inches="tight")
+    return buf.getvalue()
+
+eje_x, eje_y = PARES[par]
+st.image(superficie_png(dict(C0=C0, c=c, I=I, G=G, T0=0, t=t), eje_x, eje_y, resolucion))
 
 # === Consigna ===
 st.header("📝 Consigna Final para Estudiantes")
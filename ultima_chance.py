@@ -4,61 +4,15 @@
 #   pip install streamlit pandas plotly
 #   streamlit run tablero_macroeconomia.py
 
-import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
+from datos_tableros import serie_indicadores_2022_2024
+from figuras import figura, traza
 
 # ------------------------------------------------------------
 # 1. Datos suministrados (ene‑2022 → dic‑2024)
 # ------------------------------------------------------------
-_raw = [
-    ("112022", 146.50, 1079.28,  90.10, 162.12),
-    ("122022", 144.50, 1134.59,  93.21, 172.90),
-    ("12023",  143.00, 1202.98,  95.14, 182.24),
-    ("22023",  137.60, 1282.71,  94.77, 191.89),
-    ("32023",  155.40, 1381.16,  93.59, 203.11),
-    ("42023",  149.10, 1497.21,  93.81, 216.56),
-    ("52023",  152.70, 1613.59,  93.05, 231.19),
-    ("62023",  151.60, 1709.61,  93.96, 248.76),
-    ("72023",  149.00, 1818.08,  95.85, 266.46),
-    ("82023",  150.70, 2044.28, 104.82, 322.13),
-    ("92023",  147.50, 2304.92, 100.67, 350.00),
-    ("102023", 146.70, 2496.27,  89.63, 350.02),
-    ("112023", 145.50, 2816.06,  83.19, 353.84),
-    # El código 121899 se descarta: año 1899 fuera de rango
-    ("12024",  137.30, 4261.53, 132.78, 818.35),
-    ("22024",  133.80, 4825.79, 115.76, 834.91),
-    ("32024",  142.40, 5357.09, 105.87, 850.34),
-    ("42024",  145.50, 5830.23,  97.02, 868.96),
-    ("52024",  154.80, 6073.72,  93.43, 886.86),
-    ("62024",  145.40, 6351.71,  89.90, 903.78),
-    ("72024",  148.20, 6607.75,  87.88, 923.77),
-    ("82024",  146.00, 6883.44,  87.16, 942.92),
-    ("92024",  143.70, 7122.24,  86.05, 961.83),
-    ("102024", 146.00, 7313.95,  84.05, 981.57),
-    ("112024", 146.10, 7491.43,  81.75,1001.84),
-    ("122024", 146.00, 7694.01,  79.79,1020.71),
-]
-
-def parse_mmYYYY(code: str):
-    """Convierte códigos como '112.022', '12023', '102024' → Timestamp.
-    • Elimina cualquier carácter no numérico.
-    • Descarta valores con mes fuera de 1‑12 o año < 1900."""
-    digits = ''.join(ch for ch in code if ch.isdigit())
-    if len(digits) < 5:  # se necesitan al menos 1 dígito de mes + 4 de año
-        return None
-    m, y = int(digits[:-4]), int(digits[-4:])
-    if not (1 <= m <= 12) or y < 1900:
-        return None
-    return pd.Timestamp(year=y, month=m, day=1)
-
-rows = [
-    {"Fecha": parse_mmYYYY(c), "PBI": pbi, "IPC": ipc, "ITCRM": itcrm, "TCN": tcn}
-    for c, pbi, ipc, itcrm, tcn in _raw
-    if parse_mmYYYY(c) is not None
-]
-
-df = pd.DataFrame(rows).sort_values("Fecha").reset_index(drop=True)
+serie = serie_indicadores_2022_2024()
+df = serie.datos
 
 # ------------------------------------------------------------
 # 2. Streamlit UI
@@ -92,15 +46,16 @@ r1, r2 = st.slider(
     value=(df["Fecha"].min().to_pydatetime(), df["Fecha"].max().to_pydatetime()),
 )
 
-df_filt = df[(df["Fecha"] >= r1) & (df["Fecha"] <= r2)]
+df_filt = serie.rango(r1, r2)
 
-fig = go.Figure()
-fig.add_trace(go.Scatter(x=df_filt["Fecha"], y=df_filt[ind1], name=ind1, yaxis="y1"))
+liviano = st.sidebar.toggle("Gráficos livianos (WebGL)",
+                            help="Trazas WebGL con datos binarios y plantilla compacta: menos bytes por rerun y sin demoras con series largas.")
+fig = figura(liviano)
+fig.add_trace(traza(df_filt["Fecha"], df_filt[ind1], liviano, name=ind1, yaxis="y1"))
 if ind2 != "Ninguno":
-    fig.add_trace(go.Scatter(x=df_filt["Fecha"], y=df_filt[ind2], name=ind2, yaxis="y2"))
+    fig.add_trace(traza(df_filt["Fecha"], df_filt[ind2], liviano, name=ind2, yaxis="y2"))
 
 fig.update_layout(
-    template="plotly_white",
     showlegend=True,
     yaxis2=dict(title=ind2, overlaying="y", side="right") if ind2 != "Ninguno" else None,
 )
@@ -4,46 +4,15 @@
 #   pip install streamlit pandas plotly
 #   streamlit run tablero_macroeconomia.py
 
-import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
+from datos_tableros import serie_indicadores_2022_2024
+from figuras import figura, traza
 
 # ============================================================
 # 1  Datos suministrados (ene‑2022 → dic‑2024)
 # ============================================================
-_raw = [
-    ("112022",146.50,1079.28, 90.10,162.12),("122022",144.50,1134.59, 93.21,172.90),
-    ("12023",143.00,1202.98, 95.14,182.24),("22023",137.60,1282.71, 94.77,191.89),
-    ("32023",155.40,1381.16, 93.59,203.11),("42023",149.10,1497.21, 93.81,216.56),
-    ("52023",152.70,1613.59, 93.05,231.19),("62023",151.60,1709.61, 93.96,248.76),
-    ("72023",149.00,1818.08, 95.85,266.46),("82023",150.70,2044.28,104.82,322.13),
-    ("92023",147.50,2304.92,100.67,350.00),("102023",146.70,2496.27, 89.63,350.02),
-    ("112023",145.50,2816.06, 83.19,353.84),("12024",137.30,4261.53,132.78,818.35),
-    ("22024",133.80,4825.79,115.76,834.91),("32024",142.40,5357.09,105.87,850.34),
-    ("42024",145.50,5830.23, 97.02,868.96),("52024",154.80,6073.72, 93.43,886.86),
-    ("62024",145.40,6351.71, 89.90,903.78),("72024",148.20,6607.75, 87.88,923.77),
-    ("82024",146.00,6883.44, 87.16,942.92),("92024",143.70,7122.24, 86.05,961.83),
-    ("102024",146.00,7313.95, 84.05,981.57),("112024",146.10,7491.43, 81.75,1001.84),
-    ("122024",146.00,7694.01, 79.79,1020.71),
-]
-
-def parse_mmYYYY(code:str):
-    digits=''.join(ch for ch in code if ch.isdigit())
-    if len(digits)<5:
-        return None
-    m,y=int(digits[:-4]),int(digits[-4:])
-    if not(1<=m<=12) or y<1900:
-        return None
-    return pd.Timestamp(year=y,month=m,day=1)
-
-rows=[]
-for c,pbi,ipc,itcrm,tcn in _raw:
-    f=parse_mmYYYY(c)
-    if f is None:
-        continue
-    rows.append({"Fecha":f,"PBI":pbi,"IPC":ipc,"ITCRM":itcrm,"TCN":tcn})
-
-df=pd.DataFrame(rows).sort_values("Fecha").reset_index(drop=True)
+serie=serie_indicadores_2022_2024()
+df=serie.datos
 
 # ============================================================
 # 2  Configuración Streamlit
@@ -59,6 +28,9 @@ if nombre:
 else:
     st.warning("Por favor escribe tu nombre antes de continuar.")
 
+liviano = st.sidebar.toggle("Gráficos livianos (WebGL)",
+                            help="Trazas WebGL con datos binarios y plantilla compacta: menos bytes por rerun y sin demoras con series largas.")
+
 # Tabs
 modo = st.tabs(["Gráficos", "Variaciones"])
 
@@ -72,11 +44,10 @@ with modo[0]:
     ind2=col2.selectbox("Indicador 2 (opcional)", ["Ninguno"]+indicadores)
     rmin=df["Fecha"].min().to_pydatetime(); rmax=df["Fecha"].max().to_pydatetime()
     rango=st.slider("Rango de fechas", min_value=rmin, max_value=rmax, value=(rmin,rmax))
-    dff=df[(df["Fecha"]>=rango[0])&(df["Fecha"]<=rango[1])]
-    fig=go.Figure(); fig.add_trace(go.Scatter(x=dff["Fecha"],y=dff[ind1],name=ind1,yaxis="y1"))
+    dff=serie.rango(*rango)
+    fig=figura(liviano); fig.add_trace(traza(dff["Fecha"],dff[ind1],liviano,name=ind1,yaxis="y1"))
     if ind2!="Ninguno":
-        fig.add_trace(go.Scatter(x=dff["Fecha"],y=dff[ind2],name=ind2,yaxis="y2"))
-    fig.update_layout(template="plotly_white")
+        fig.add_trace(traza(dff["Fecha"],dff[ind2],liviano,name=ind2,yaxis="y2"))
     st.plotly_chart(fig,use_container_width=True)
     st.dataframe(dff, height=220)
 
@@ -98,10 +69,9 @@ with modo[1]:
     df_var["Inflacion_%"] = df_var["IPC"].pct_change()*100
     df_var["ΔITCRM_%"]   = df_var["ITCRM"].pct_change()*100
     st.subheader("Tasas de variación")
-    fig2=go.Figure()
-    fig2.add_trace(go.Scatter(x=df_var["Fecha"], y=df_var["Inflacion_%"], name="Inflación %"))
-    fig2.add_trace(go.Scatter(x=df_var["Fecha"], y=df_var["ΔITCRM_%"], name="Δ ITCRM %"))
-    fig2.update_layout(template="plotly_white")
+    fig2=figura(liviano)
+    fig2.add_trace(traza(df_var["Fecha"], df_var["Inflacion_%"], liviano, name="Inflación %"))
+    fig2.add_trace(traza(df_var["Fecha"], df_var["ΔITCRM_%"], liviano, name="Δ ITCRM %"))
     st.plotly_chart(fig2,use_container_width=True)
 
     # Simulador simple: aplicar shocks para el último mes
@@ -1,65 +1,77 @@
-# tablero_macroeconomia.py — Tablero interactivo 2022‑2024 + Variaciones + Respuestas identificadas + CSV local
+# tablero_macroeconomia.py — Tablero interactivo 2022‑2024 + Variaciones + Respuestas identificadas (SQLite local)
 # ----------------------------------------------------------------------------------
 # Ejecutar con:
 #   pip install streamlit pandas plotly
 #   streamlit run tablero_macroeconomia.py
 
-import os
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
+from datos_tableros import serie_indicadores_2022_2024
+from economia_abierta import Parametros, a_tabla, calibrar, simular
+from figuras import figura, traza
+from respuestas import FORMATOS_EXPORTACION, archivo_exportado, crear_almacen_respuestas
 
 # ============================================================
 # 1  Datos suministrados (ene‑2022 → dic‑2024)
 # ============================================================
-_raw = [
-    ("112022",146.50,1079.28, 90.10,162.12),("122022",144.50,1134.59, 93.21,172.90),
-    ("12023",143.00,1202.98, 95.14,182.24),("22023",137.60,1282.71, 94.77,191.89),
-    ("32023",155.40,1381.16, 93.59,203.11),("42023",149.10,1497.21, 93.81,216.56),
-    ("52023",152.70,1613.59, 93.05,231.19),("62023",151.60,1709.61, 93.96,248.76),
-    ("72023",149.00,1818.08, 95.85,266.46),("82023",150.70,2044.28,104.82,322.13),
-    ("92023",147.50,2304.92,100.67,350.00),("102023",146.70,2496.27, 89.63,350.02),
-    ("112023",145.50,2816.06, 83.19,353.84),("12024",137.30,4261.53,132.78,818.35),
-    ("22024",133.80,4825.79,115.76,834.91),("32024",142.40,5357.09,105.87,850.34),
-    ("42024",145.50,5830.23, 97.02,868.96),("52024",154.80,6073.72, 93.43,886.86),
-    ("62024",145.40,6351.71, 89.90,903.78),("72024",148.20,6607.75, 87.88,923.77),
-    ("82024",146.00,6883.44, 87.16,942.92),("92024",143.70,7122.24, 86.05,961.83),
-    ("102024",146.00,7313.95, 84.05,981.57),("112024",146.10,7491.43, 81.75,1001.84),
-    ("122024",146.00,7694.01, 79.79,1020.71),
-]
-
-def parse_mmYYYY(code: str):
-    digits = ''.join(ch for ch in code if ch.isdigit())
-    if len(digits) < 5:
-        return None
-    m, y = int(digits[:-4]), int(digits[-4:])
-    if not (1 <= m <= 12) or y < 1900:
-        return None
-    return pd.Timestamp(year=y, month=m, day=1)
-
-rows = []
-for c, pbi, ipc, itcrm, tcn in _raw:
-    f = parse_mmYYYY(c)
-    if f is None:
-        continue
-    rows.append({"Fecha": f, "PBI": pbi, "IPC": ipc, "ITCRM": itcrm, "TCN": tcn})
-
-df = pd.DataFrame(rows).sort_values("Fecha").reset_index(drop=True)
+serie = serie_indicadores_2022_2024()
+df = serie.datos
 
 # ============================================================
-# 2  Utilidad para guardar respuestas en CSV local
+# 2  Respuestas de los estudiantes (SQLite compartido, escritura por lotes)
 # ============================================================
-CSV_PATH = "respuestas.csv"
+RESPUESTAS_DB = "respuestas.sqlite"
+CSV_PATH = "respuestas.csv"  # formato anterior: se importa una vez a la base
+
+@st.cache_resource
+def obtener_respuestas():
+    return crear_almacen_respuestas(RESPUESTAS_DB)
+
+@st.cache_resource
+def importar_respuestas_anteriores() -> str | None:
+    """Importa una sola vez el CSV anterior; si no se puede, devuelve el aviso en lugar de romper el almacén."""
+    try:
+        obtener_respuestas().importar_csv(CSV_PATH)
+    except Exception as exc:
+        return f"No se pudo importar {CSV_PATH} ({exc}); el archivo quedó sin cambios."
+    return None
+
+aviso_importacion = importar_respuestas_anteriores()
+
+ESPERA_GUARDADO = 15  # segundos para que el escritor confirme la fila
 
 def save_response(nombre: str, seccion: str, texto: str):
+    """Guarda y muestra el resultado recién cuando la fila quedó escrita."""
     if not texto.strip():
+        st.warning("Escribe tu respuesta antes de guardar.")
         return
-    new_row = pd.DataFrame([[nombre, seccion, texto]], columns=["Nombre", "Seccion", "Respuesta"])
-    header = not os.path.exists(CSV_PATH)
-    new_row.to_csv(CSV_PATH, mode="a", header=header, index=False, encoding="utf-8")
+    try:
+        obtener_respuestas().guardar(nombre, seccion, texto).result(timeout=ESPERA_GUARDADO)
+    except Exception as exc:
+        st.error(f"No se pudo guardar la respuesta ({exc}). Copia tu texto y vuelve a intentarlo.")
+    else:
+        st.success("Respuesta guardada!")
+
+# ============================================================
+# 3  Escenarios de economía abierta (cacheados por parámetros)
+# ============================================================
+@st.cache_data(show_spinner=False)
+def calibracion_abierta():
+    return calibrar(df)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def escenarios_abiertos(devaluacion: float, salto: float, meses: int, m: float, n: float) -> pd.DataFrame:
+    """Sin devaluación, devaluación constante y salto inicial + devaluación constante."""
+    d = np.zeros((3, meses))
+    d[1:] = devaluacion
+    d[2, 0] += 100 * np.log1p(salto / 100)
+    trayectorias = simular(calibracion_abierta(), Parametros(m=m, n=n), d)
+    nombres = ["Sin devaluación", "Devaluación constante", "Salto + devaluación constante"]
+    return a_tabla(trayectorias, nombres, df["Fecha"].max())
 
 # ============================================================
-# 3  Configuración Streamlit
+# 4  Configuración Streamlit
 # ============================================================
 st.set_page_config(page_title="Tablero Macro 2022‑2024", layout="wide")
 
@@ -72,8 +84,11 @@ if nombre:
 else:
     st.warning("Por favor escribe tu nombre antes de continuar.")
 
+liviano = st.sidebar.toggle("Gráficos livianos (WebGL)",
+                            help="Trazas WebGL con datos binarios y plantilla compacta: menos bytes por rerun y sin demoras con series largas.")
+
 # Tabs
-modo = st.tabs(["Gráficos", "Variaciones"])
+modo = st.tabs(["Gráficos", "Variaciones", "Docente"])
 
 # ------------------------------------------------------------
 # Pestaña 1 – Gráficos
@@ -86,13 +101,12 @@ with modo[0]:
 
     rmin = df["Fecha"].min().to_pydatetime(); rmax = df["Fecha"].max().to_pydatetime()
     rango = st.slider("Rango de fechas", min_value=rmin, max_value=rmax, value=(rmin, rmax))
-    dff = df[(df["Fecha"] >= rango[0]) & (df["Fecha"] <= rango[1])]
+    dff = serie.rango(*rango)
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=dff["Fecha"], y=dff[ind1], name=ind1, yaxis="y1"))
+    fig = figura(liviano)
+    fig.add_trace(traza(dff["Fecha"], dff[ind1], liviano, name=ind1, yaxis="y1"))
     if ind2 != "Ninguno":
-        fig.add_trace(go.Scatter(x=dff["Fecha"], y=dff[ind2], name=ind2, yaxis="y2"))
-    fig.update_layout(template="plotly_white")
+        fig.add_trace(traza(dff["Fecha"], dff[ind2], liviano, name=ind2, yaxis="y2"))
     st.plotly_chart(fig, use_container_width=True)
 
     st.dataframe(dff, height=220)
@@ -102,7 +116,6 @@ with modo[0]:
     if st.button("💾 Guardar reflexión", key="graf"):
         if nombre:
             save_response(nombre, "Gráficos", respuesta)
-            st.success("Respuesta guardada!")
         else:
             st.error("Debes ingresar tu nombre arriba antes de guardar.")
 
@@ -115,37 +128,88 @@ with modo[1]:
     df_var["ΔITCRM_%"] = df_var["ITCRM"].pct_change() * 100
 
     st.subheader("Tasas de variación")
-    fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(x=df_var["Fecha"], y=df_var["Inflacion_%"], name="Inflación %"))
-    fig2.add_trace(go.Scatter(x=df_var["Fecha"], y=df_var["ΔITCRM_%"], name="Δ ITCRM %"))
-    fig2.update_layout(template="plotly_white")
+    fig2 = figura(liviano)
+    fig2.add_trace(traza(df_var["Fecha"], df_var["Inflacion_%"], liviano, name="Inflación %"))
+    fig2.add_trace(traza(df_var["Fecha"], df_var["ΔITCRM_%"], liviano, name="Δ ITCRM %"))
     st.plotly_chart(fig2, use_container_width=True)
 
-    base = df_var.iloc[-1]
-    d_ipc = st.slider("Shock IPC var % (último mes)", -30.0, 30.0, 0.0, 0.5)
-    d_itcrm = st.slider("Shock ITCRM var % (último mes)", -30.0, 30.0, 0.0, 0.5)
-    ipc_new = base["Inflacion_%"] * (1 + d_ipc / 100)
-    it_new = base["ΔITCRM_%"] * (1 + d_itcrm / 100)
-
-    st.metric("Inflación ajustada", f"{ipc_new:.2f}%", f"{d_ipc:+.2f}%")
-    st.metric("Δ ITCRM ajustado", f"{it_new:.2f}%", f"{d_itcrm:+.2f}%")
+    # Simulador de economía abierta calibrado con las series de arriba
+    st.subheader("Simulador: devaluación, traspaso a precios y actividad")
+    cal = calibracion_abierta()
+    st.caption(f"Calibrado con {cal.observaciones} meses: traspaso de corto plazo β = {cal.beta:.2f}, "
+               f"inercia ρ = {cal.rho:.2f}, traspaso de largo plazo {cal.traspaso_largo_plazo:.2f}.")
+
+    c1, c2, c3 = st.columns(3)
+    devaluacion = c1.slider("Devaluación mensual del TCN (%)", 0.0, 20.0, 2.0, 0.5)
+    salto = c2.slider("Salto inicial del TCN (%)", 0.0, 100.0, 20.0, 5.0)
+    meses = c3.slider("Meses a proyectar", 6, 36, 12)
+    c4, c5, c6 = st.columns(3)
+    m_imp = c4.slider("Propensión marginal a importar (m)", 0.0, 0.5, 0.2, 0.05)
+    n_nx = c5.slider("Respuesta de las exportaciones netas al ITCRM (n)", 0.0, 1.0, 0.3, 0.05)
+    variable = c6.selectbox("Variable", ["Inflación %", "IPC", "TCN", "ITCRM", "PBI"])
+
+    proyeccion = escenarios_abiertos(devaluacion, salto, meses, m_imp, n_nx)
+    fig3 = figura(liviano, yaxis_title=variable)
+    for escenario, datos in proyeccion.groupby("Escenario", sort=False):
+        fig3.add_trace(traza(datos["Fecha"], datos[variable], liviano, name=escenario))
+    st.plotly_chart(fig3, use_container_width=True)
+    st.dataframe(proyeccion.groupby("Escenario", sort=False).last().drop(columns="Fecha").round(2))
 
     respuesta2 = st.text_area("💬 Tu reflexión sobre las variaciones:")
     if st.button("💾 Guardar reflexión", key="var"):
         if nombre:
             save_response(nombre, "Variaciones", respuesta2)
-            st.success("Respuesta guardada!")
         else:
             st.error("Debes ingresar tu nombre arriba antes de guardar.")
 
+# ------------------------------------------------------------
+# Pestaña 3 – Vista docente (consultas indexadas sobre las respuestas)
+# ------------------------------------------------------------
+with modo[2]:
+    if aviso_importacion:
+        st.warning(aviso_importacion)
+    if st.toggle("Mostrar análisis de respuestas", key="vista_docente"):
+        respuestas_guardadas = obtener_respuestas()
+        por_seccion = respuestas_guardadas.resumen("Seccion")
+        por_estudiante = respuestas_guardadas.resumen("Nombre")
+        k1, k2, k3 = st.columns(3)
+        k1.metric("Respuestas", f"{int(por_seccion['Respuestas'].sum()):,}")
+        k2.metric("Estudiantes", f"{len(por_estudiante):,}")
+        k3.metric("Secciones", len(por_seccion))
+
+        st.subheader("Por sección")
+        st.dataframe(por_seccion)
+
+        st.subheader("Envíos en el tiempo")
+        frecuencia = st.radio("Agrupar por", ["D", "h"], format_func={"D": "Día", "h": "Hora"}.get,
+                              horizontal=True)
+        st.bar_chart(respuestas_guardadas.actividad(frecuencia))
+
+        st.subheader("Por estudiante")
+        st.dataframe(por_estudiante, height=300)
+
+        st.subheader("Buscar en las respuestas")
+        texto = st.text_input("Palabras a buscar (también como prefijo: «infla» encuentra «inflación»)")
+        if texto.strip():
+            st.dataframe(respuestas_guardadas.buscar(texto), hide_index=True)
+
 # ------------------------------------------------------------
 # Barra lateral: Descargar todas las respuestas
 # ------------------------------------------------------------
 with st.sidebar:
     st.header("Respuestas")
-    if os.path.exists(CSV_PATH):
-        with open(CSV_PATH, "rb") as f:
-            st.download_button("⬇️ Descargar todas las respuestas (.csv)", data=f, file_name="respuestas.csv", mime="text/csv")
-        st.write("Las nuevas respuestas se agregarán automáticamente al archivo.")
-    else:
-        st.write("Aún no hay respuestas guardadas.")
+    # Nada se consulta ni se arma hasta que el docente abre la exportación;
+    # el archivo se genera recién al hacer clic en el botón.
+    if st.toggle("Exportar respuestas", key="exportar_respuestas"):
+        respuestas_guardadas = obtener_respuestas()
+        if respuestas_guardadas.cantidad():
+            nombres = st.multiselect("Nombre", respuestas_guardadas.valores("Nombre"), placeholder="Todos")
+            secciones = st.multiselect("Sección", respuestas_guardadas.valores("Seccion"), placeholder="Todas")
+            formato = st.radio("Formato", list(FORMATOS_EXPORTACION), horizontal=True)
+            archivo, mime = FORMATOS_EXPORTACION[formato]
+            st.download_button(f"⬇️ Descargar respuestas (.{formato})",
+                               data=lambda: archivo_exportado(respuestas_guardadas, formato,
+                                                              nombres or None, secciones or None),
+                               file_name=archivo, mime=mime)
+        else:
+            st.write("Aún no hay respuestas guardadas.")
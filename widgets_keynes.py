@@ -0,0 +1,182 @@
+"""Simuladores del cuaderno con actualizaciones diferidas y en el lugar.
+
+Con ipywidgets cada paso de un slider dispara el callback: arrastrarlo
+encolaba decenas de ``clear_output`` + figura nueva de Matplotlib, y el
+gráfico quedaba atrás de la mano. Acá hay dos piezas:
+
+* ``Diferido`` (debounce) y ``Limitado`` (throttle) envuelven el callback
+  para que sólo se dibuje el último valor: el primero espera a que el slider
+  se quede quieto, el segundo dibuja a lo sumo una vez por intervalo mientras
+  se arrastra (y siempre el valor final).
+* ``CruceWidget`` y ``FiltracionesWidget`` arman un ``go.FigureWidget`` una
+  sola vez; ``actualizar`` reemplaza los datos de cada traza dentro de
+  ``batch_update``, así el navegador recibe un único parche por cambio.
+
+El cálculo es el de ``escenarios.comparar``, igual que en ``graficos_keynes``.
+"""
+import asyncio
+import threading
+import time
+
+import plotly.graph_objects as go
+
+ESPERA = 0.15      # segundos sin cambios antes de dibujar (debounce)
+INTERVALO = 0.25   # mínimo entre dibujos mientras se arrastra (throttle)
+
+
+def _programar(espera: float, callback):
+    """Ejecuta ``callback`` dentro de ``espera`` segundos; devuelve algo con ``cancel()``.
+
+    En un kernel de Jupyter se usa su loop de asyncio, así el callback corre
+    en el hilo principal igual que los de ipywidgets.
+    """
+    try:
+        return asyncio.get_running_loop().call_later(espera, callback)
+    except RuntimeError:
+        temporizador = threading.Timer(espera, callback)
+        temporizador.daemon = True
+        temporizador.start()
+        return temporizador
+
+
+class Diferido:
+    """Debounce: llama a ``funcion`` con los últimos argumentos cuando pasan ``espera`` s sin llamadas."""
+
+    def __init__(self, funcion, espera: float = ESPERA):
+        self.funcion = funcion
+        self.espera = espera
+        self._pendiente = None
+        self._args = ((), {})
+
+    def __call__(self, *args, **kwargs):
+        self._args = (args, kwargs)
+        if self._pendiente is not None:
+            self._pendiente.cancel()
+        self._pendiente = _programar(self.espera, self._ejecutar)
+
+    def _ejecutar(self):
+        self._pendiente = None
+        args, kwargs = self._args
+        self.funcion(*args, **kwargs)
+
+
+class Limitado:
+    """Throttle: a lo sumo una llamada cada ``intervalo`` s; la última siempre se ejecuta."""
+
+    def __init__(self, funcion, intervalo: float = INTERVALO):
+        self.funcion = funcion
+        self.intervalo = intervalo
+        self._ultima = -float("inf")
+        self._pendiente = None
+        self._args = ((), {})
+
+    def __call__(self, *args, **kwargs):
+        self._args = (args, kwargs)
+        if self._pendiente is not None:
+            return
+        faltan = self._ultima + self.intervalo - time.monotonic()
+        if faltan <= 0:
+            self._ejecutar()
+        else:
+            self._pendiente = _programar(faltan, self._ejecutar)
+
+    def _ejecutar(self):
+        self._pendiente = None
+        self._ultima = time.monotonic()
+        args, kwargs = self._args
+        self.funcion(*args, **kwargs)
+
+
+def conectar(controles, actualizar, espera: float | None = ESPERA, intervalo: float | None = None):
+    """Observa ``value`` de cada widget con ``actualizar`` diferido o limitado.
+
+    Con ``intervalo`` se usa throttle (el gráfico sigue al slider); si no,
+    debounce con ``espera``. Devuelve el envoltorio, por si hay que llamarlo a mano.
+    """
+    envoltorio = Limitado(actualizar, intervalo) if intervalo else Diferido(actualizar, espera)
+    for w in controles:
+        w.observe(envoltorio, names='value')
+    return envoltorio
+
+
+def _flecha_dy() -> dict:
+    return dict(x=0, y=0, ax=0, ay=0, xref="x", yref="y", axref="x", ayref="y", text="",
+                showarrow=True, arrowhead=2, startarrowhead=2, arrowside="end+start",
+                arrowcolor="crimson", arrowwidth=2, font=dict(color="crimson"))
+
+
+def _mover_flecha(flecha, Y_base: float, Y_eq: float):
+    flecha.update(x=Y_eq, ax=Y_base, y=0, ay=0, text=f"ΔY = {Y_eq - Y_base:.1f}")
+
+
+class CruceWidget:
+    """Versión ``FigureWidget`` de ``graficos_keynes.GraficoComparado``."""
+
+    def __init__(self, titulo: str = "Modelo keynesiano: equilibrio y desplazamientos",
+                 etiquetas=("Línea 45°", "Z Base", "Z Nueva"), rotulos=("Y* Base", "Y* Nueva"),
+                 ylabel: str = "Demanda Agregada (Z)", figura=None):
+        self.rotulos = rotulos
+        self.fig = figura if figura is not None else go.FigureWidget()
+        self.fig.add_scatter(name=etiquetas[0], line=dict(dash="dash", color="gray"))
+        self.fig.add_scatter(name=etiquetas[1], line=dict(color="blue"))
+        self.fig.add_scatter(name=etiquetas[2], line=dict(color="green"))
+        for color in ("blue", "green", "purple"):
+            self.fig.add_scatter(mode="markers+text", marker=dict(color=color, size=9), textposition="bottom right",
+                                 textfont=dict(color=color), showlegend=False)
+        self.fig.update_layout(title=titulo, xaxis_title="Ingreso (Y)", yaxis_title=ylabel,
+                               width=800, height=530, annotations=[_flecha_dy()])
+
+    def actualizar(self, comp):
+        """Parchea los datos de cada traza con una ``escenarios.Comparacion``."""
+        Y_base, Y_eq, A = float(comp.eq_base.Y), float(comp.eq.Y), float(comp.eq.A)
+        Z_base, Z = comp.demanda()
+        linea_45, z_base, z, p_base, p, p_A = self.fig.data
+        with self.fig.batch_update():
+            linea_45.update(x=comp.Y, y=comp.Y)
+            z_base.update(x=comp.Y, y=Z_base)
+            z.update(x=comp.Y, y=Z)
+            p_base.update(x=[Y_base], y=[Y_base], text=[f"{self.rotulos[0]} = {Y_base:.1f}"])
+            p.update(x=[Y_eq], y=[Y_eq], text=[f"{self.rotulos[1]} = {Y_eq:.1f}"])
+            p_A.update(x=[0], y=[A], text=[f"A = {A:.1f}"])
+            _mover_flecha(self.fig.layout.annotations[0], Y_base, Y_eq)
+        return self.fig
+
+
+class FiltracionesWidget:
+    """Versión ``FigureWidget`` de ``graficos_keynes.GraficoFiltraciones``."""
+
+    def __init__(self, figura=None):
+        self.fig = figura if figura is not None else go.FigureWidget()
+        self.fig.add_scatter(name="Filtraciones Base", line=dict(dash="dash", color="blue"))
+        self.fig.add_scatter(name="Filtraciones Nueva", line=dict(color="orange"))
+        self.fig.add_scatter(name="Gastos Comp. Base", line=dict(dash="dash", color="gray"))
+        self.fig.add_scatter(name="Gastos Comp. Nuevo", line=dict(color="purple"))
+        self.fig.add_scatter(mode="lines+text", line=dict(dash="dash", color="black"), textposition="top right",
+                             showlegend=False)
+        self.fig.add_scatter(mode="lines+text", line=dict(dash="dot", color="red"), textposition="top right",
+                             textfont=dict(color="red"), showlegend=False)
+        self.fig.add_scatter(mode="markers+text", marker=dict(color="brown", size=9), textposition="top right",
+                             textfont=dict(color="brown"), showlegend=False)
+        self.fig.update_layout(title="Modelo de equilibrio: Filtraciones vs. Gastos Compensatorios",
+                               xaxis_title="Ingreso (Y)", yaxis_title="Filtraciones y Gastos Compensatorios",
+                               width=800, height=530, annotations=[_flecha_dy()])
+
+    def actualizar(self, comp):
+        """Parchea los datos de cada traza con una ``escenarios.Comparacion``."""
+        Y_base, Y_eq = float(comp.eq_base.Y), float(comp.eq.Y)
+        F_base, F = comp.filtraciones()
+        G_base, G_new = comp.gastos()
+        F0 = comp.ordenada_filtraciones()
+        extremos = [comp.Y[0], comp.Y[-1]]
+        bajo, alto = min(F_base.min(), F.min()), max(F_base.max(), F.max(), G_base, G_new)
+        f_base, f, g_base, g, v_base, v, p_F0 = self.fig.data
+        with self.fig.batch_update():
+            f_base.update(x=comp.Y, y=F_base)
+            f.update(x=comp.Y, y=F)
+            g_base.update(x=extremos, y=[G_base, G_base])
+            g.update(x=extremos, y=[G_new, G_new])
+            v_base.update(x=[Y_base, Y_base], y=[bajo, alto], text=["", f"Y₀* = {Y_base:.1f}"])
+            v.update(x=[Y_eq, Y_eq], y=[bajo, alto], text=["", f"Y* = {Y_eq:.1f}"])
+            p_F0.update(x=[0], y=[F0], text=[f"F(0) = {F0:.1f}"])
+            _mover_flecha(self.fig.layout.annotations[0], Y_base, Y_eq)
+        return self.fig